@@ -0,0 +1,154 @@
+# airspace.py
+"""
+Uniform-grid spatial index over flight positions.
+
+Positions are FlightStore ``x``/``y`` columns in nautical miles on a local
+plane (x east, y north). AirspaceGrid buckets every positioned slot into
+square cells of ``cell_nm`` and keeps them sorted by cell, so a query only
+looks at the cells a search disc overlaps instead of every flight:
+
+    grid.rebuild(store)                    # once per tick, O(n log n)
+    grid.within(x, y, 10.0)                # slots within 10 NM of a point
+    grid.neighbors(store, slot, 10.0)      # ... of a flight
+    grid.links(store, sources, targets, 10.0)  # (source, target) pairs in range
+    grid.conflicts(5.0, 1000.0)            # pairs inside separation minimums
+
+Every query is vectorized over all its query points at once; the cost grows
+with the number of flights in the visited cells, not with the fleet. Cells
+about the size of the usual query radius work best.
+"""
+
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from .flight_store import FlightStore
+
+# Radar separation minimums: 5 NM laterally unless 1000 ft apart vertically
+SEPARATION_NM = 5.0
+SEPARATION_FT = 1000.0
+
+# LinkTable kind linking both ways every pair of flights in conflict
+CONFLICT_LINK = "aircraft_conflict"
+
+
+def bearing(origin: Dict[str, float], destination: Dict[str, float]) -> float:
+    """Heading in degrees clockwise from north from one position to another."""
+    dx = destination["x"] - origin["x"]
+    dy = destination["y"] - origin["y"]
+    return float(np.degrees(np.arctan2(dx, dy)) % 360.0)
+
+
+def _cell_key(cx: np.ndarray, cy: np.ndarray) -> np.ndarray:
+    return (cx << np.int64(32)) + cy
+
+
+class AirspaceGrid:
+    """Cell-sorted copy of the positioned slots of a FlightStore."""
+
+    def __init__(self, cell_nm: float = 10.0):
+        if cell_nm <= 0:
+            raise ValueError(f"Grid cell size must be positive, got {cell_nm}")
+        self.cell_nm = cell_nm
+        empty = np.zeros(0)
+        self.slots = np.zeros(0, dtype=np.int64)  # indexed slots, by cell
+        self.x, self.y, self.altitude = empty, empty, empty
+        self._cells = np.zeros(0, dtype=np.int64)  # occupied cell keys, sorted
+        self._start = np.zeros(0, dtype=np.int64)
+        self._count = np.zeros(0, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+    def _cell(self, x, y) -> Tuple[np.ndarray, np.ndarray]:
+        cell = self.cell_nm
+        return (
+            np.floor(np.asarray(x) / cell).astype(np.int64),
+            np.floor(np.asarray(y) / cell).astype(np.int64),
+        )
+
+    def rebuild(self, store: FlightStore, slots: Optional[np.ndarray] = None):
+        """Indexes ``slots`` (every slot by default) that have a position."""
+        if slots is None:
+            slots = np.arange(store.n)
+        slots = np.asarray(slots, dtype=np.int64)
+        slots = slots[np.isfinite(store.x[slots]) & np.isfinite(store.y[slots])]
+        keys = _cell_key(*self._cell(store.x[slots], store.y[slots]))
+        order = np.argsort(keys, kind="stable")
+        self.slots = slots[order]
+        self.x = store.x[self.slots]
+        self.y = store.y[self.slots]
+        self.altitude = store.altitude[self.slots]
+        self._cells, self._start, self._count = np.unique(
+            keys[order], return_index=True, return_counts=True
+        )
+
+    def _query(self, x, y, radius: float) -> Tuple[np.ndarray, np.ndarray]:
+        """(query index, grid index) of every indexed point within ``radius``
+        of each query point (x[i], y[i]); points without a position match
+        nothing."""
+        x = np.atleast_1d(np.asarray(x, dtype=np.float64))
+        y = np.atleast_1d(np.asarray(y, dtype=np.float64))
+        located = np.flatnonzero(np.isfinite(x) & np.isfinite(y))
+        if len(self.slots) == 0 or len(located) == 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        x, y = x[located], y[located]
+        reach = int(np.ceil(radius / self.cell_nm))
+        offsets = np.arange(-reach, reach + 1)
+        dx, dy = (o.ravel() for o in np.meshgrid(offsets, offsets))
+        cx, cy = self._cell(x, y)
+        keys = _cell_key(cx[:, None] + dx, cy[:, None] + dy).ravel()
+        at = np.minimum(np.searchsorted(self._cells, keys), len(self._cells) - 1)
+        hit = self._cells[at] == keys
+        start = np.where(hit, self._start[at], 0)
+        count = np.where(hit, self._count[at], 0)
+        # Expand each (query, cell) into the cell's points
+        total = int(count.sum())
+        query = np.repeat(np.arange(len(keys)) // len(dx), count)
+        first = np.cumsum(count) - count
+        point = np.repeat(start - first, count) + np.arange(total)
+        close = (self.x[point] - x[query]) ** 2 + (
+            self.y[point] - y[query]
+        ) ** 2 <= radius**2
+        return located[query[close]], point[close]
+
+    def within(self, x: float, y: float, radius: float) -> np.ndarray:
+        """Slots within ``radius`` NM of (x, y)."""
+        _, point = self._query(x, y, radius)
+        return np.sort(self.slots[point])
+
+    def neighbors(self, store: FlightStore, slot: int, radius: float) -> np.ndarray:
+        """Other slots within ``radius`` NM of ``slot``'s position."""
+        found = self.within(store.x[slot], store.y[slot], radius)
+        return found[found != slot]
+
+    def links(
+        self,
+        store: FlightStore,
+        sources: np.ndarray,
+        targets: np.ndarray,
+        radius: float,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """(source, target) slot pairs within ``radius`` NM, for LinkTable.add;
+        sources in the order given, each source's targets by slot."""
+        sources = np.asarray(sources, dtype=np.int64)
+        query, point = self._query(store.x[sources], store.y[sources], radius)
+        src, dst = sources[query], self.slots[point]
+        keep = np.isin(dst, targets) & (src != dst)
+        src, dst = src[keep], dst[keep]
+        order = np.lexsort((dst, query[keep]))
+        return src[order], dst[order]
+
+    def conflicts(
+        self, separation_nm: float = SEPARATION_NM, vertical_ft: float = SEPARATION_FT
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Slot pairs (a < b) closer than ``separation_nm`` laterally and
+        ``vertical_ft`` vertically."""
+        query, point = self._query(self.x, self.y, separation_nm)
+        keep = (query < point) & (
+            np.abs(self.altitude[query] - self.altitude[point]) < vertical_ft
+        )
+        a, b = self.slots[query[keep]], self.slots[point[keep]]
+        a, b = np.minimum(a, b), np.maximum(a, b)
+        order = np.lexsort((b, a))
+        return a[order], b[order]
@@ -2,6 +2,15 @@
 
 import json
 
+from .synchronization import render_diagnostics
+
+
+def _diagnostic_notes(sync_data):
+    # Compact sync dicts carry a bitmask; render text only here, at report time
+    if "diagnostic_flags" in sync_data:
+        return render_diagnostics(sync_data["diagnostic_flags"])
+    return sync_data.get("diagnostics", [])
+
 
 def write_markdown_log(
     filepath,
@@ -67,9 +76,10 @@ def write_markdown_log(
                 f"| {timestamps[i]} | {gains[i]:+.2f}% | {fuel[i]:.1f}% | {'Yes' if stalls[i] else 'No'} | {turbulence[i]} | {flight_phases[i]:8} | {status:7} | {sc:>7} | {regime:<15} |\n"
             )
 
-        if sync_data and sync_data.get("diagnostics"):
+        notes = _diagnostic_notes(sync_data) if sync_data else []
+        if notes:
             f.write("\n### Synchronization Diagnostics\n\n")
-            for note in sync_data["diagnostics"]:
+            for note in notes:
                 f.write(f"- {note}\n")
 
 
@@ -141,8 +151,12 @@ def write_json_log(
                 "reflexive_cascade_risk": sync_data.get("reflexive_cascade_risk", 0.0),
             }
             log.update(summary_fields)
-            if sync_data.get("diagnostics"):
+            if "diagnostic_flags" in sync_data:
+                log["diagnostic_flags"] = sync_data["diagnostic_flags"]
+            elif sync_data.get("diagnostics"):
                 log["diagnostics"] = sync_data["diagnostics"]
+            if sync_data.get("flock_telemetry"):
+                log["flock_telemetry"] = sync_data["flock_telemetry"]
         elif isinstance(sync_data, list):
             log["synchronization"] = sync_data
 
@@ -1,14 +1,35 @@
 import argparse
 import json
 import os
+import sys
+import time
 import matplotlib.pyplot as plt
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from core.tick_exporter import TickReader
+
 # --- Chart Creator for FlightOpsCore Telemetry ---
 def load_log(log_path):
     with open(log_path, 'r', encoding='utf-8') as f:
         data = json.load(f)
     return data
 
+def merge_tick_rows(flights, rows):
+    # Append TickExporter rows to per-flight telemetry, keyed by flight id
+    updated = set()
+    for row in rows:
+        flight = flights.setdefault(row['id'], {'id': row['id'], 'telemetry': []})
+        flight['telemetry'].append({
+            'tick': row['tick'],
+            'altitude': row.get('altitude'),
+            'velocity': row.get('velocity'),
+            'price': row.get('price'),
+            'phase': row.get('phase'),
+            'status_flags': {'stall': row.get('stall', False)},
+        })
+        updated.add(row['id'])
+    return updated
+
 def plot_flight_telemetry(flight, out_dir):
     telemetry = flight.get('telemetry', [])
     if not telemetry:
@@ -53,11 +74,29 @@ def plot_flight_telemetry(flight, out_dir):
 
 def main():
     parser = argparse.ArgumentParser(description="Create charts from FlightOpsCore telemetry logs.")
-    parser.add_argument('--log', type=str, required=True, help='Path to the JSON log file.')
+    parser.add_argument('--log', type=str, help='Path to the JSON log file.')
+    parser.add_argument('--ticks', type=str, help='Path to a TickExporter file (.ndjson or .npy).')
+    parser.add_argument('--follow', action='store_true', help='Keep reading --ticks and re-plot flights as rows arrive.')
+    parser.add_argument('--interval', type=float, default=2.0, help='Seconds between reads with --follow.')
     parser.add_argument('--out', type=str, default='modular/logs/', help='Output directory for charts.')
     args = parser.parse_args()
+    if not args.log and not args.ticks:
+        parser.error('one of --log or --ticks is required')
 
     os.makedirs(args.out, exist_ok=True)
+    if args.ticks:
+        reader = TickReader(args.ticks)
+        flights = {}
+        try:
+            while True:
+                for flight_id in sorted(merge_tick_rows(flights, reader.poll())):
+                    plot_flight_telemetry(flights[flight_id], args.out)
+                if not args.follow:
+                    break
+                time.sleep(args.interval)
+        except KeyboardInterrupt:
+            pass
+        return
     data = load_log(args.log)
     # Expecting a list of flights or a dict with 'flights' key
     flights = data if isinstance(data, list) else data.get('flights', [])
@@ -0,0 +1,304 @@
+# checkpoint.py
+"""
+Binary checkpoints of FlightOpsCore state.
+
+capture() turns a core into a flat dict of NumPy arrays; save() writes it as
+an .npz archive (zip-deflated with ``compress=True``) and load() reads it back
+without unpickling anything. restore() builds a new FlightOpsCore that
+continues exactly where the captured one stopped: the next update() of the
+restored core produces the same state, telemetry, sync results, flock
+summaries and trigger events as the original's.
+
+Captured: FlightStore columns and per-slot fields, phase names and mode
+indexes, the telemetry ring, SimRandom (seed, stream mode, generator state),
+trigger links, log and fire count, the sync TrackerBank (rolling windows
+with their running sums), the flock rollup and history, the timestep
+and the config. Shared SynchronizationResult objects stay shared, which keeps
+FlockRollup's running sums bit-identical.
+
+Trigger rules are code, so only their names are captured: restore() takes
+the rules to run (the default rules unless given) and refuses a checkpoint
+whose rule names, in order, differ from them.
+
+Not captured: bus subscribers (the restored core has none), the
+SyncCache (entries are a pure function of their keys, so a cold cache gives
+the same results) and the airspace grid (rebuilt from positions).
+
+Structured values go in a JSON header (the ``meta`` entry) carrying
+CHECKPOINT_VERSION; load() refuses other formats and versions.
+"""
+
+import json
+from collections import deque
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from .crow_simulator import FleetFlockSummary
+from .flight_ops_core import NEUTRAL_SYNC, FlightOpsCore
+from .flight_store import COLUMNS, MODES
+from .sim_random import SimRandom
+from .sync_tracker import TrackerBank
+from .synchronization import SynchronizationResult
+from .telemetry_ring import TelemetryRing
+from .triggers import TriggerEvent, TriggerRule
+
+CHECKPOINT_FORMAT = "FlightOpsCore"
+CHECKPOINT_VERSION = 2  # 2: sync trackers as TrackerBank rows
+
+_WINDOW_PARTS = ("values", "count", "head", "total", "total_sq")
+_LINK_PARTS = ("src", "dst", "auto")
+
+
+class _SyncTable:
+    """SynchronizationResults by identity; row 0 is NEUTRAL_SYNC, -1 is None."""
+
+    def __init__(self):
+        self.rows = [NEUTRAL_SYNC]
+        self._refs = {id(NEUTRAL_SYNC): 0}
+
+    def ref(self, sync: Optional[SynchronizationResult]) -> int:
+        if sync is None:
+            return -1
+        key = id(sync)
+        ref = self._refs.get(key)
+        if ref is None:
+            ref = self._refs[key] = len(self.rows)
+            self.rows.append(sync)
+        return ref
+
+    def arrays(self) -> Dict[str, np.ndarray]:
+        columns = zip(*self.rows)
+        return {
+            f"sync/{name}": np.array(values)
+            for name, values in zip(SynchronizationResult._fields, columns)
+        }
+
+
+def _sync_rows(arrays: Dict[str, np.ndarray]) -> List[SynchronizationResult]:
+    columns = [
+        arrays[f"sync/{name}"].tolist() for name in SynchronizationResult._fields
+    ]
+    rows = list(zip(*columns))[1:]
+    return [NEUTRAL_SYNC] + [SynchronizationResult(*row) for row in rows]
+
+
+def capture(core: FlightOpsCore) -> Dict[str, np.ndarray]:
+    """Snapshot of ``core`` as named arrays (copies; the core can run on)."""
+    store, ring = core.store, core.store.telemetry
+    n = store.n
+    syncs = _SyncTable()
+    arrays: Dict[str, np.ndarray] = {}
+    # --- Store ---
+    for name in COLUMNS:
+        arrays[f"store/{name}"] = store.column(name).copy()
+    for mode in MODES:
+        arrays[f"store/slots/{mode}"] = store.slots(mode).copy()
+    arrays["store/sync"] = np.array([syncs.ref(s) for s in store.sync], np.int64)
+    # --- Telemetry ---
+    arrays["telemetry/data"] = ring.data[:, :n].copy()
+    arrays["telemetry/row_tick"] = ring.row_tick.copy()
+    arrays["telemetry/count"] = ring.count[:n].copy()
+    # --- Trigger links ---
+    for kind, parts in core.triggers.links.export_state().items():
+        for part, values in zip(_LINK_PARTS, parts):
+            arrays[f"links/{kind}/{part}"] = values
+    # --- Sync tracker bank (rows follow store slots) ---
+    bank = core.sync_bank
+    rows = min(n, bank.capacity)
+    for name in TrackerBank.SCALARS:
+        arrays[f"bank/{name}"] = getattr(bank, name)[:rows].copy()
+    for name in TrackerBank.WINDOWS:
+        window = getattr(bank, name)
+        for part in _WINDOW_PARTS:
+            arrays[f"bank/{name}/{part}"] = getattr(window, part)[:rows].copy()
+    arrays["bank/last_result"] = np.array(
+        [syncs.ref(r) for r in bank.last_result[:rows]], np.int64
+    )
+    # --- Flock ---
+    flock = core.flock.export_state()
+    members = flock.pop("members")
+    arrays["flock/members"] = np.array(
+        [syncs.ref(s) for s in members.values()], np.int64
+    )
+    arrays["flock/history"] = np.array(
+        [tuple(s) for s in core.flock_history], np.float64
+    ).reshape(-1, len(FleetFlockSummary._fields))
+    arrays["flock/state"] = np.array(tuple(core.flock_state), np.float64)
+    arrays.update(syncs.arrays())
+    # --- Everything that is not an array ---
+    log = core.triggers.log
+    templates = list(dict.fromkeys(e.template for e in log))
+    template_index = {t: i for i, t in enumerate(templates)}
+    random = core.random
+    meta = {
+        "format": CHECKPOINT_FORMAT,
+        "version": CHECKPOINT_VERSION,
+        "config": core.config,
+        "timestep": core.timestep,
+        "roster_changed": core._roster_changed,
+        "store": {
+            "ids": store.ids,
+            "symbols": store.symbols,
+            "origins": store.origins,
+            "destinations": store.destinations,
+            "phase_names": store.phase_names,
+        },
+        "telemetry": {"depth": ring.depth, "appends": ring.appends},
+        "random": {
+            "seed": random.seed,
+            "mode": random.mode,
+            "generator": random.generator.bit_generator.state,
+        },
+        "triggers": {
+            "rules": list(core.triggers.rules),
+            "fired": core.triggers.fired,
+            "templates": templates,
+            "log": [
+                [e.tick, e.rule, e.source, e.target, template_index[e.template]]
+                for e in log
+            ],
+        },
+        "bank": {"window": bank.window, "release_bars": bank.release_bars},
+        "flock": {"members": list(members), **flock},
+    }
+    try:
+        header = json.dumps(meta)
+    except TypeError as e:
+        raise ValueError(f"Checkpoint config must be JSON-serializable: {e}") from e
+    arrays["meta"] = np.frombuffer(header.encode("utf-8"), dtype=np.uint8)
+    return arrays
+
+
+def restore(
+    arrays: Dict[str, np.ndarray],
+    config: Optional[Dict] = None,
+    rules: Optional[Iterable[TriggerRule]] = None,
+) -> FlightOpsCore:
+    """A new FlightOpsCore continuing the captured run.
+
+    ``config`` entries override the captured config for settings that are
+    not state (sync cache, event batch size, ...). Overriding ``seed`` or
+    ``rng_streams`` starts fresh random streams instead of resuming the
+    captured ones, for what-if forks of one warm state.
+
+    ``rules`` replaces the default trigger rules and must match the captured
+    rule names in order; ValueError otherwise.
+    """
+    meta = json.loads(bytes(arrays["meta"]).decode("utf-8"))
+    if meta.get("format") != CHECKPOINT_FORMAT:
+        raise ValueError("Not a FlightOpsCore checkpoint")
+    if meta.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(f"Unsupported checkpoint version: {meta.get('version')}")
+    overrides = config or {}
+    core = FlightOpsCore({**meta["config"], **overrides})
+    core.timestep = meta["timestep"]
+    if rules is not None:
+        core.triggers.rules = {}
+        for rule in rules:
+            core.triggers.register(rule)
+    saved_rules = meta["triggers"]["rules"]
+    if list(core.triggers.rules) != saved_rules:
+        raise ValueError(
+            f"Checkpoint has trigger rules {saved_rules}, restoring with "
+            f"{list(core.triggers.rules)}; pass the captured core's rules"
+        )
+    syncs = _sync_rows(arrays)
+    # --- Store and telemetry ---
+    store = core.store
+    for name in meta["store"]["phase_names"]:
+        store.phase_code(name)
+    telemetry = meta["telemetry"]
+    store.telemetry = TelemetryRing(telemetry["depth"], 0)
+    store.load_slots(
+        {name: arrays[f"store/{name}"] for name in COLUMNS},
+        meta["store"]["ids"],
+        meta["store"]["symbols"],
+        meta["store"]["origins"],
+        meta["store"]["destinations"],
+        [syncs[ref] for ref in arrays["store/sync"].tolist()],
+        [arrays[f"store/slots/{mode}"] for mode in MODES],
+    )
+    ring, n = store.telemetry, store.n
+    ring.data[:, :n] = arrays["telemetry/data"]
+    # Mirrored (2 * depth) ring layouts repeat their first half
+    ring.row_tick[:] = arrays["telemetry/row_tick"][: ring.depth]
+    ring.count[:n] = arrays["telemetry/count"]
+    ring.appends = telemetry["appends"]
+    # --- Random streams ---
+    random = meta["random"]
+    if "seed" not in overrides and "rng_streams" not in overrides:
+        core.random = SimRandom(random["seed"], random["mode"])
+        core.random.generator.bit_generator.state = random["generator"]
+    # --- Triggers ---
+    triggers = meta["triggers"]
+    kinds = [
+        key[len("links/") : -len("/src")]
+        for key in arrays
+        if key.startswith("links/") and key.endswith("/src")
+    ]
+    core.triggers.links.load_state(
+        {
+            kind: tuple(arrays[f"links/{kind}/{part}"] for part in _LINK_PARTS)
+            for kind in kinds
+        }
+    )
+    templates = triggers["templates"]
+    core.triggers.log.extend(
+        TriggerEvent(tick, rule, source, target, templates[template])
+        for tick, rule, source, target, template in triggers["log"]
+    )
+    core.triggers.fired = triggers["fired"]
+    core._roster_changed = meta["roster_changed"]
+    # --- Sync tracker bank ---
+    bank = core.sync_bank = TrackerBank(cache=core.sync_cache, **meta["bank"])
+    rows = len(arrays["bank/bars"])
+    bank.resize(rows)
+    for name in TrackerBank.SCALARS:
+        getattr(bank, name)[:rows] = arrays[f"bank/{name}"]
+    for name in TrackerBank.WINDOWS:
+        window = getattr(bank, name)
+        values = arrays[f"bank/{name}/values"]
+        # Unbounded windows may have grown past the default width
+        window.values = np.zeros((bank.capacity,) + values.shape[1:])
+        for part in _WINDOW_PARTS:
+            getattr(window, part)[:rows] = arrays[f"bank/{name}/{part}"]
+    for row, ref in enumerate(arrays["bank/last_result"].tolist()):
+        bank.last_result[row] = None if ref < 0 else syncs[ref]
+    # --- Flock ---
+    saved = dict(meta["flock"])
+    members = zip(
+        saved.pop("members"), (syncs[r] for r in arrays["flock/members"].tolist())
+    )
+    core.flock.load_state(dict(members), **saved)
+    core.flock_history = deque(
+        (_flock_summary(row) for row in arrays["flock/history"].tolist()),
+        maxlen=core.flock_history.maxlen,
+    )
+    core.flock_state = _flock_summary(arrays["flock/state"].tolist())
+    return core
+
+
+def _flock_summary(row: List[float]) -> FleetFlockSummary:
+    tick, flights, type_ii, type_iii, pressure, alerts = row
+    return FleetFlockSummary(
+        int(tick), int(flights), type_ii, type_iii, pressure, int(alerts)
+    )
+
+
+def save(core: FlightOpsCore, path: str, compress: bool = False):
+    """Writes capture(core) to ``path`` (an .npz archive)."""
+    arrays = capture(core)
+    with open(path, "wb") as f:
+        (np.savez_compressed if compress else np.savez)(f, **arrays)
+
+
+def load(
+    path: str,
+    config: Optional[Dict] = None,
+    rules: Optional[Iterable[TriggerRule]] = None,
+) -> FlightOpsCore:
+    """restore() from a file written by save()."""
+    with np.load(path, allow_pickle=False) as archive:
+        arrays = {name: archive[name] for name in archive.files}
+    return restore(arrays, config, rules)
@@ -1,12 +1,18 @@
-from dataclasses import dataclass, field
-from typing import List, Optional, Dict
+from dataclasses import dataclass
+from typing import List, NamedTuple, Optional, Dict, Tuple
+
+import numpy as np
 
 from .synchronization import (
     compute_synchronization,
+    SynchronizationBatch,
     SynchronizationResult,
     RegimeLabel,
+    EXECUTION_TYPES,
     EXECUTION_TYPE_LABELS,
     ExecutionType,
+    REGIME_LABELS,
+    render_diagnostics,
 )
 
 
@@ -22,9 +28,30 @@ FLOCK_EXECUTION_MAP = {
     ExecutionType.TYPE_III: FlockExecutionType.PANIC_CASCADE,
 }
 
+# Lookup tables: execution type value -> flock type, and flock type codes that
+# share the execution type codes of SynchronizationBatch
+FLOCK_TYPE_BY_EXECUTION = {et.value: FLOCK_EXECUTION_MAP[et] for et in ExecutionType}
+FLOCK_TYPES = tuple(FLOCK_EXECUTION_MAP[et] for et in EXECUTION_TYPES)
 
-@dataclass
-class CrowFlockState:
+
+class FlockDiagnostic:
+    SCOUT_ALERT = 1 << 0
+    SCATTERED = 1 << 1
+    PARTIAL_ALIGNMENT = 1 << 2
+    SYNCHRONIZED = 1 << 3
+    ROOST_PRESSURE_HIGH = 1 << 4
+
+
+FLOCK_DIAGNOSTIC_TEXT = {
+    FlockDiagnostic.SCOUT_ALERT: "Scout crow detected disturbance — flock may align.",
+    FlockDiagnostic.SCATTERED: "Flock is scattered foraging — no collective behavior.",
+    FlockDiagnostic.PARTIAL_ALIGNMENT: "Flock showing partial alignment — potential coordinated movement.",
+    FlockDiagnostic.SYNCHRONIZED: "Flock in synchronized state — collective takeoff or landing imminent.",
+    FlockDiagnostic.ROOST_PRESSURE_HIGH: "Roost pressure high — flock ready to disperse on next signal.",
+}
+
+
+class CrowFlockState(NamedTuple):
     flock_synchronization: float = 0.0
     scout_alert_active: bool = False
     collective_takeoff_risk: float = 0.0
@@ -33,10 +60,24 @@ class CrowFlockState:
     disturbance_proximity: float = float("inf")
     flock_execution_type: str = FlockExecutionType.SCATTERED_FORAGING
     regime_label: str = RegimeLabel.STABLE_CRUISE.value
-    diagnostics: List[str] = field(default_factory=list)
+    diagnostic_flags: int = 0
 
-    def to_dict(self) -> Dict:
-        return {
+    @property
+    def diagnostics(self) -> List[str]:
+        return render_diagnostics(self.diagnostic_flags, FLOCK_DIAGNOSTIC_TEXT)
+
+    def to_record(self) -> Tuple:
+        return self
+
+    def to_dict(self, compact: bool = False, fast: bool = False) -> Dict:
+        if fast:
+            out = self._asdict()
+            if not compact:
+                out["diagnostics"] = render_diagnostics(
+                    out.pop("diagnostic_flags"), FLOCK_DIAGNOSTIC_TEXT
+                )
+            return out
+        out = {
             "flock_synchronization": round(self.flock_synchronization, 4),
             "scout_alert_active": self.scout_alert_active,
             "collective_takeoff_risk": round(self.collective_takeoff_risk, 4),
@@ -45,8 +86,12 @@ class CrowFlockState:
             "disturbance_proximity": round(self.disturbance_proximity, 4),
             "flock_execution_type": self.flock_execution_type,
             "regime_label": self.regime_label,
-            "diagnostics": self.diagnostics,
         }
+        if compact:
+            out["diagnostic_flags"] = self.diagnostic_flags
+        else:
+            out["diagnostics"] = self.diagnostics
+        return out
 
 
 def compute_flock_state(market_sync: SynchronizationResult) -> CrowFlockState:
@@ -67,13 +112,9 @@ def compute_flock_state(market_sync: SynchronizationResult) -> CrowFlockState:
 
     landing_convergence = max(0.0, 1.0 - queue_pressure)
 
-    market_exec_type = market_sync.execution_type
-    for et in ExecutionType:
-        if et.value == market_exec_type:
-            flock_type = FLOCK_EXECUTION_MAP[et]
-            break
-    else:
-        flock_type = FlockExecutionType.SCATTERED_FORAGING
+    flock_type = FLOCK_TYPE_BY_EXECUTION.get(
+        market_sync.execution_type, FlockExecutionType.SCATTERED_FORAGING
+    )
 
     dist_prox = float("inf")
     if not scout_active:
@@ -85,7 +126,9 @@ def compute_flock_state(market_sync: SynchronizationResult) -> CrowFlockState:
     else:
         dist_prox = 2.0
 
-    diagnostics = _crow_diagnostics(flock_sync, scout_active, regime, roost_pressure)
+    diagnostic_flags = _crow_diagnostic_flags(
+        flock_sync, scout_active, regime, roost_pressure
+    )
 
     return CrowFlockState(
         flock_synchronization=flock_sync,
@@ -96,29 +139,198 @@ def compute_flock_state(market_sync: SynchronizationResult) -> CrowFlockState:
         disturbance_proximity=dist_prox,
         flock_execution_type=flock_type,
         regime_label=regime,
-        diagnostics=diagnostics,
+        diagnostic_flags=diagnostic_flags,
     )
 
 
-def _crow_diagnostics(
+def _crow_diagnostic_flags(
     flock_sync: float,
     scout_alert: bool,
     regime: str,
     roost_pressure: float,
-) -> List[str]:
-    notes = []
+) -> int:
+    flags = 0
     if scout_alert:
-        notes.append("Scout crow detected disturbance — flock may align.")
+        flags |= FlockDiagnostic.SCOUT_ALERT
     if flock_sync < 0.3:
-        notes.append("Flock is scattered foraging — no collective behavior.")
+        flags |= FlockDiagnostic.SCATTERED
     elif flock_sync < 0.65:
-        notes.append(
-            "Flock showing partial alignment — potential coordinated movement."
-        )
+        flags |= FlockDiagnostic.PARTIAL_ALIGNMENT
     else:
-        notes.append(
-            "Flock in synchronized state — collective takeoff or landing imminent."
-        )
+        flags |= FlockDiagnostic.SYNCHRONIZED
     if roost_pressure > 0.7:
-        notes.append("Roost pressure high — flock ready to disperse on next signal.")
-    return notes
+        flags |= FlockDiagnostic.ROOST_PRESSURE_HIGH
+    return flags
+
+
+@dataclass
+class CrowFlockBatch:
+    """Columnar CrowFlockState for many steps or flights."""
+
+    flock_synchronization: np.ndarray
+    scout_alert_active: np.ndarray
+    collective_takeoff_risk: np.ndarray
+    landing_convergence_score: np.ndarray
+    roost_pressure: np.ndarray
+    disturbance_proximity: np.ndarray
+    flock_type_code: np.ndarray  # int8 index into FLOCK_TYPES
+    regime_code: np.ndarray  # int8 index into REGIME_LABELS
+    diagnostic_flags: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.flock_synchronization)
+
+    def __iter__(self):
+        return (self.result(i) for i in range(len(self)))
+
+    def result(self, i: int) -> CrowFlockState:
+        return CrowFlockState(
+            flock_synchronization=float(self.flock_synchronization[i]),
+            scout_alert_active=bool(self.scout_alert_active[i]),
+            collective_takeoff_risk=float(self.collective_takeoff_risk[i]),
+            landing_convergence_score=float(self.landing_convergence_score[i]),
+            roost_pressure=float(self.roost_pressure[i]),
+            disturbance_proximity=float(self.disturbance_proximity[i]),
+            flock_execution_type=FLOCK_TYPES[self.flock_type_code[i]],
+            regime_label=REGIME_LABELS[self.regime_code[i]].value,
+            diagnostic_flags=int(self.diagnostic_flags[i]),
+        )
+
+    def to_dicts(self, compact: bool = False) -> List[Dict]:
+        return [r.to_dict(compact) for r in self]
+
+
+def compute_flock_state_batch(market_sync: SynchronizationBatch) -> CrowFlockBatch:
+    """compute_flock_state over a SynchronizationBatch, column by column."""
+    sc = market_sync.synchronization_coefficient
+    queue_pressure = market_sync.queue_pressure
+    cascade_risk = market_sync.reflexive_cascade_risk
+    scout_active = market_sync.event_authorized
+
+    collective_takeoff_risk = np.where(
+        cascade_risk > 0.5, np.minimum(1.0, cascade_risk * 1.1), sc * 0.5
+    )
+    landing_convergence = np.maximum(0.0, 1.0 - queue_pressure)
+    dist_prox = np.where(
+        scout_active, np.select([sc < 0.3, sc < 0.65], [30.0, 10.0], 2.0), np.inf
+    )
+
+    flags = np.where(scout_active, FlockDiagnostic.SCOUT_ALERT, 0)
+    flags |= np.select(
+        [sc < 0.3, sc < 0.65],
+        [FlockDiagnostic.SCATTERED, FlockDiagnostic.PARTIAL_ALIGNMENT],
+        FlockDiagnostic.SYNCHRONIZED,
+    )
+    flags |= np.where(queue_pressure > 0.7, FlockDiagnostic.ROOST_PRESSURE_HIGH, 0)
+
+    return CrowFlockBatch(
+        flock_synchronization=sc,
+        scout_alert_active=scout_active,
+        collective_takeoff_risk=collective_takeoff_risk,
+        landing_convergence_score=landing_convergence,
+        roost_pressure=queue_pressure,
+        disturbance_proximity=dist_prox,
+        flock_type_code=market_sync.execution_type_code,
+        regime_code=market_sync.regime_code,
+        diagnostic_flags=flags.astype(np.int64),
+    )
+
+
+class FleetFlockSummary(NamedTuple):
+    tick: int = 0
+    flights: int = 0
+    type_ii_fraction: float = 0.0
+    type_iii_fraction: float = 0.0
+    mean_roost_pressure: float = 0.0
+    scout_alerts: int = 0
+
+    def to_dict(self) -> Dict:
+        return {
+            "tick": self.tick,
+            "flights": self.flights,
+            "type_ii_fraction": round(self.type_ii_fraction, 4),
+            "type_iii_fraction": round(self.type_iii_fraction, 4),
+            "mean_roost_pressure": round(self.mean_roost_pressure, 4),
+            "scout_alerts": self.scout_alerts,
+        }
+
+
+class FlockRollup:
+    """Fleet-wide flock view over many market flights, kept as running totals.
+
+    Each flight contributes (Type II, Type III, roost pressure, scout alert)
+    from its latest SynchronizationResult; replace() swaps one flight's
+    contribution in O(1), so a tick costs O(flights whose sync changed).
+    """
+
+    def __init__(self):
+        self._members: Dict[str, SynchronizationResult] = {}
+        self.type_ii = 0
+        self.type_iii = 0
+        self.scout_alerts = 0
+        self.roost_pressure_sum = 0.0
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def _apply(self, sync: SynchronizationResult, sign: int):
+        self.type_ii += sign * (sync.execution_type == ExecutionType.TYPE_II.value)
+        self.type_iii += sign * (sync.execution_type == ExecutionType.TYPE_III.value)
+        self.scout_alerts += sign * bool(sync.event_authorized)
+        self.roost_pressure_sum += sign * sync.queue_pressure
+
+    def replace(self, flight_id: str, sync: SynchronizationResult):
+        old = self._members.get(flight_id)
+        if old is sync:
+            return
+        if old is not None:
+            self._apply(old, -1)
+        self._members[flight_id] = sync
+        self._apply(sync, +1)
+
+    def export_state(self) -> Dict:
+        """Members (flight id -> sync, in insertion order) and running totals,
+        for load_state()."""
+        return {
+            "members": dict(self._members),
+            "type_ii": self.type_ii,
+            "type_iii": self.type_iii,
+            "scout_alerts": self.scout_alerts,
+            "roost_pressure_sum": self.roost_pressure_sum,
+        }
+
+    def load_state(
+        self,
+        members: Dict[str, SynchronizationResult],
+        type_ii: int,
+        type_iii: int,
+        scout_alerts: int,
+        roost_pressure_sum: float,
+    ):
+        """Replaces the rollup with export_state() output. The totals are taken
+        as given rather than re-summed, so their rounding carries over."""
+        self._members = dict(members)
+        self.type_ii, self.type_iii = type_ii, type_iii
+        self.scout_alerts = scout_alerts
+        self.roost_pressure_sum = roost_pressure_sum
+
+    def remove(self, flight_id: str):
+        old = self._members.pop(flight_id, None)
+        if old is not None:
+            self._apply(old, -1)
+        if not self._members:
+            # Clears accumulated rounding in the pressure sum
+            self.roost_pressure_sum = 0.0
+
+    def summary(self, tick: int = 0) -> FleetFlockSummary:
+        n = len(self._members)
+        if n == 0:
+            return FleetFlockSummary(tick=tick)
+        return FleetFlockSummary(
+            tick=tick,
+            flights=n,
+            type_ii_fraction=self.type_ii / n,
+            type_iii_fraction=self.type_iii / n,
+            mean_roost_pressure=max(0.0, self.roost_pressure_sum / n),
+            scout_alerts=self.scout_alerts,
+        )
@@ -0,0 +1,209 @@
+# cvd_meter.py
+"""
+Cumulative volume delta (CVD) for the synchronization layer.
+
+Signed volume comes from trade prints (tick rule) or, when only OHLCV bars are
+available, from the bar's close location within its range. CVDMeter is a
+streaming calculator: each update takes a batch of prints or bars, carries its
+state across calls, and returns per-step arrays of CVD, acceleration and the
+trend-strength flags consumed by compute_synchronization.
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+
+# Largest weight growth allowed inside one EMA block before rebasing (precision)
+_EMA_BLOCK_GROWTH = 1e6
+
+
+def _ema(x: np.ndarray, alpha: float, initial: float) -> np.ndarray:
+    """EMA of ``x`` seeded with ``initial``, computed blockwise without a Python
+    loop per element: within a block y_t = a^(t+1) y0 + alpha a^t sum(a^-j x_j).
+    """
+    out = np.empty(len(x))
+    decay = 1.0 - alpha
+    if decay <= 0.0:
+        out[:] = x
+        return out
+    block = max(1, int(np.log(_EMA_BLOCK_GROWTH) / -np.log(decay)))
+    powers = decay ** np.arange(block + 1)
+    inverse = 1.0 / powers[:block]
+    level = initial
+    for start in range(0, len(x), block):
+        chunk = x[start : start + block]
+        n = len(chunk)
+        acc = np.cumsum(chunk * inverse[:n])
+        seg = powers[1 : n + 1] * level + alpha * powers[:n] * acc
+        out[start : start + n] = seg
+        level = seg[-1]
+    return out
+
+
+def tick_rule_signs(
+    prices: np.ndarray, prev_price: float = np.nan, prev_sign: float = 0.0
+) -> Tuple[np.ndarray, float]:
+    """Trade direction by the tick rule: up-tick +1, down-tick -1, and zero-ticks
+    inherit the previous direction. Returns (signs, last_sign)."""
+    prices = np.asarray(prices, dtype=float)
+    if len(prices) == 0:
+        return np.zeros(0), prev_sign
+    prior = np.concatenate(([prev_price], prices[:-1]))
+    signs = np.sign(prices - prior)
+    signs[np.isnan(signs)] = 0.0
+    # Forward-fill zero ticks with the last non-zero sign
+    nonzero = signs != 0
+    last_idx = np.maximum.accumulate(np.where(nonzero, np.arange(len(signs)), -1))
+    filled = np.where(last_idx >= 0, signs[np.maximum(last_idx, 0)], prev_sign)
+    return filled, float(filled[-1])
+
+
+def bar_deltas(open_, high, low, close, volume) -> np.ndarray:
+    """Signed volume per OHLCV bar from the close location within the range.
+
+    Closing at the high counts the whole bar as buying, at the low as selling;
+    flat-range bars fall back to the sign of close - open.
+    """
+    open_, high, low, close, volume = (
+        np.nan_to_num(np.asarray(a, dtype=float))
+        for a in (open_, high, low, close, volume)
+    )
+    span = high - low
+    location = np.divide(
+        2 * close - high - low, span, out=np.sign(close - open_), where=span > 0
+    )
+    return volume * location
+
+
+@dataclass
+class CVDSeries:
+    delta: np.ndarray
+    cvd: np.ndarray
+    acceleration: np.ndarray
+    trend_strength: np.ndarray
+    trend_strong: np.ndarray
+    price_bounded: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.delta)
+
+
+class CVDMeter:
+    """Streaming CVD calculator.
+
+    acceleration: deviation of the current step's delta (CVD slope) from its
+        recent EMA, in EMA standard deviations.
+    trend_strength: |EMA(delta)| / EMA(|delta|), 1.0 when flow is one-sided.
+    price_bounded: CVD trends strongly while price makes little net progress.
+    """
+
+    def __init__(
+        self,
+        span: int = 20,
+        trend_span: int = 10,
+        trend_threshold: float = 0.6,
+        bound_threshold: float = 0.3,
+        warmup: int = 3,
+    ):
+        self.alpha = 2.0 / (span + 1)
+        self.trend_alpha = 2.0 / (trend_span + 1)
+        self.trend_threshold = trend_threshold
+        self.bound_threshold = bound_threshold
+        self.warmup = warmup
+
+        self.cvd = 0.0
+        self.steps = 0
+        self.last_price = np.nan
+        self.last_sign = 0.0
+        self.last_step_price = np.nan
+        self._mean = 0.0
+        self._sq = 0.0
+        self._signed = 0.0
+        self._abs = 0.0
+        self._move = 0.0
+        self._abs_move = 0.0
+
+    def update_ticks(
+        self,
+        prices,
+        sizes,
+        step_ids: Optional[np.ndarray] = None,
+    ) -> CVDSeries:
+        """Consumes trade prints. ``step_ids`` (non-decreasing) groups prints into
+        steps; each print is its own step when omitted. Feed whole steps per call.
+        """
+        prices = np.asarray(prices, dtype=float)
+        signs, self.last_sign = tick_rule_signs(prices, self.last_price, self.last_sign)
+        if len(prices):
+            self.last_price = float(prices[-1])
+        signed = signs * np.asarray(sizes, dtype=float)
+        if step_ids is None or len(prices) == 0:
+            return self.update_deltas(signed, prices)
+        step_ids = np.asarray(step_ids)
+        starts = np.flatnonzero(np.diff(step_ids, prepend=step_ids[:1] - 1))
+        ends = np.append(starts[1:], len(step_ids)) - 1
+        return self.update_deltas(np.add.reduceat(signed, starts), prices[ends])
+
+    def update_bars(self, open_, high, low, close, volume) -> CVDSeries:
+        return self.update_deltas(
+            bar_deltas(open_, high, low, close, volume),
+            np.asarray(close, dtype=float),
+        )
+
+    def update_deltas(self, deltas, step_prices=None) -> CVDSeries:
+        deltas = np.nan_to_num(np.asarray(deltas, dtype=float))
+        n = len(deltas)
+        cvd = self.cvd + np.cumsum(deltas)
+
+        mean = _ema(deltas, self.alpha, self._mean)
+        sq = _ema(deltas * deltas, self.alpha, self._sq)
+        # Statistics as of the previous step, so a spike is scored against the past
+        prev_mean = np.concatenate(([self._mean], mean[:-1]))
+        prev_std = np.sqrt(
+            np.maximum(np.concatenate(([self._sq], sq[:-1])) - prev_mean**2, 0.0)
+        )
+        acceleration = np.divide(
+            deltas - prev_mean,
+            prev_std,
+            out=np.zeros(n),
+            where=prev_std > 0,
+        )
+        acceleration[: max(0, self.warmup - self.steps)] = 0.0
+
+        signed = _ema(deltas, self.trend_alpha, self._signed)
+        absolute = _ema(np.abs(deltas), self.trend_alpha, self._abs)
+        strength = np.divide(
+            np.abs(signed), absolute, out=np.zeros(n), where=absolute > 0
+        )
+        trend_strong = strength >= self.trend_threshold
+        trend_strong[: max(0, self.warmup - self.steps)] = False
+
+        price_bounded = np.zeros(n, dtype=bool)
+        if step_prices is not None and n:
+            step_prices = np.asarray(step_prices, dtype=float)
+            prior = np.concatenate(([self.last_step_price], step_prices[:-1]))
+            moves = np.nan_to_num(step_prices - prior)
+            move = _ema(moves, self.trend_alpha, self._move)
+            abs_move = _ema(np.abs(moves), self.trend_alpha, self._abs_move)
+            efficiency = np.divide(
+                np.abs(move), abs_move, out=np.zeros(n), where=abs_move > 0
+            )
+            price_bounded = trend_strong & (efficiency < self.bound_threshold)
+            self.last_step_price = float(step_prices[-1])
+            self._move, self._abs_move = float(move[-1]), float(abs_move[-1])
+
+        if n:
+            self.cvd = float(cvd[-1])
+            self._mean, self._sq = float(mean[-1]), float(sq[-1])
+            self._signed, self._abs = float(signed[-1]), float(absolute[-1])
+            self.steps += n
+
+        return CVDSeries(
+            delta=deltas,
+            cvd=cvd,
+            acceleration=acceleration,
+            trend_strength=strength,
+            trend_strong=trend_strong,
+            price_bounded=price_bounded,
+        )
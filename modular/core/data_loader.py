@@ -6,6 +6,9 @@ import os
 import pandas as pd
 from datetime import datetime
 
+from .event_calendar import load_event_calendar
+from .iv_surface import build_iv_surface
+
 # Load settings
 with open("settings.json", "r") as f:
     settings = json.load(f)
@@ -13,6 +16,7 @@ with open("settings.json", "r") as f:
 STOCK_PATH = settings.get("stock_data_path")
 OPTION_PATH = settings.get("option_data_path")
 TICKERS = settings.get("tickers", [])
+EVENT_PATH = settings.get("event_calendar_path")
 
 if not STOCK_PATH or not OPTION_PATH:
     raise ValueError("Stock or Option data paths missing in settings.json. Please fix.")
@@ -26,7 +30,8 @@ def load_stock_data(ticker):
     return pd.read_csv(filepath)
 
 
-def load_option_data(ticker, max_files=6):
+def load_option_snapshots(ticker, max_files=6):
+    """Returns [(snapshot_date, DataFrame), ...] newest first, one per date folder."""
     ticker_lower = ticker.lower()
     base_dir = os.path.join(OPTION_PATH, ticker_lower)
 
@@ -49,22 +54,36 @@ def load_option_data(ticker, max_files=6):
 
     selected_folders = date_folders[:max_files]
 
-    dataframes = []
-    for folder, _ in selected_folders:
+    snapshots = []
+    for folder, folder_date in selected_folders:
         filepath = os.path.join(base_dir, folder, f"{ticker_lower}_quotedata.csv")
         if os.path.exists(filepath):
             df = pd.read_csv(filepath, skiprows=3)
-            dataframes.append(df)
+            snapshots.append((folder_date, df))
         else:
             print(f"Warning: Missing quotedata file in {folder}")
 
-    if not dataframes:
+    if not snapshots:
         raise FileNotFoundError(f"No quotedata CSVs found for {ticker}")
 
-    combined_df = pd.concat(dataframes, ignore_index=True)
+    return snapshots
+
+
+def load_option_data(ticker, max_files=6):
+    snapshots = load_option_snapshots(ticker, max_files=max_files)
+    combined_df = pd.concat([df for _, df in snapshots], ignore_index=True)
     return combined_df
 
 
+def load_iv_surface(ticker, max_files=6, spots=None):
+    return build_iv_surface(load_option_snapshots(ticker, max_files=max_files), spots=spots)
+
+
+def load_event_data():
+    # Optional: an empty calendar leaves event authorization inactive
+    return load_event_calendar(EVENT_PATH)
+
+
 def load_all_stock_data():
     data = {}
     for ticker in TICKERS:
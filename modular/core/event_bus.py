@@ -0,0 +1,278 @@
+# event_bus.py
+"""
+Buffered event bus for the simulation loop.
+
+Publishers append typed events (NamedTuples with a class-level ``level``) to an
+in-memory buffer; flush() hands every subscriber one list per batch, filtered
+by the subscriber's minimum level and event types. FlightOpsCore flushes once
+per tick, so sinks see batches instead of one call per event, and events
+nobody subscribed to are dropped at publish time. Text is only formatted by
+sinks that need it.
+
+Sinks:
+  PrintSink: formatted lines to a stream (stdout by default).
+  MemorySink: bounded in-memory list, for programmatic consumers and tests.
+  FileSink: text or NDJSON lines written by a background thread.
+"""
+
+import json
+import queue
+import sys
+import threading
+import time
+from collections import deque
+from enum import IntEnum
+from typing import (
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    TextIO,
+)
+
+
+class Level(IntEnum):
+    DEBUG = 10
+    INFO = 20
+    WARNING = 30
+    ERROR = 40
+
+
+class PhaseChange(NamedTuple):
+    tick: int
+    flight: str
+    old: str
+    new: str
+
+    level = Level.DEBUG
+
+    @property
+    def message(self) -> str:
+        return f"{self.flight} phase {self.old} -> {self.new}"
+
+
+class StallOnset(NamedTuple):
+    tick: int
+    flight: str
+
+    level = Level.WARNING
+
+    @property
+    def message(self) -> str:
+        return f"{self.flight} stalled"
+
+
+class StallCleared(NamedTuple):
+    tick: int
+    flight: str
+
+    level = Level.INFO
+
+    @property
+    def message(self) -> str:
+        return f"{self.flight} stall cleared"
+
+
+def event_record(event) -> dict:
+    """Event as a JSON-ready dict (type, level, fields, message)."""
+    record = {"type": type(event).__name__, "level": event.level.name}
+    record.update(event._asdict())
+    record.pop("template", None)
+    record["message"] = event.message
+    return record
+
+
+def format_event(event) -> str:
+    return f"[{event.level.name}] tick {event.tick}: {event.message}"
+
+
+class Subscription(NamedTuple):
+    handler: Callable[[List], None]
+    level: int
+    kinds: Optional[frozenset]
+
+    def accepts(self, kind: type) -> bool:
+        return kind.level >= self.level and (self.kinds is None or kind in self.kinds)
+
+
+class EventBus:
+    """Collects events and delivers them to subscribers in batches.
+
+    ``batch_size`` bounds the buffer: reaching it triggers an early flush.
+    """
+
+    def __init__(self, batch_size: int = 4096):
+        self.batch_size = batch_size
+        self.subscriptions: List[Subscription] = []
+        self.published = 0
+        self._buffer: List = []
+        self._wanted: Dict[type, bool] = {}  # wants() per event type
+
+    def subscribe(
+        self,
+        handler: Callable[[List], None],
+        level: int = Level.INFO,
+        kinds: Optional[Iterable[type]] = None,
+    ) -> Subscription:
+        """``handler`` is called with a list of events at or above ``level``
+        (and of the given event types, if any)."""
+        sub = Subscription(handler, level, frozenset(kinds) if kinds else None)
+        self.subscriptions.append(sub)
+        self._wanted.clear()
+        return sub
+
+    def unsubscribe(self, sub: Subscription):
+        self.subscriptions.remove(sub)
+        self._wanted.clear()
+
+    def wants(self, kind: type) -> bool:
+        """Whether any subscriber takes events of type ``kind``; publishers use
+        it to skip building events nobody reads."""
+        wanted = self._wanted.get(kind)
+        if wanted is None:
+            wanted = self._wanted[kind] = any(
+                sub.accepts(kind) for sub in self.subscriptions
+            )
+        return wanted
+
+    def publish(self, event):
+        if self.wants(type(event)):
+            self._buffer.append(event)
+            self.published += 1
+            if len(self._buffer) >= self.batch_size:
+                self.flush()
+
+    def publish_many(self, events: Iterable):
+        kept = [e for e in events if self.wants(type(e))]
+        self._buffer.extend(kept)
+        self.published += len(kept)
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        batch, self._buffer = self._buffer, []
+        if not batch:
+            return
+        for sub in self.subscriptions:
+            if sub.kinds is None and all(e.level >= sub.level for e in batch):
+                selected = batch
+            else:
+                selected = [e for e in batch if sub.accepts(type(e))]
+            if selected:
+                sub.handler(selected)
+
+    def close(self):
+        """Flushes and closes every handler that has a close() method; a
+        handler's error is raised once every handler has been closed."""
+        errors = []
+        try:
+            self.flush()
+        except Exception as e:
+            errors.append(e)
+        for sub in self.subscriptions:
+            close = getattr(sub.handler, "close", None)
+            if close is not None:
+                try:
+                    close()
+                except Exception as e:
+                    errors.append(e)
+        if errors:
+            raise errors[0]
+
+
+class PrintSink:
+    def __init__(self, stream: Optional[TextIO] = None):
+        self.stream = stream
+
+    def __call__(self, events: List):
+        stream = self.stream or sys.stdout
+        stream.write("".join(format_event(e) + "\n" for e in events))
+
+
+class MemorySink:
+    def __init__(self, maxlen: Optional[int] = None):
+        self.events: Deque = deque(maxlen=maxlen)
+
+    def __call__(self, events: List):
+        self.events.extend(events)
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+
+class FileSink:
+    """Appends events to ``path`` from a background thread.
+
+    fmt: "text" (one formatted line per event) or "ndjson".
+    flush_interval: seconds between file flushes while events keep coming.
+    max_pending: queued batches before the bus blocks on the writer.
+
+    If the writer fails, the file is closed, ``error`` holds the exception
+    and the next delivery or close() raises it.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        fmt: str = "text",
+        flush_interval: float = 1.0,
+        max_pending: int = 64,
+    ):
+        if fmt not in ("text", "ndjson"):
+            raise ValueError(f"Unknown event log format: {fmt}")
+        self.path = path
+        self.fmt = fmt
+        self.flush_interval = flush_interval
+        self.written = 0
+        self.error: Optional[BaseException] = None
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_pending)
+        self._file = open(path, "a", encoding="utf-8")
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def __call__(self, events: List):
+        if self.error is not None:
+            raise RuntimeError(f"Event log {self.path} failed") from self.error
+        self._queue.put(events)
+
+    def _format(self, event) -> str:
+        if self.fmt == "ndjson":
+            return json.dumps(event_record(event), ensure_ascii=False)
+        return format_event(event)
+
+    def _run(self):
+        last_flush = time.monotonic()
+        try:
+            while True:
+                try:
+                    events = self._queue.get(timeout=self.flush_interval)
+                except queue.Empty:
+                    events = []
+                if events is None:
+                    break
+                if events:
+                    self._file.write("".join(self._format(e) + "\n" for e in events))
+                    self.written += len(events)
+                if time.monotonic() - last_flush >= self.flush_interval:
+                    self._file.flush()
+                    last_flush = time.monotonic()
+        except Exception as e:
+            self.error = e
+        finally:
+            self._file.close()
+        if self.error is not None:
+            # Keep draining so publishing never blocks on a dead writer
+            while self._queue.get() is not None:
+                pass
+
+    def close(self):
+        """Writes everything queued and closes the file; raises the writer's
+        error if it failed, including on the final batches."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        if self.error is not None:
+            raise RuntimeError(f"Event log {self.path} failed") from self.error
@@ -0,0 +1,132 @@
+# event_calendar.py
+"""
+Scheduled event index (FOMC, CPI, earnings, ...) for event authorization.
+
+Events are read from local CSV files with columns ``timestamp``, ``event_type``
+and an optional ``ticker`` (blank or "*" applies to every ticker, e.g. macro
+releases). Each ticker gets one sorted int64 nanosecond array merged with the
+market-wide events, so "minutes to the nearest event and its type" is a
+``searchsorted`` for one timestamp or a whole telemetry array.
+"""
+
+import glob
+import os
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+ALL_TICKERS = "*"
+NO_EVENT = "unknown"
+_NS_PER_MINUTE = 60 * 1_000_000_000
+
+
+class EventCalendar:
+    def __init__(self, events: Optional[pd.DataFrame] = None):
+        """``events`` has columns timestamp, event_type and optional ticker."""
+        self.event_types: List[str] = [NO_EVENT]
+        self._times: Dict[str, np.ndarray] = {}
+        self._codes: Dict[str, np.ndarray] = {}
+        self._time_lists: Dict[str, List[int]] = {}
+        if events is None or events.empty:
+            events = pd.DataFrame({"timestamp": [], "event_type": []})
+        self._build(events)
+
+    def _build(self, events: pd.DataFrame):
+        times = pd.to_datetime(events["timestamp"], errors="coerce")
+        types = events["event_type"].astype(str).str.strip().str.lower()
+        if "ticker" in events.columns:
+            tickers = events["ticker"].fillna(ALL_TICKERS).astype(str).str.upper()
+            tickers = tickers.replace({"": ALL_TICKERS})
+        else:
+            tickers = pd.Series(ALL_TICKERS, index=events.index)
+        valid = times.notna()
+        times, types, tickers = times[valid], types[valid], tickers[valid]
+        self._count = int(valid.sum())
+
+        self.event_types += sorted(set(types) - {NO_EVENT})
+        code_of = {name: i for i, name in enumerate(self.event_types)}
+        stamps = times.values.astype("datetime64[ns]").astype(np.int64)
+        codes = types.map(code_of).values.astype(np.int16)
+        is_global = (tickers == ALL_TICKERS).values
+
+        for ticker in set(tickers) | {ALL_TICKERS}:
+            mask = is_global | (tickers == ticker).values
+            order = np.argsort(stamps[mask], kind="stable")
+            self._times[ticker] = stamps[mask][order]
+            self._codes[ticker] = codes[mask][order]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _key(self, ticker: Optional[str]) -> str:
+        key = ticker.upper() if ticker else ALL_TICKERS
+        return key if key in self._times else ALL_TICKERS
+
+    def nearest(self, ticker: Optional[str], timestamp) -> Tuple[float, str]:
+        """(minutes to the nearest event, event type); (inf, "unknown") if none."""
+        key = self._key(ticker)
+        times = self._time_lists.get(key)
+        if times is None:
+            times = self._time_lists[key] = self._times[key].tolist()
+        if not times:
+            return float("inf"), NO_EVENT
+        ts = pd.Timestamp(timestamp).value
+        i = bisect_left(times, ts)
+        best = None
+        for j in (i - 1, i):
+            if 0 <= j < len(times) and (
+                best is None or abs(times[j] - ts) < abs(times[best] - ts)
+            ):
+                best = j
+        minutes = abs(times[best] - ts) / _NS_PER_MINUTE
+        return minutes, self.event_types[self._codes[key][best]]
+
+    def proximity(
+        self, ticker: Optional[str], timestamps: Iterable
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Vectorized nearest(): (minutes array, event type code array).
+
+        Codes index ``event_types``; code 0 ("unknown") with inf minutes when the
+        calendar has no events for the ticker.
+        """
+        query = (
+            pd.to_datetime(pd.Series(timestamps))
+            .values.astype("datetime64[ns]")
+            .astype(np.int64)
+        )
+        key = self._key(ticker)
+        times, codes = self._times[key], self._codes[key]
+        if len(times) == 0:
+            return np.full(len(query), np.inf), np.zeros(len(query), dtype=np.int16)
+        right = np.clip(np.searchsorted(times, query), 0, len(times) - 1)
+        left = np.clip(right - 1, 0, len(times) - 1)
+        d_right = np.abs(times[right] - query)
+        d_left = np.abs(times[left] - query)
+        nearest = np.where(d_left <= d_right, left, right)
+        minutes = np.minimum(d_left, d_right) / _NS_PER_MINUTE
+        return minutes, codes[nearest]
+
+    def proximity_labels(
+        self, ticker: Optional[str], timestamps: Iterable
+    ) -> Tuple[np.ndarray, List[str]]:
+        minutes, codes = self.proximity(ticker, timestamps)
+        return minutes, [self.event_types[c] for c in codes]
+
+
+def load_event_calendar(path: Optional[str]) -> EventCalendar:
+    """Reads one CSV or every CSV in a directory; missing path gives an empty calendar."""
+    if not path or not os.path.exists(path):
+        return EventCalendar()
+    files = (
+        sorted(glob.glob(os.path.join(path, "*.csv")))
+        if os.path.isdir(path)
+        else [path]
+    )
+    frames = []
+    for filepath in files:
+        frames.append(pd.read_csv(filepath))
+    if not frames:
+        return EventCalendar()
+    return EventCalendar(pd.concat(frames, ignore_index=True))
@@ -0,0 +1,191 @@
+# fleet_sync.py
+"""
+Cross-ticker co-synchronization for fleet-wide contagion detection.
+
+compute_synchronization scores one instrument; contagion shows up as many
+tickers entering collective execution (S_c >= 0.65) at the same time. This
+module works on a tickers x time panel of S_c values:
+
+  CoSyncMatrix: rolling pairwise co-exceedance counts and S_c correlation,
+      updated incrementally with one matrix product per block of new steps
+      (new columns added, columns leaving the window subtracted).
+  collective_takeoff_index: fleet-level series, the share of ticker pairs
+      jointly in collective execution over the rolling window.
+"""
+
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+COLLECTIVE_SC = 0.65
+
+
+def _exceed(sc: np.ndarray, threshold: float) -> np.ndarray:
+    return (np.nan_to_num(sc) >= threshold).astype(float)
+
+
+def _rolling_sum(x: np.ndarray, window: int) -> np.ndarray:
+    # Sum over the trailing ``window`` entries (fewer while the window fills)
+    csum = np.cumsum(x, dtype=float)
+    out = csum.copy()
+    out[window:] -= csum[:-window]
+    return out
+
+
+def collective_takeoff_index(
+    sc_panel, window: int = 20, threshold: float = COLLECTIVE_SC
+) -> np.ndarray:
+    """Collective takeoff index per step for a (tickers, steps) S_c panel.
+
+    With k tickers above ``threshold`` at a step, k(k-1) ordered pairs are
+    co-exceeding, so the window average of k(k-1) / (N(N-1)) equals the mean
+    off-diagonal of CoSyncMatrix.co_exceedance without forming the matrix.
+    """
+    sc_panel = np.atleast_2d(np.asarray(sc_panel, dtype=float))
+    n = sc_panel.shape[0]
+    if n < 2:
+        return np.zeros(sc_panel.shape[1])
+    k = _exceed(sc_panel, threshold).sum(axis=0)
+    filled = np.minimum(np.arange(1, len(k) + 1), window)
+    return _rolling_sum(k * (k - 1), window) / (n * (n - 1) * filled)
+
+
+def collective_breadth(sc_panel, threshold: float = COLLECTIVE_SC) -> np.ndarray:
+    """Share of tickers in collective execution at each step."""
+    sc_panel = np.atleast_2d(np.asarray(sc_panel, dtype=float))
+    return _exceed(sc_panel, threshold).mean(axis=0)
+
+
+class CoSyncMatrix:
+    """Streaming pairwise co-synchronization over the last ``window`` steps.
+
+    Keeps C = E E^T (joint exceedance counts), Q = X X^T and S = sum X for
+    the S_c values X in the window. Each update costs two GEMMs on the block
+    of entering and leaving columns instead of recomputing the window.
+    ``refresh_every`` steps the sums are rebuilt from the buffer to stop
+    floating point drift in Q.
+    """
+
+    def __init__(
+        self,
+        tickers: Sequence[str],
+        window: int = 20,
+        threshold: float = COLLECTIVE_SC,
+        refresh_every: int = 10_000,
+    ):
+        self.tickers = list(tickers)
+        self.window = window
+        self.threshold = threshold
+        self.refresh_every = refresh_every
+        n = len(self.tickers)
+        self._buf = np.zeros((n, window))
+        self._pos = 0
+        self.filled = 0
+        self.steps = 0
+        self._since_refresh = 0
+        self.counts = np.zeros((n, n))
+        self._sum = np.zeros(n)
+        self._sq = np.zeros((n, n))
+
+    def __len__(self) -> int:
+        return len(self.tickers)
+
+    def _window_columns(self, first: int, count: int) -> np.ndarray:
+        idx = (first + np.arange(count)) % self.window
+        return self._buf[:, idx]
+
+    def refresh(self):
+        x = self._window_columns(self._pos - self.filled, self.filled)
+        e = _exceed(x, self.threshold)
+        self.counts = e @ e.T
+        self._sq = x @ x.T
+        self._sum = x.sum(axis=1)
+        self._since_refresh = 0
+
+    def update(self, sc_block) -> "CoSyncMatrix":
+        """Appends S_c for new steps: shape (tickers,) or (tickers, k)."""
+        block = np.asarray(sc_block, dtype=float)
+        if block.ndim == 1:
+            block = block[:, None]
+        block = np.nan_to_num(block)
+        k = block.shape[1]
+        if k == 0:
+            return self
+        if k >= self.window:
+            self._buf[:] = block[:, -self.window :]
+            self._pos, self.filled = 0, self.window
+            self.steps += k
+            self.refresh()
+            return self
+
+        leaving = max(0, self.filled + k - self.window)
+        if leaving:
+            old = self._window_columns(self._pos - self.filled, leaving)
+            e_old = _exceed(old, self.threshold)
+            self.counts -= e_old @ e_old.T
+            self._sq -= old @ old.T
+            self._sum -= old.sum(axis=1)
+        e_new = _exceed(block, self.threshold)
+        self.counts += e_new @ e_new.T
+        self._sq += block @ block.T
+        self._sum += block.sum(axis=1)
+
+        idx = (self._pos + np.arange(k)) % self.window
+        self._buf[:, idx] = block
+        self._pos = (self._pos + k) % self.window
+        self.filled = min(self.window, self.filled + k)
+        self.steps += k
+        self._since_refresh += k
+        if self._since_refresh >= self.refresh_every:
+            self.refresh()
+        return self
+
+    @property
+    def co_exceedance(self) -> np.ndarray:
+        """Share of window steps each pair spends jointly above the threshold."""
+        if self.filled == 0:
+            return np.zeros_like(self.counts)
+        return self.counts / self.filled
+
+    @property
+    def correlation(self) -> np.ndarray:
+        """Pearson correlation of S_c over the window (0 for flat tickers)."""
+        n = self.filled
+        if n < 2:
+            return np.zeros_like(self._sq)
+        mean = self._sum / n
+        cov = (self._sq - n * np.outer(mean, mean)) / (n - 1)
+        std = np.sqrt(np.clip(np.diag(cov), 0.0, None))
+        denom = np.outer(std, std)
+        return np.divide(cov, denom, out=np.zeros_like(cov), where=denom > 0)
+
+    def takeoff_index(self) -> float:
+        n = len(self.tickers)
+        if n < 2 or self.filled == 0:
+            return 0.0
+        off_diagonal = self.counts.sum() - np.trace(self.counts)
+        return float(off_diagonal / (n * (n - 1) * self.filled))
+
+    def top_pairs(
+        self, n: int = 10, by: str = "co_exceedance"
+    ) -> List[Tuple[str, str, float]]:
+        """Most co-synchronized ticker pairs, as (ticker, ticker, score)."""
+        scores = self.co_exceedance if by == "co_exceedance" else self.correlation
+        rows, cols = np.triu_indices(len(self.tickers), k=1)
+        values = scores[rows, cols]
+        n = min(n, len(values))
+        best = np.argpartition(-values, n - 1)[:n] if n else np.array([], int)
+        best = best[np.argsort(-values[best], kind="stable")]
+        return [
+            (self.tickers[rows[i]], self.tickers[cols[i]], float(values[i]))
+            for i in best
+        ]
+
+    def contagion(self, ticker: str, min_score: Optional[float] = None) -> List[str]:
+        """Tickers that co-exceed with ``ticker`` in at least ``min_score`` of
+        the window steps (default: any joint step)."""
+        i = self.tickers.index(ticker)
+        row = self.co_exceedance[i]
+        hits = row >= min_score if min_score is not None else row > 0
+        hits[i] = False
+        return [self.tickers[j] for j in np.flatnonzero(hits)]
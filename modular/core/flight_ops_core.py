@@ -1,15 +1,40 @@
+from collections import deque
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict
-import random
+from typing import List, Optional, Dict, Tuple
 import json
 
+import numpy as np
+
 from .synchronization import (
-    compute_synchronization,
+    compute_synchronization_batch,
     SynchronizationResult,
-    RegimeLabel,
-    ExecutionType,
+    SyncCache,
+)
+from .sync_tracker import TrackerBank
+from .airspace import (
+    CONFLICT_LINK,
+    SEPARATION_FT,
+    SEPARATION_NM,
+    AirspaceGrid,
+    bearing,
+)
+from .crow_simulator import FleetFlockSummary, FlockRollup
+from .flight_store import MODES, Flag, FlightStore, FlightView
+from .triggers import DEFAULT_LINK_KINDS, TriggerEngine, position_links
+from .sim_random import SimRandom
+from .tick_exporter import TickExporter
+from .event_bus import (
+    EventBus,
+    FileSink,
+    Level,
+    PhaseChange,
+    PrintSink,
+    StallCleared,
+    StallOnset,
 )
 
+NEUTRAL_SYNC = SynchronizationResult()
+
 
 # --- Shared Schema: FlightState ---
 @dataclass
@@ -31,9 +56,8 @@ class FlightState:
     status_flags: Dict[str, bool] = field(
         default_factory=lambda: {"stall": False, "turbulence": False}
     )
-    sync: Optional[Dict] = field(
-        default_factory=lambda: SynchronizationResult().to_dict()
-    )
+    # Immutable record; the neutral default is shared by every flight
+    sync: SynchronizationResult = NEUTRAL_SYNC
 
 
 # --- Mocked external functions for demonstration ---
@@ -52,19 +76,26 @@ def generate_market_flights(symbol_list):
     ]
 
 
-def spawn_aircraft(flight_plans):
-    # Returns a list of FlightState objects for aircraft
-    return [
-        FlightState(
-            id=plan["id"],
-            mode="aircraft",
-            origin=plan["origin"],
-            destination=plan["dest"],
-            altitude=1000.0,
-            velocity=250.0,
+def spawn_aircraft(flight_plans, airports=None):
+    # Returns a list of FlightState objects for aircraft; given airport
+    # positions they start over the origin, heading for the destination
+    airports = airports or {}
+    flights = []
+    for plan in flight_plans:
+        origin, dest = airports.get(plan["origin"]), airports.get(plan["dest"])
+        flights.append(
+            FlightState(
+                id=plan["id"],
+                mode="aircraft",
+                origin=plan["origin"],
+                destination=plan["dest"],
+                altitude=1000.0,
+                velocity=250.0,
+                heading=bearing(origin, dest) if origin and dest else 0.0,
+                position=dict(origin) if origin else {},
+            )
         )
-        for plan in flight_plans
-    ]
+    return flights
 
 
 def generate_flight_schedule(airport_layout):
@@ -81,186 +112,369 @@ def generate_flight_schedule(airport_layout):
     ]
 
 
-def update_market_flight(f: FlightState):
+# --- Vectorized update kernels: one call per mode over FlightStore slots ---
+def _set_flag(store: FlightStore, slots, bit: int, on: np.ndarray):
+    flags = store.flags[slots]
+    store.flags[slots] = np.where(on, flags | bit, flags & ~np.uint8(bit))
+
+
+def update_market_flights(store: FlightStore, slots, steps: np.ndarray):
     # Simulate random walk for price
-    if not hasattr(f, "tick"):
-        f.tick = 0
-    f.tick += 1
-    f.price += random.uniform(-1.5, 1.0)  # allow price to drop below 100
-    f.altitude = f.price * 10
-    f.velocity = 100.0
-    f.phase = "Cruise"
+    store.ticks[slots] += 1
+    price = store.price[slots] + steps  # allow price to drop below 100
+    store.price[slots] = price
+    store.altitude[slots] = price * 10
+    store.velocity[slots] = 100.0
+    store.phase[slots] = store.phase_code("Cruise")
     # Trigger stall if price < 100
-    if f.price < 100:
-        f.status_flags["stall"] = True
-    else:
-        f.status_flags["stall"] = False
+    _set_flag(store, slots, Flag.STALL, price < 100)
 
 
-def update_physical_flight(f: FlightState):
+def update_physical_flights(store: FlightStore, slots):
     # Simple mock: climb, then cruise
-    if f.altitude < 10000:
-        f.altitude += 500
-        f.phase = "Climb"
-    else:
-        f.phase = "Cruise"
-    f.velocity = 250.0
+    altitude = store.altitude[slots]
+    climbing = altitude < 10000
+    store.altitude[slots] = np.where(climbing, altitude + 500, altitude)
+    store.phase[slots] = np.where(
+        climbing, store.phase_code("Climb"), store.phase_code("Cruise")
+    )
+    store.velocity[slots] = 250.0
 
 
-def update_traffic_logic(f: FlightState):
+def advance_positions(store: FlightStore, slots, hours: float):
+    # Dead reckoning: velocity (kt) along heading (degrees from north)
+    distance = store.velocity[slots] * hours
+    heading = np.radians(store.heading[slots])
+    store.x[slots] += distance * np.sin(heading)
+    store.y[slots] += distance * np.cos(heading)
+
+
+def update_traffic_flights(store: FlightStore, slots):
     # Simple mock: traffic moves
-    if not hasattr(f, "tick"):
-        f.tick = 0
-    f.tick += 1
-    if f.tick == 4:
-        f.phase = "GoAround"
-    elif hasattr(f, "cleared_to_land") and f.cleared_to_land:
-        f.phase = "ClearedToLand"
-    else:
-        f.phase = "Taxi"
-    f.velocity = 20.0
+    ticks = store.ticks[slots] + 1
+    store.ticks[slots] = ticks
+    cleared = (store.flags[slots] & Flag.CLEARED_TO_LAND) != 0
+    store.phase[slots] = np.select(
+        [ticks == 4, cleared],
+        [store.phase_code("GoAround"), store.phase_code("ClearedToLand")],
+        store.phase_code("Taxi"),
+    )
+    store.velocity[slots] = 20.0
+
+
+def update_stall_flags(store: FlightStore, slots):
+    # Shared stall logic
+    airborne_slow = (store.altitude[slots] > 0) & (store.velocity[slots] < 50)
+    _set_flag(store, slots, Flag.STALL, airborne_slow)
 
 
 # --- Core Engine Logic ---
 class FlightOpsCore:
     def __init__(self, config: Dict):
         self.config = config
-        self.flight_objects = []  # List[FlightState]
+        # Struct-of-arrays state; flight_objects are views onto its slots.
+        # Telemetry keeps the last telemetry_depth snapshots per flight.
+        self.store = FlightStore(
+            config.get("flight_capacity", 1024), config.get("telemetry_depth", 10)
+        )
         self.timestep = 0
-        self.airspace_map = {}  # could link to ATC zones
+        # Airport -> ATC region; flight_shards partitions flights by region
+        self.airspace_map = config.get("airspace_map", {})
+        # Optional memo for the trackers' scalar path
+        cache_size = config.get("sync_cache_size", 0)
+        self.sync_cache = (
+            SyncCache(cache_size, config.get("sync_cache_precision", 4))
+            if cache_size
+            else None
+        )
+        # Rolling sync state of the market flights, one row per store slot
+        self.sync_bank = TrackerBank(
+            window=config.get("sync_window", 20), cache=self.sync_cache
+        )
+        # Fleet-wide flock aggregate over market flights, kept incrementally
+        self.flock = FlockRollup()
+        self.flock_state = FleetFlockSummary()
+        self.flock_history = deque(maxlen=config.get("flock_history", 100))
+        # Cross-domain rules over explicit links. With position_links the
+        # default rule kinds also link the i-th flight of one mode to the
+        # i-th of the other, rebuilt whenever the roster changes.
+        self.triggers = TriggerEngine(log_size=config.get("trigger_log_size", 10000))
+        self.position_links = config.get("position_links", True)
+        self._roster_changed = True
+        # Set by a shard worker to trade cross-shard links (see flight_shards)
+        self.trigger_exchange = None
+        # Streaming per-tick writers (TickExporter), fed after every update();
+        # closed by whoever attached them
+        self.exporters: List[TickExporter] = []
+        # Positions (NM on a local plane) advance tick_seconds per tick. The
+        # grid, rebuilt every tick, flags separation losses, links conflicting
+        # flights (CONFLICT_LINK) and rebuilds proximity_links kinds:
+        # kind -> (source mode, target mode, radius NM).
+        self.airports = config.get("airports", {})  # code -> {"x", "y"}
+        self.tick_hours = config.get("tick_seconds", 60) / 3600.0
+        self.airspace = AirspaceGrid(config.get("grid_cell_nm", 10.0))
+        self.separation = (
+            config.get("separation_nm", SEPARATION_NM),
+            config.get("separation_ft", SEPARATION_FT),
+        )
+        self.proximity_links = config.get("proximity_links", {})
+        self._airspace_stale = True
+        # Seeded per-tick draws; config seed=None picks fresh entropy
+        # (kept in self.random.seed). rng_streams: "flight" or "shared".
+        self.random = SimRandom(
+            config.get("seed"), config.get("rng_streams", "flight")
+        )
+        # Typed events (triggers, phase changes, stalls), delivered per tick
+        self.bus = EventBus(config.get("event_batch_size", 4096))
+
+    @property
+    def flight_objects(self) -> List[FlightView]:
+        return self.store.views()
+
+    def _load(self, flights: List[FlightState]):
+        self.store.reserve(self.store.n + len(flights))
+        for f in flights:
+            self.add_flight(f)
+
+    def add_flight(self, flight: FlightState) -> FlightView:
+        # O(1): appends a slot and indexes it by id and mode
+        slot = self.store.add(flight)
+        self._roster_changed = self._airspace_stale = True
+        if flight.mode == "market":
+            self.flock.replace(flight.id, flight.sync)
+        return self.store.view(slot)
+
+    def remove_flight(self, flight_id: str):
+        # O(1): the last slot moves into the freed one
+        moved_from = self.store.n - 1
+        slot = self.store.remove(flight_id)
+        self.triggers.links.on_remove(slot, moved_from)
+        self._roster_changed = self._airspace_stale = True
+        self.sync_bank.move(moved_from, slot)
+        self.sync_bank.clear(moved_from)
+        self.flock.remove(flight_id)
+
+    def get_flight(self, flight_id: str) -> FlightView:
+        return self.store.view(self.store.slot_of(flight_id))
+
+    def link(self, kind: str, source_id: str, target_id: str):
+        # Explicit trigger link; kept when position links are rebuilt
+        store = self.store
+        self.triggers.links.add(
+            kind, store.slot_of(source_id), store.slot_of(target_id)
+        )
+
+    def _link_by_position(self):
+        links = self.triggers.links
+        for kind, (source_mode, target_mode) in DEFAULT_LINK_KINDS.items():
+            if kind in self.proximity_links:
+                continue
+            links.clear(kind, auto=True)
+            sources, targets = position_links(
+                self.store.slots(source_mode), self.store.slots(target_mode)
+            )
+            links.add(kind, sources, targets, auto=True)
+        self._roster_changed = False
 
     def load_market_flights(self, symbol_list):
-        self.flight_objects += generate_market_flights(symbol_list)
+        self._load(generate_market_flights(symbol_list))
+
+    def _set_sync(self, f: FlightState, sync: SynchronizationResult):
+        if sync is not f.sync:
+            f.sync = sync
+            self.flock.replace(f.id, sync)
 
     def load_aircraft(self, flight_plans):
-        self.flight_objects += spawn_aircraft(flight_plans)
+        self._load(spawn_aircraft(flight_plans, self.airports))
 
     def load_airtraffic(self, airport_layout):
-        self.flight_objects += generate_flight_schedule(airport_layout)
-
-    def compute_synchronization_for(self, f: FlightState) -> Dict:
-        if f.mode != "market":
-            return SynchronizationResult().to_dict()
-
-        history = f.telemetry
-        if len(history) < 2:
-            return SynchronizationResult().to_dict()
-
-        prices = [h.get("price", f.price) for h in history]
-        price_disp = prices[-1] - prices[-2] if len(prices) >= 2 else 0.0
-
-        vol_ratios = [h.get("volume_ratio", 1.0) for h in history]
-        vol_spike = vol_ratios[-1] if vol_ratios else 1.0
-
-        spreads = [h.get("spread", 0.0) for h in history]
-        spread = spreads[-1] if spreads else 0.0
-
-        vols = [h.get("volatility", 0.0) for h in history]
-        vol_exp = abs(vols[-1] - vols[-2]) if len(vols) >= 2 else 0.0
-
-        result = compute_synchronization(
-            price_displacement=price_disp,
-            volume_spike_ratio=vol_spike,
-            spread_widening_ratio=spread,
-            volatility_expansion=vol_exp,
-            cvd_acceleration=0.0,
-            prior_cruise_deviation=abs(price_disp) * 0.5,
+        self._load(generate_flight_schedule(airport_layout))
+
+    def compute_synchronization_for(self, f: FlightView) -> Dict:
+        ring = self.store.telemetry
+        if f.mode != "market" or not ring.count[f.slot]:
+            return NEUTRAL_SYNC.to_dict()
+        self.sync_bank.resize(self.store.n)
+        latest = ring.latest()[f.slot]
+        result = self.sync_bank.update(
+            f.slot,
+            float(latest["price"]),
+            tick=ring.last_tick,
+            volume=float(latest["volume_ratio"]),
+            spread=float(latest["spread"]),
+            iv=float(latest["volatility"]),
         )
         return result.to_dict()
 
+    def compute_synchronization_all(self, flights: List[FlightView]):
+        self._synchronize(np.array([f.slot for f in flights], dtype=np.int64))
+
+    def _synchronize(self, slots: np.ndarray):
+        # The tracker bank advances every market flight with telemetry from
+        # the latest snapshot at once; one batch kernel call computes them
+        store, bank = self.store, self.sync_bank
+        ring = store.telemetry
+        bank.resize(store.n)
+        ready = (store.mode[slots] == MODES.index("market")) & (ring.count[slots] > 0)
+        views = store.view
+        for slot in slots[~ready].tolist():
+            self._set_sync(views(slot), NEUTRAL_SYNC)
+        tick = ring.last_tick
+        slots = slots[ready]
+        repeat = bank.last_tick[slots] == tick
+        for slot in slots[repeat].tolist():
+            self._set_sync(views(slot), bank.last_result[slot])
+        rows = slots[~repeat]
+        if not len(rows):
+            return
+        latest = ring.latest()
+        inputs = bank.observe(
+            rows,
+            latest["price"][rows],
+            latest["volume_ratio"][rows],
+            latest["spread"][rows],
+            latest["volatility"][rows],
+        )
+        batch = compute_synchronization_batch(**inputs)
+        release = bank.is_release(rows, batch.synchronization_coefficient)
+        if release.any():
+            batch = compute_synchronization_batch(**inputs, force_post_release=release)
+        results = [batch.result(i) for i in range(len(rows))]
+        bank.commit(rows, batch.regime_code, results, tick)
+        for slot, result in zip(rows.tolist(), results):
+            self._set_sync(views(slot), result)
+
     def update(self):
-        for f in self.flight_objects:
-            self._update_flight(f)
-            # --- Synchronization computation for market flights ---
-            if f.mode == "market" and hasattr(self, "timestep") and self.timestep > 0:
-                f.sync = self.compute_synchronization_for(f)
-            # --- Telemetry/history buffer ---
-            snap = {
-                "tick": self.timestep,
-                "altitude": f.altitude,
-                "velocity": f.velocity,
-                "phase": f.phase,
-                "status_flags": dict(f.status_flags),
-                "price": f.price,
-                "volume_ratio": random.uniform(0.5, 3.0) if f.mode == "market" else 1.0,
-                "spread": random.uniform(0.0, 0.5) if f.mode == "market" else 0.0,
-                "volatility": random.uniform(0.0, 2.0) if f.mode == "market" else 0.0,
-            }
-            f.telemetry.append(snap)
-            if len(f.telemetry) > 10:
-                f.telemetry.pop(0)
+        store = self.store
+        market, aircraft, traffic = (store.slots(mode) for mode in MODES)
+        # Pre-tick state for change events, only if someone listens
+        phase_before = stall_before = None
+        if self.bus.wants(PhaseChange):
+            phase_before = store.column("phase").copy()
+        if self.bus.wants(StallOnset) or self.bus.wants(StallCleared):
+            stall_before = store.column("flags") & Flag.STALL
+        # Every market draw of the tick at once: price step, volume_ratio,
+        # spread, volatility
+        draws = self.random.uniforms(store.rng_key[market], self.timestep, draws=4)
+        self._update_flights(market, aircraft, traffic, -1.5 + 2.5 * draws[:, 0])
+        self._update_airspace()
+        # --- Synchronization computation for market flights ---
+        if self.timestep > 0:
+            self._synchronize(market)
+        self.flock_state = self.flock.summary(self.timestep)
+        self.flock_history.append(self.flock_state)
+        # --- Telemetry/history buffer ---
+        n = store.n
+        volume_ratio, spread, volatility = np.ones(n), np.zeros(n), np.zeros(n)
+        volume_ratio[market] = 0.5 + 2.5 * draws[:, 1]
+        spread[market] = 0.5 * draws[:, 2]
+        volatility[market] = 2.0 * draws[:, 3]
+        store.telemetry.append(
+            self.timestep,
+            n,
+            {
+                "altitude": store.column("altitude"),
+                "velocity": store.column("velocity"),
+                "phase": store.column("phase"),
+                "flags": store.column("flags"),
+                "price": store.column("price"),
+                "volume_ratio": volume_ratio,
+                "spread": spread,
+                "volatility": volatility,
+            },
+        )
         self.timestep += 1
 
         # --- Cross-domain event triggers ---
-        # Simple mapping: first market flight <-> first aircraft, first traffic <-> first aircraft
-        market_flights = [f for f in self.flight_objects if f.mode == "market"]
-        aircraft_flights = [f for f in self.flight_objects if f.mode == "aircraft"]
-        traffic_flights = [f for f in self.flight_objects if f.mode == "traffic"]
-
-        # 1. Market stall triggers aircraft stall
-        if market_flights and aircraft_flights:
-            for i, mkt in enumerate(market_flights):
-                if mkt.status_flags.get("stall"):
-                    idx = min(i, len(aircraft_flights) - 1)
-                    ac = aircraft_flights[idx]
-                    if not ac.status_flags.get("stall"):
-                        ac.status_flags["stall"] = True
-                        print(
-                            f"[TRIGGER] Market flight {mkt.id} is stalled. Aircraft {ac.id} set to stall."
-                        )
-        # 2. Traffic GoAround triggers aircraft holding
-        if traffic_flights and aircraft_flights:
-            for i, trf in enumerate(traffic_flights):
-                if trf.phase == "GoAround":
-                    idx = min(i, len(aircraft_flights) - 1)
-                    ac = aircraft_flights[idx]
-                    if ac.phase != "Holding":
-                        ac.phase = "Holding"
-                        # Track how long in holding
-                        ac.holding_ticks = 1
-                        print(
-                            f"[TRIGGER] Traffic flight {trf.id} in GoAround. Aircraft {ac.id} set to Holding phase."
-                        )
-                    elif hasattr(ac, "holding_ticks"):
-                        ac.holding_ticks += 1
-                else:
-                    # Reset holding_ticks if not in holding
-                    idx = min(i, len(aircraft_flights) - 1)
-                    ac = aircraft_flights[idx]
-                    if hasattr(ac, "holding_ticks"):
-                        del ac.holding_ticks
-        # 3. Aircraft in Holding >2 ticks triggers traffic ClearedToLand
-        if aircraft_flights and traffic_flights:
-            for i, ac in enumerate(aircraft_flights):
-                if hasattr(ac, "holding_ticks") and ac.holding_ticks > 2:
-                    idx = min(i, len(traffic_flights) - 1)
-                    trf = traffic_flights[idx]
-                    if not hasattr(trf, "cleared_to_land") or not trf.cleared_to_land:
-                        trf.cleared_to_land = True
-                        print(
-                            f"[TRIGGER] Aircraft {ac.id} held >2 ticks. Traffic {trf.id} set to ClearedToLand."
-                        )
-
-    def _update_flight(self, f: FlightState):
-        # Route to appropriate logic engine
-        if f.mode == "market":
-            update_market_flight(f)
-        elif f.mode == "aircraft":
-            update_physical_flight(f)
-        elif f.mode == "traffic":
-            update_traffic_logic(f)
-
-        # Shared stall logic
-        if f.altitude > 0 and f.velocity < 50:
-            f.status_flags["stall"] = True
-        else:
-            f.status_flags["stall"] = False
+        if self.position_links and self._roster_changed:
+            self._link_by_position()
+        self.bus.publish_many(
+            self.triggers.evaluate(store, self.timestep - 1, self.trigger_exchange)
+        )
+        self._publish_changes(phase_before, stall_before)
+        self.bus.flush()
+        for exporter in self.exporters:
+            exporter.write(store, self.timestep - 1)
+
+    def _publish_changes(self, phase_before, stall_before):
+        store, tick, publish = self.store, self.timestep - 1, self.bus.publish
+        ids, names = store.ids, store.phase_names
+        if phase_before is not None:
+            phase = store.column("phase")
+            for slot in np.flatnonzero(phase != phase_before).tolist():
+                old, new = names[phase_before[slot]], names[phase[slot]]
+                publish(PhaseChange(tick, ids[slot], old, new))
+        if stall_before is not None:
+            stall = store.column("flags") & Flag.STALL
+            for slot in np.flatnonzero(stall & ~stall_before).tolist():
+                publish(StallOnset(tick, ids[slot]))
+            for slot in np.flatnonzero(stall_before & ~stall).tolist():
+                publish(StallCleared(tick, ids[slot]))
+
+    def _update_flights(self, market, aircraft, traffic, steps):
+        # Route each mode's slots to its logic engine
+        store = self.store
+        update_market_flights(store, market, steps)
+        update_physical_flights(store, aircraft)
+        advance_positions(store, aircraft, self.tick_hours)
+        update_traffic_flights(store, traffic)
+        update_stall_flags(store, slice(0, store.n))
+
+    def _update_airspace(self):
+        store, links = self.store, self.triggers.links
+        self.airspace.rebuild(store)
+        self._airspace_stale = False
+        a, b = self.airspace.conflicts(*self.separation)
+        conflict = np.zeros(store.n, dtype=bool)
+        conflict[a] = conflict[b] = True
+        _set_flag(store, slice(0, store.n), Flag.CONFLICT, conflict)
+        links.clear(CONFLICT_LINK, auto=True)
+        if len(a):
+            sources, targets = np.concatenate((a, b)), np.concatenate((b, a))
+            links.add(CONFLICT_LINK, sources, targets, auto=True)
+        for kind, (source_mode, target_mode, radius) in self.proximity_links.items():
+            links.clear(kind, auto=True)
+            sources, targets = self.airspace.links(
+                store, store.slots(source_mode), store.slots(target_mode), radius
+            )
+            links.add(kind, sources, targets, auto=True)
+
+    def _grid(self) -> AirspaceGrid:
+        # Positions as of the last update(); re-indexed after roster changes
+        if self._airspace_stale:
+            self.airspace.rebuild(self.store)
+            self._airspace_stale = False
+        return self.airspace
+
+    def neighbors(self, flight_id: str, radius: float) -> List[FlightView]:
+        store = self.store
+        slots = self._grid().neighbors(store, store.slot_of(flight_id), radius)
+        return store.views(slots)
+
+    def conflicts(self) -> List[Tuple[str, str]]:
+        # Pairs inside the separation minimums, as of the last update()
+        a, b = self._grid().conflicts(*self.separation)
+        ids = self.store.ids
+        return [(ids[i], ids[j]) for i, j in zip(a.tolist(), b.tolist())]
+
+    def traffic_near(self, airport: str, radius: float) -> List[FlightView]:
+        position = self.airports[airport]
+        return self.store.views(
+            self._grid().within(position["x"], position["y"], radius)
+        )
+
+    def records(self) -> List[Dict]:
+        # All flight objects as dicts (including telemetry)
+        store = self.store
+        return [
+            {**store.record(slot), "sync": store.sync[slot].to_dict()}
+            for slot in range(store.n)
+        ]
 
     def export_results(self, out_path):
-        # Export all flight objects as dicts (including telemetry)
         with open(out_path, "w", encoding="utf-8") as f:
             json.dump(
-                [f.__dict__ for f in self.flight_objects],
+                self.records(),
                 f,
                 ensure_ascii=False,
                 indent=2,
@@ -283,14 +497,24 @@ if __name__ == "__main__":
     ops.load_aircraft([{"id": "AC001", "origin": "KSEA", "dest": "KPDX"}])
     ops.load_airtraffic("PNW")
 
-    print("Initial Flight States:")
-    for f in ops.flight_objects:
-        print(f)
+    # Triggers and stalls to the terminal; every event, phase changes
+    # included, to an NDJSON log written off the simulation thread
+    ops.bus.subscribe(PrintSink(), level=Level.INFO)
+    ops.bus.subscribe(
+        FileSink("modular/logs/events.ndjson", fmt="ndjson"), level=Level.DEBUG
+    )
+    # Per-tick state changes, readable while the run goes on
+    ops.exporters.append(TickExporter("modular/logs/ticks.ndjson"))
 
     for tick in range(5):
         ops.update()
-        print(f"\nTick {tick + 1}:")
-        for f in ops.flight_objects:
-            print(f)
+        print(f"Tick {tick + 1}: {ops.flock_state.to_dict()}")
+    ops.bus.close()
+    for exporter in ops.exporters:
+        exporter.close()
+
+    print("\nFinal Flight States:")
+    for f in ops.flight_objects:
+        print(f)
     # Export results for charting
     ops.export_results("modular/logs/results.json")
@@ -0,0 +1,471 @@
+# flight_shards.py
+"""
+Sharded multi-process FlightOpsCore.
+
+ShardedFlightOps partitions the roster across worker processes, each running
+its own FlightOpsCore over its shard:
+
+  market flights: by a hash of the flight id.
+  aircraft / traffic: by ATC region, ``airspace_map[origin]`` (the origin
+      itself when unmapped); ``shard_regions`` pins regions to shards,
+      other regions are hashed.
+
+The coordinator keeps the roster in single-core slot order together with the
+global trigger LinkTable (position links are rebuilt here, exactly as
+FlightOpsCore does), and ships each worker its part of the links whenever the
+roster changes. Links whose source and target live on different shards are
+settled at a barrier per rule: each worker evaluates the rule's condition on
+its outgoing sources, the coordinator routes the packed firing bits over the
+pipes, and every worker applies the rule to its targets with local and
+incoming links merged in global link order. Rules therefore run in the same
+order and see the same state as in a single core, and with per-flight random
+streams (rng_streams="flight") a sharded run reproduces the single-core run
+flight for flight.
+
+Per tick the coordinator merges the workers' flock totals into one
+FleetFlockSummary and republishes the events its bus subscribers want (events
+of a tick are grouped by type and rule, not by slot). export_results() merges
+every shard's records in single-core slot order.
+
+Flights stay on the shard they were assigned at load; subscribe to ``bus``
+before the first update(). Spatial links (conflicts, proximity_links) are
+built by each worker over its own shard's airspace.
+"""
+
+import json
+import multiprocessing
+import os
+import traceback
+from collections import deque
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from .crow_simulator import FleetFlockSummary
+from .event_bus import EventBus, Level, PhaseChange, StallCleared, StallOnset
+from .flight_ops_core import (
+    FlightOpsCore,
+    FlightState,
+    generate_flight_schedule,
+    generate_market_flights,
+    spawn_aircraft,
+)
+from .flight_store import FlightStore
+from .sim_random import SimRandom, flight_key
+from .triggers import (
+    DEFAULT_LINK_KINDS,
+    DEFAULT_RULES,
+    LinkTable,
+    TriggerEngine,
+    TriggerEvent,
+    TriggerRule,
+    position_links,
+)
+
+# Event types workers forward, in the order a tick publishes them
+EVENT_TYPES = (TriggerEvent, PhaseChange, StallOnset, StallCleared)
+
+
+def region_of(flight, airspace_map: Dict[str, str]) -> str:
+    return airspace_map.get(flight.origin, flight.origin)
+
+
+def assign_shard(
+    flight,
+    shards: int,
+    airspace_map: Optional[Dict[str, str]] = None,
+    shard_regions: Optional[Dict[str, int]] = None,
+) -> int:
+    """Shard index of ``flight``; stable across runs and processes."""
+    if flight.mode == "market":
+        return flight_key(flight.id) % shards
+    region = region_of(flight, airspace_map or {})
+    if shard_regions and region in shard_regions:
+        return shard_regions[region] % shards
+    return flight_key(region) % shards
+
+
+class _ExchangePlan(NamedTuple):
+    outgoing: Dict[int, np.ndarray]  # shard -> local source slots
+    incoming: Dict[int, int]  # shard -> link count, in concatenation order
+    order: np.ndarray  # local + incoming links -> global link order
+    sources: List[str]  # source ids, in global link order
+    targets: np.ndarray  # target slots, in global link order
+
+
+class _ShardWorker:
+    """One shard's FlightOpsCore, driven by coordinator commands."""
+
+    def __init__(self, conn, config: Dict, rules, flights, event_types):
+        self.conn = conn
+        self.core = FlightOpsCore({**config, "position_links": False})
+        self.core.triggers = TriggerEngine(
+            rules, log_size=config.get("trigger_log_size", 10000)
+        )
+        self.core.trigger_exchange = self.exchange
+        self.core._load(flights)
+        self.plans: Dict[str, _ExchangePlan] = {}
+        self.outbox: List = []
+        if event_types:
+            self.core.bus.subscribe(
+                self.outbox.extend, level=Level.DEBUG, kinds=event_types
+            )
+
+    def serve(self):
+        core = self.core
+        while True:
+            command, *args = self.conn.recv()
+            if command == "tick":
+                core.update()
+                flock = core.flock
+                totals = (
+                    len(flock),
+                    flock.type_ii,
+                    flock.type_iii,
+                    flock.scout_alerts,
+                    flock.roost_pressure_sum,
+                )
+                self.conn.send(("done", totals, self.outbox[:]))
+                self.outbox.clear()
+            elif command == "layout":
+                self.install(*args)
+            elif command == "add":
+                core.add_flight(*args)
+            elif command == "remove":
+                core.remove_flight(*args)
+            elif command == "records":
+                self.conn.send(("records", core.records()))
+            elif command == "stop":
+                break
+
+    def install(self, local: Dict, exchange: Dict):
+        """Replaces the trigger links with this shard's part of the global
+        table (``layout`` from ShardedFlightOps._layouts)."""
+        index = self.core.store.index
+        links = self.core.triggers.links
+        links.clear()
+        for kind, (src_ids, dst_ids, _) in local.items():
+            links.add(kind, [index[i] for i in src_ids], [index[i] for i in dst_ids])
+        self.plans = {}
+        for kind, (outgoing, incoming) in exchange.items():
+            src_ids, dst_ids, seq = local.get(kind, ([], [], np.zeros(0, np.int64)))
+            sources, targets, seqs = list(src_ids), list(dst_ids), [seq]
+            for shard in sorted(incoming):
+                in_src, in_dst, in_seq = incoming[shard]
+                sources += in_src
+                targets += in_dst
+                seqs.append(in_seq)
+            order = np.argsort(np.concatenate(seqs), kind="stable")
+            self.plans[kind] = _ExchangePlan(
+                outgoing={
+                    shard: np.array([index[i] for i in ids], dtype=np.int64)
+                    for shard, ids in outgoing.items()
+                },
+                incoming={shard: len(incoming[shard][0]) for shard in sorted(incoming)},
+                order=order,
+                sources=[sources[k] for k in order.tolist()],
+                targets=np.array([index[i] for i in targets], dtype=np.int64)[order],
+            )
+
+    def exchange(self, rule: TriggerRule, src, dst, firing):
+        # TriggerEngine.evaluate hook: one barrier per rule with remote links
+        plan = self.plans.get(rule.link)
+        if plan is None:
+            return None, dst, firing
+        store = self.core.store
+        fires = {
+            shard: np.packbits(rule.when(store, slots))
+            for shard, slots in plan.outgoing.items()
+        }
+        self.conn.send(("fire", rule.name, fires))
+        _, _, incoming = self.conn.recv()
+        parts = [firing] + [
+            np.unpackbits(incoming[shard], count=count).astype(bool)
+            for shard, count in plan.incoming.items()
+        ]
+        return plan.sources, plan.targets, np.concatenate(parts)[plan.order]
+
+
+def _shard_main(conn, config, rules, flights, event_types):
+    try:
+        _ShardWorker(conn, config, rules, flights, event_types).serve()
+    except Exception:
+        conn.send(("error", traceback.format_exc()))
+    finally:
+        conn.close()
+
+
+class ShardedFlightOps:
+    """Coordinator for a FlightOpsCore run split over ``shards`` processes.
+
+    Takes the FlightOpsCore config plus ``shards`` (default: CPU count),
+    ``airspace_map`` (airport -> region), ``shard_regions`` (region -> shard)
+    and ``start_method`` (multiprocessing start method).
+    """
+
+    def __init__(
+        self,
+        config: Dict,
+        shards: Optional[int] = None,
+        rules: Iterable[TriggerRule] = DEFAULT_RULES,
+    ):
+        if config.get("rng_streams", "flight") != "flight":
+            raise ValueError("Sharded runs need per-flight random streams")
+        self.shards = shards or config.get("shards") or os.cpu_count() or 1
+        self.airspace_map = config.get("airspace_map", {})
+        self.shard_regions = config.get("shard_regions", {})
+        # Every shard draws from the same seeded streams
+        seed = SimRandom(config.get("seed")).seed
+        self.config = {**config, "seed": seed}
+        self.rules: List[TriggerRule] = list({r.name: r for r in rules}.values())
+        self._rule_rank = {rule.name: i for i, rule in enumerate(self.rules)}
+        # Global roster (single-core slot order) and trigger links
+        self.store = FlightStore(config.get("flight_capacity", 1024), 1)
+        self.links = LinkTable()
+        self.position_links = config.get("position_links", True)
+        self.shard_of: Dict[str, int] = {}
+        self.timestep = 0
+        self.flock_state = FleetFlockSummary()
+        self.flock_history = deque(maxlen=config.get("flock_history", 100))
+        self.bus = EventBus(config.get("event_batch_size", 4096))
+        self._pending: List[List[FlightState]] = [[] for _ in range(self.shards)]
+        self._conns: List = []
+        self._procs: List = []
+        self._exchange_kinds: frozenset = frozenset()
+        self._roster_changed = True
+
+    @property
+    def seed(self):
+        return self.config["seed"]
+
+    @property
+    def started(self) -> bool:
+        return bool(self._procs)
+
+    def shard_sizes(self) -> List[int]:
+        sizes = [0] * self.shards
+        for shard in self.shard_of.values():
+            sizes[shard] += 1
+        return sizes
+
+    # --- Roster ---
+    def load_market_flights(self, symbol_list):
+        self._load(generate_market_flights(symbol_list))
+
+    def load_aircraft(self, flight_plans):
+        self._load(spawn_aircraft(flight_plans, self.config.get("airports")))
+
+    def load_airtraffic(self, airport_layout):
+        self._load(generate_flight_schedule(airport_layout))
+
+    def _load(self, flights: List[FlightState]):
+        self.store.reserve(self.store.n + len(flights))
+        for f in flights:
+            self.add_flight(f)
+
+    def add_flight(self, flight: FlightState) -> int:
+        """Adds ``flight`` to its shard; returns the shard index."""
+        self.store.add(flight)
+        shard = assign_shard(flight, self.shards, self.airspace_map, self.shard_regions)
+        self.shard_of[flight.id] = shard
+        if self.started:
+            self._conns[shard].send(("add", flight))
+        else:
+            self._pending[shard].append(flight)
+        self._roster_changed = True
+        return shard
+
+    def remove_flight(self, flight_id: str):
+        moved_from = self.store.n - 1
+        slot = self.store.remove(flight_id)
+        self.links.on_remove(slot, moved_from)
+        shard = self.shard_of.pop(flight_id)
+        if self.started:
+            self._conns[shard].send(("remove", flight_id))
+        else:
+            pending = self._pending[shard]
+            pending[:] = [f for f in pending if f.id != flight_id]
+        self._roster_changed = True
+
+    def link(self, kind: str, source_id: str, target_id: str):
+        store = self.store
+        self.links.add(kind, store.slot_of(source_id), store.slot_of(target_id))
+        self._roster_changed = True
+
+    def _link_by_position(self):
+        proximity = self.config.get("proximity_links", {})
+        for kind, (source_mode, target_mode) in DEFAULT_LINK_KINDS.items():
+            if kind in proximity:
+                continue
+            self.links.clear(kind, auto=True)
+            sources, targets = position_links(
+                self.store.slots(source_mode), self.store.slots(target_mode)
+            )
+            self.links.add(kind, sources, targets, auto=True)
+
+    def _layouts(self) -> List[Dict]:
+        """Each shard's share of the global links, by flight id. ``local``:
+        kind -> (sources, targets, global link index) of links inside the
+        shard; ``exchange``: kind -> (outgoing, incoming) for kinds with
+        cross-shard links, outgoing being shard -> source ids and incoming
+        shard -> (sources, targets, global link index)."""
+        ids = np.array(self.store.ids, dtype=object)
+        shard_of = self.shard_of
+        shard = np.array([shard_of[i] for i in self.store.ids], dtype=np.int64)
+        layouts = [{"local": {}, "exchange": {}} for _ in range(self.shards)]
+        exchange_kinds = set()
+        for kind in self.links.kinds:
+            src, dst = self.links.pairs(kind)
+            seq = np.arange(len(src))
+            src_shard, dst_shard = shard[src], shard[dst]
+            for w, layout in enumerate(layouts):
+                inside = (src_shard == w) & (dst_shard == w)
+                layout["local"][kind] = (
+                    ids[src[inside]].tolist(),
+                    ids[dst[inside]].tolist(),
+                    seq[inside],
+                )
+            if not np.any(src_shard != dst_shard):
+                continue
+            exchange_kinds.add(kind)
+            for w, layout in enumerate(layouts):
+                outgoing, incoming = {}, {}
+                for other in range(self.shards):
+                    if other == w:
+                        continue
+                    out = (src_shard == w) & (dst_shard == other)
+                    if out.any():
+                        outgoing[other] = ids[src[out]].tolist()
+                    into = (src_shard == other) & (dst_shard == w)
+                    if into.any():
+                        incoming[other] = (
+                            ids[src[into]].tolist(),
+                            ids[dst[into]].tolist(),
+                            seq[into],
+                        )
+                layout["exchange"][kind] = (outgoing, incoming)
+        self._exchange_kinds = frozenset(exchange_kinds)
+        return layouts
+
+    # --- Processes ---
+    def start(self):
+        if self.started:
+            return
+        context = multiprocessing.get_context(self.config.get("start_method"))
+        event_types = [kind for kind in EVENT_TYPES if self.bus.wants(kind)]
+        for shard in range(self.shards):
+            parent, child = context.Pipe()
+            proc = context.Process(
+                target=_shard_main,
+                args=(
+                    child,
+                    self.config,
+                    self.rules,
+                    self._pending[shard],
+                    event_types,
+                ),
+                daemon=True,
+            )
+            proc.start()
+            child.close()
+            self._conns.append(parent)
+            self._procs.append(proc)
+        self._pending = [[] for _ in range(self.shards)]
+
+    def _recv(self, shard: int):
+        try:
+            message = self._conns[shard].recv()
+        except EOFError:
+            raise RuntimeError(f"Shard {shard} exited unexpectedly") from None
+        if message[0] == "error":
+            raise RuntimeError(f"Shard {shard} failed:\n{message[1]}")
+        return message
+
+    def close(self):
+        """Stops the workers and closes the bus."""
+        for conn in self._conns:
+            try:
+                conn.send(("stop",))
+            except (BrokenPipeError, OSError):
+                pass
+        for proc in self._procs:
+            proc.join(timeout=5)
+            if proc.is_alive():
+                proc.terminate()
+        for conn in self._conns:
+            conn.close()
+        self._conns, self._procs = [], []
+        self.bus.close()
+
+    def __enter__(self) -> "ShardedFlightOps":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # --- Simulation ---
+    def update(self):
+        self.start()
+        if self._roster_changed:
+            if self.position_links:
+                self._link_by_position()
+            for conn, layout in zip(self._conns, self._layouts()):
+                conn.send(("layout", layout["local"], layout["exchange"]))
+            self._roster_changed = False
+        for conn in self._conns:
+            conn.send(("tick",))
+        # Rule barriers, in the order every worker evaluates its rules
+        for rule in self.rules:
+            if rule.link not in self._exchange_kinds:
+                continue
+            fires = [self._recv(shard)[2] for shard in range(self.shards)]
+            for w, conn in enumerate(self._conns):
+                incoming = {i: f[w] for i, f in enumerate(fires) if w in f}
+                conn.send(("fire", rule.name, incoming))
+        totals = np.zeros(5)
+        events: List = []
+        for shard in range(self.shards):
+            _, shard_totals, shard_events = self._recv(shard)
+            totals += shard_totals
+            events += shard_events
+        self.flock_state = self._flock_summary(totals)
+        self.flock_history.append(self.flock_state)
+        self.timestep += 1
+        self.bus.publish_many(sorted(events, key=self._event_rank))
+        self.bus.flush()
+
+    def _event_rank(self, event) -> Sequence[int]:
+        kind = EVENT_TYPES.index(type(event))
+        return (kind, self._rule_rank[event.rule] if kind == 0 else 0)
+
+    def _flock_summary(self, totals: np.ndarray) -> FleetFlockSummary:
+        # FlockRollup.summary over the sum of the shards' running totals
+        n, type_ii, type_iii, scout_alerts, roost_pressure_sum = totals.tolist()
+        if n == 0:
+            return FleetFlockSummary(tick=self.timestep)
+        return FleetFlockSummary(
+            tick=self.timestep,
+            flights=int(n),
+            type_ii_fraction=type_ii / n,
+            type_iii_fraction=type_iii / n,
+            mean_roost_pressure=max(0.0, roost_pressure_sum / n),
+            scout_alerts=int(scout_alerts),
+        )
+
+    # --- Results ---
+    def records(self) -> List[Dict]:
+        """Every flight's export record, in single-core slot order."""
+        if not self.started:
+            self.start()
+        for conn in self._conns:
+            conn.send(("records",))
+        by_id = {}
+        for shard in range(self.shards):
+            for record in self._recv(shard)[1]:
+                by_id[record["id"]] = record
+        return [by_id[i] for i in self.store.ids]
+
+    def export_results(self, out_path):
+        with open(out_path, "w", encoding="utf-8") as f:
+            json.dump(self.records(), f, ensure_ascii=False, indent=2)
+        print(f"Exported results to {out_path}")
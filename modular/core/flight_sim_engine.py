@@ -4,10 +4,15 @@ import pandas as pd
 import time
 import argparse
 import os
+import warnings
 
-from .data_loader import load_stock_data, load_option_data
+from .data_loader import load_stock_data, load_iv_surface, load_event_data
 from .flight_path import compute_altitude_series
-from .fuel_gauge import compute_fuel_levels
+from .fuel_gauge import (
+    compute_fuel_levels,
+    generate_intraday_fuel_curve,
+    get_volume_profile,
+)
 from .stall_detector import detect_stalls
 from .turbulence_sensor import detect_iv_turbulence
 from .blackbox import write_log
@@ -16,8 +21,11 @@ from .synchronization import (
     estimate_price_displacement,
     estimate_volume_spike_ratio,
     estimate_volatility_expansion,
+    SynchronizationBatch,
 )
-from .crow_simulator import compute_flock_state
+from .sync_tracker import SynchronizationTracker
+from .crow_simulator import compute_flock_state, compute_flock_state_batch
+from .cvd_meter import CVDMeter
 
 # --- CLI Config ---
 parser = argparse.ArgumentParser()
@@ -36,6 +44,14 @@ parser.add_argument(
     choices=["markdown", "json"],
     help="Log output format",
 )
+parser.add_argument(
+    "--seed", type=int, default=None, help="Seed for synthetic intraday paths"
+)
+parser.add_argument(
+    "--compact-log",
+    action="store_true",
+    help="Write diagnostics as bit-flag codes instead of text",
+)
 args = parser.parse_args()
 MODE = args.mode
 TICKER = args.ticker
@@ -64,7 +80,6 @@ print("🛫 Takeoff complete!\n")
 
 # --- Load Data ---
 stock_df = load_stock_data(TICKER)
-option_df = load_option_data(TICKER)
 
 # --- Preprocess Stock Data ---
 stock_df["Date"] = pd.to_datetime(stock_df["Date"])
@@ -72,6 +87,26 @@ stock_df = stock_df.sort_values("Date")
 stock_df["Close/Last"] = pd.to_numeric(stock_df["Close/Last"], errors="coerce")
 stock_df["Volume"] = pd.to_numeric(stock_df["Volume"], errors="coerce")
 
+# --- CVD (bar-level approximation over the full history) ---
+cvd_series = CVDMeter().update_bars(
+    pd.to_numeric(stock_df["Open"], errors="coerce"),
+    pd.to_numeric(stock_df["High"], errors="coerce"),
+    pd.to_numeric(stock_df["Low"], errors="coerce"),
+    stock_df["Close/Last"],
+    stock_df["Volume"],
+)
+stock_df["CVD Acceleration"] = cvd_series.acceleration
+stock_df["CVD Trend Strong"] = cvd_series.trend_strong
+stock_df["CVD Price Bounded"] = cvd_series.price_bounded
+
+# --- IV Surface (aggregated once at ingest, ATM anchored on closes) ---
+iv_surface = load_iv_surface(
+    TICKER, spots=dict(zip(stock_df["Date"], stock_df["Close/Last"]))
+)
+
+# --- Event Calendar (FOMC/CPI/earnings) ---
+event_calendar = load_event_data()
+
 from .candle_interpreter import apply_interpretation
 
 if MODE == "daily":
@@ -84,12 +119,20 @@ if MODE == "daily":
         sampled = stock_df.tail(5).copy()
     prices = sampled["Close/Last"]
     volumes = sampled["Volume"]
-    iv_series = pd.to_numeric(option_df["IV"], errors="coerce").dropna()
+    iv_series = pd.Series(iv_surface.atm_series(sampled["Date"]))
+    # Snapshots cover only the latest option folders: dates before them stay
+    # NaN, which the stall/turbulence sensors and sync inputs read as no IV
+    # signal rather than filling in IV that was never quoted
+    missing_iv = int(iv_series.isna().sum())
+    if missing_iv:
+        warnings.warn(
+            f"No ATM IV quoted on or before {missing_iv} of {len(iv_series)} "
+            "sampled dates; their IV signals are masked"
+        )
     stalls = detect_stalls(prices, sampled, iv_series)
     turbulence = detect_iv_turbulence(iv_series, sampled)
-    from .fuel_gauge import generate_intraday_fuel_curve
-
-    fuel = generate_intraday_fuel_curve(len(sampled))
+    # Daily bars carry real volume: fuel is the share of volume not yet traded
+    fuel = compute_fuel_levels(volumes)
     # For daily, use close-to-close gain as "altitude"
     altitudes = (prices.pct_change().fillna(0).cumsum() * 100).tolist()
     timestamps = (
@@ -110,15 +153,26 @@ elif MODE == "intraday":
         sampled = stock_df.tail(1).copy()
     from .intraday_emulator import simulate_intraday_path
     from .microturbulence import estimate_intraday_iv
-    from .fuel_gauge import generate_intraday_fuel_curve
 
     candle = sampled.iloc[0]
     intraday_flight = simulate_intraday_path(candle)  # returns dict
     timestamps = list(intraday_flight.keys())
     altitudes = list(intraday_flight.values())
-    fuel = generate_intraday_fuel_curve(len(altitudes))
+    # Profile fitted once per ticker from intraday bars; daily bars carry no
+    # intraday shape, so they are not fitted (U-shape unless already cached)
+    intraday_bars = (
+        stock_df
+        if (stock_df["Date"] != stock_df["Date"].dt.normalize()).any()
+        else None
+    )
+    fuel = generate_intraday_fuel_curve(
+        len(altitudes), profile=get_volume_profile(TICKER, intraday_bars)
+    )
     stalls = [False for _ in altitudes]  # Placeholder: no EMA stalls in this mode yet
-    turbulence = estimate_intraday_iv(option_df.tail(1))[: len(altitudes)]
+    # Dates before the loaded snapshots have no ATM IV: anchor_iv falls back
+    turbulence = estimate_intraday_iv(
+        iv_surface.anchor_iv(candle["Date"]), steps=len(altitudes), rng=args.seed
+    )
     # Infer flight phases from the full candle
     flight_phases = [apply_interpretation(sampled).iloc[0]["Flight Phase"]] * len(
         altitudes
@@ -127,6 +181,14 @@ elif MODE == "intraday":
 else:
     raise ValueError(f"Unknown mode: {MODE}")
 
+# --- Event proximity per step (daily bars are stamped at the 16:00 close) ---
+if MODE == "daily":
+    step_times = sampled["Date"] + pd.Timedelta(hours=16)
+else:
+    session_day = sampled["Date"].iloc[0].strftime("%Y-%m-%d")
+    step_times = pd.to_datetime([f"{session_day} {t}" for t in timestamps])
+event_minutes, event_types = event_calendar.proximity_labels(TICKER, step_times)
+
 # --- Synchronization Analysis ---
 sync_result = compute_synchronization(
     price_displacement=estimate_price_displacement(prices.tolist())
@@ -140,29 +202,48 @@ sync_result = compute_synchronization(
     )
     if MODE == "daily"
     else 0.0,
-    cvd_acceleration=0.0,
+    cvd_acceleration=float(sampled["CVD Acceleration"].iloc[-1]),
     prior_cruise_deviation=abs(altitudes[-1] - altitudes[0]) / 100.0
     if len(altitudes) > 1
     else 0.0,
-    cvd_trend_strong=False,
-    price_bounded_while_cvd_trends=False,
-    event_proximity_minutes=float("inf"),
-    event_type="unknown",
+    cvd_trend_strong=bool(sampled["CVD Trend Strong"].iloc[-1]),
+    price_bounded_while_cvd_trends=bool(sampled["CVD Price Bounded"].iloc[-1]),
+    event_proximity_minutes=float(event_minutes[-1]),
+    event_type=event_types[-1],
 )
 
 flock_state = compute_flock_state(sync_result)
 
-sync_output = sync_result.to_dict()
-sync_output["telemetry"] = []
-for i in range(len(altitudes)):
-    step_sync = compute_synchronization(
-        price_displacement=altitudes[i] - altitudes[i - 1] if i > 0 else 0.0,
-        volume_spike_ratio=estimate_volume_spike_ratio(volumes.tolist()[: i + 1])
-        if MODE == "daily"
-        else 1.0,
-        volatility_expansion=0.0,
+sync_output = sync_result.to_dict(compact=args.compact_log)
+# --- Per-step synchronization (rolling state, one result per bar) ---
+tracker = SynchronizationTracker()
+if MODE == "daily":
+    step_inputs = {
+        "volume": volumes.tolist(),
+        "spread": (
+            pd.to_numeric(sampled["High"], errors="coerce")
+            - pd.to_numeric(sampled["Low"], errors="coerce")
+        ).tolist(),
+        "iv": iv_series.tolist(),
+        "cvd_acceleration": sampled["CVD Acceleration"].tolist(),
+        "cvd_trend_strong": sampled["CVD Trend Strong"].tolist(),
+        "price_bounded_while_cvd_trends": sampled["CVD Price Bounded"].tolist(),
+    }
+else:
+    step_inputs = {"iv": list(turbulence)}
+step_sync = [
+    tracker.update(
+        altitudes[i],
+        event_proximity_minutes=float(event_minutes[i]),
+        event_type=event_types[i],
+        **{name: values[i] for name, values in step_inputs.items()},
     )
-    sync_output["telemetry"].append(step_sync.to_dict())
+    for i in range(len(altitudes))
+]
+# Per-step entries only feed the S_c/regime columns, so keep them compact
+sync_output["telemetry"] = [r.to_dict(compact=True) for r in step_sync]
+step_flock = compute_flock_state_batch(SynchronizationBatch.from_results(step_sync))
+sync_output["flock_telemetry"] = step_flock.to_dicts(compact=True)
 
 print(f"\nSynchronization Coefficient: {sync_result.synchronization_coefficient:.4f}")
 print(f"Regime: {sync_result.regime_label}")
@@ -218,29 +299,6 @@ write_log(
     sync_data=sync_output,
 )
 
-print("\nStall Events:")
-print(stalls)
-print(f"Total Stalls: {sum(stalls)} / {len(stalls)}")
-
-# --- Write Output ---
-write_log(
-    filepath=OUTPUT_PATH,
-    ticker=TICKER,
-    date=(
-        sim_date.strftime("%m/%d/%Y")
-        if sim_date is not None
-        else datetime.today().strftime("%m/%d/%Y")
-    ),
-    mode=mode_label,
-    gains=altitudes,
-    fuel=fuel,
-    stalls=stalls,
-    turbulence=turbulence,
-    timestamps=timestamps,
-    flight_phases=flight_phases,
-    format=LOG_FORMAT,
-)
-
 print(f"[✓] Flight log saved to {OUTPUT_PATH}")
 print(f"🔗 Sample Log: [`{OUTPUT_PATH}`](./{OUTPUT_PATH})")
 
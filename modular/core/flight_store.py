@@ -0,0 +1,485 @@
+# flight_store.py
+"""
+Struct-of-arrays flight state for FlightOpsCore.
+
+Each flight owns a slot; numeric state lives in per-field NumPy arrays so the
+per-mode update kernels run as whole-array operations instead of a Python loop
+over FlightState objects. Phases are stored as small integer codes (names in
+``phase_names``) and the boolean status flags as bits of ``flags``.
+
+FlightView exposes one slot under the FlightState attribute names for code
+that works a flight at a time; reads and writes go straight to the arrays.
+Telemetry history lives in a TelemetryRing sharing the slot numbering.
+
+Slots stay dense: remove() moves the last flight into the freed slot, and the
+id -> slot map and per-mode slot indexes are kept up to date on every add and
+remove, so neither lookups nor the per-tick mode split scan the roster.
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .sim_random import flight_key
+from .telemetry_ring import TelemetryRing
+
+MODES = ("market", "aircraft", "traffic")
+MODE_CODES = {m: i for i, m in enumerate(MODES)}
+
+PHASES = (
+    "Ground_Taxi",
+    "Climb",
+    "Cruise",
+    "Taxi",
+    "GoAround",
+    "Holding",
+    "ClearedToLand",
+)
+
+
+class Flag:
+    STALL = 1 << 0
+    TURBULENCE = 1 << 1
+    CLEARED_TO_LAND = 1 << 2
+    CONFLICT = 1 << 3  # inside another flight's separation minimum
+
+
+# status_flags keys backed by flag bits
+STATUS_FLAGS = {"stall": Flag.STALL, "turbulence": Flag.TURBULENCE}
+
+# Per-slot columns: name -> dtype
+COLUMNS = {
+    "price": np.float64,
+    "altitude": np.float64,
+    "velocity": np.float64,
+    "heading": np.float64,  # degrees clockwise from north
+    "x": np.float64,  # position east, NM; NaN when the flight has none
+    "y": np.float64,  # position north, NM
+    "mode": np.int8,
+    "phase": np.int16,
+    "flags": np.uint8,
+    "ticks": np.int32,  # per-flight update counter (market and traffic)
+    "holding_ticks": np.int32,  # 0 while not tracked as holding
+    "mode_pos": np.int64,  # position of the slot in its mode index
+    "rng_key": np.uint64,  # sim_random.flight_key(id)
+}
+
+
+class FlightStore:
+    """Growable column store; ``n`` slots are in use, arrays hold ``capacity``."""
+
+    def __init__(self, capacity: int = 1024, telemetry_depth: int = 10):
+        self.n = 0
+        self.capacity = 0
+        self.version = 0  # bumped on every roster change (add/remove/load)
+        self.telemetry = TelemetryRing(telemetry_depth, 0)
+        self.phase_names: List[str] = list(PHASES)
+        self._phase_codes = {p: i for i, p in enumerate(PHASES)}
+        for name, dtype in COLUMNS.items():
+            setattr(self, name, np.zeros(0, dtype=dtype))
+        self.reserve(max(capacity, 1))
+        # Per-slot Python objects
+        self.ids: List[str] = []
+        self.symbols: List[Optional[str]] = []
+        self.origins: List[str] = []
+        self.destinations: List[str] = []
+        self.sync: List = []
+        self._views: List["FlightView"] = []
+        self.index: Dict[str, int] = {}  # flight id -> slot
+        self._mode_slots = [np.zeros(16, dtype=np.int64) for _ in MODES]
+        self._mode_count = [0] * len(MODES)
+
+    def __len__(self) -> int:
+        return self.n
+
+    def reserve(self, capacity: int):
+        if capacity <= self.capacity:
+            return
+        capacity = max(capacity, 2 * self.capacity)
+        for name, dtype in COLUMNS.items():
+            grown = np.zeros(capacity, dtype=dtype)
+            grown[: self.n] = getattr(self, name)[: self.n]
+            setattr(self, name, grown)
+        self.capacity = capacity
+
+    def phase_code(self, phase: str) -> int:
+        """Code for ``phase``; names outside PHASES are registered on first use."""
+        code = self._phase_codes.get(phase)
+        if code is None:
+            code = len(self.phase_names)
+            self.phase_names.append(phase)
+            self._phase_codes[phase] = code
+        return code
+
+    def column(self, name: str) -> np.ndarray:
+        """Live view of the in-use part of a column."""
+        return getattr(self, name)[: self.n]
+
+    def slots(self, mode: str) -> np.ndarray:
+        """Slots of every ``mode`` flight, in load order until a removal swaps
+        one in. The view is invalidated by the next add or remove."""
+        code = MODE_CODES[mode]
+        return self._mode_slots[code][: self._mode_count[code]]
+
+    def slot_of(self, flight_id: str) -> int:
+        return self.index[flight_id]
+
+    def _index_mode(self, code: int, slot: int):
+        slots, count = self._mode_slots[code], self._mode_count[code]
+        if count == len(slots):
+            slots = self._mode_slots[code] = np.resize(slots, 2 * count)
+        slots[count] = slot
+        self.mode_pos[slot] = count
+        self._mode_count[code] = count + 1
+
+    def _unindex_mode(self, code: int, slot: int):
+        slots = self._mode_slots[code]
+        pos, last = self.mode_pos[slot], self._mode_count[code] - 1
+        moved = slots[last]
+        slots[pos] = moved
+        self.mode_pos[moved] = pos
+        self._mode_count[code] = last
+
+    def add(self, flight) -> int:
+        """Copies a FlightState (or anything with its attributes) into a new
+        slot and returns the slot. Telemetry starts empty; any history on
+        ``flight`` is not carried over."""
+        if flight.mode not in MODE_CODES:
+            raise ValueError(f"Unknown flight mode: {flight.mode}")
+        if flight.id in self.index:
+            raise ValueError(f"Duplicate flight id: {flight.id}")
+        slot = self.n
+        self.reserve(slot + 1)
+        self.n += 1
+        # Telemetry is depth rows per slot: sized by flights, not reservation
+        self.telemetry.resize(self.n)
+        self.price[slot] = flight.price
+        self.altitude[slot] = flight.altitude
+        self.velocity[slot] = flight.velocity
+        self.heading[slot] = flight.heading
+        position = flight.position or {}
+        self.x[slot] = position.get("x", np.nan)
+        self.y[slot] = position.get("y", np.nan)
+        self.mode[slot] = MODE_CODES[flight.mode]
+        self.phase[slot] = self.phase_code(flight.phase)
+        flags = 0
+        for key, bit in STATUS_FLAGS.items():
+            if flight.status_flags.get(key):
+                flags |= bit
+        if getattr(flight, "cleared_to_land", False):
+            flags |= Flag.CLEARED_TO_LAND
+        self.flags[slot] = flags
+        self.ticks[slot] = getattr(flight, "tick", 0)
+        self.holding_ticks[slot] = getattr(flight, "holding_ticks", 0)
+        self.rng_key[slot] = flight_key(flight.id)
+        self.ids.append(flight.id)
+        self.symbols.append(flight.symbol)
+        self.origins.append(flight.origin)
+        self.destinations.append(flight.destination)
+        self.sync.append(flight.sync)
+        self._views.append(FlightView(self, slot))
+        self.index[flight.id] = slot
+        self._index_mode(MODE_CODES[flight.mode], slot)
+        self.version += 1
+        return slot
+
+    def add_many(self, flights: Iterable) -> List[int]:
+        flights = list(flights)
+        self.reserve(self.n + len(flights))
+        return [self.add(f) for f in flights]
+
+    def load_slots(
+        self,
+        columns: Dict[str, np.ndarray],
+        ids: Sequence[str],
+        symbols: Sequence[Optional[str]],
+        origins: Sequence[str],
+        destinations: Sequence[str],
+        sync: Sequence,
+        mode_slots: Sequence[np.ndarray],
+    ):
+        """Bulk add() for an empty store (checkpoint restore): every column
+        (including ``mode_pos``) and per-mode slot order come from the caller
+        instead of being rebuilt one flight at a time."""
+        if self.n:
+            raise ValueError("load_slots needs an empty store")
+        n = len(ids)
+        self.reserve(n)
+        for name in COLUMNS:
+            getattr(self, name)[:n] = columns[name]
+        self.n = n
+        self.telemetry.resize(n)
+        self.ids = list(ids)
+        self.symbols = list(symbols)
+        self.origins = list(origins)
+        self.destinations = list(destinations)
+        self.sync = list(sync)
+        self._views = [FlightView(self, slot) for slot in range(n)]
+        self.index = {flight_id: slot for slot, flight_id in enumerate(self.ids)}
+        for code, slots in enumerate(mode_slots):
+            held = np.zeros(max(16, len(slots)), dtype=np.int64)
+            held[: len(slots)] = slots
+            self._mode_slots[code] = held
+            self._mode_count[code] = len(slots)
+        self.version += 1
+
+    def remove(self, flight_id: str) -> int:
+        """Removes a flight in O(1) by moving the last slot into its place.
+        Returns the freed slot (now holding the moved flight, if any). Views
+        of the removed flight are detached (slot None)."""
+        slot = self.index.pop(flight_id)
+        self._unindex_mode(int(self.mode[slot]), slot)
+        self._views[slot].slot = None
+        last = self.n - 1
+        if slot != last:
+            for name in COLUMNS:
+                column = getattr(self, name)
+                column[slot] = column[last]
+            for values in self._slot_lists():
+                values[slot] = values[last]
+            self.telemetry.move(last, slot)
+            self._views[slot].slot = slot
+            self.index[self.ids[slot]] = slot
+            self._mode_slots[self.mode[slot]][self.mode_pos[slot]] = slot
+        for values in self._slot_lists():
+            values.pop()
+        self.telemetry.clear(last)
+        self.n = last
+        self.version += 1
+        return slot
+
+    def _slot_lists(self) -> Tuple[List, ...]:
+        return (
+            self.ids,
+            self.symbols,
+            self.origins,
+            self.destinations,
+            self.sync,
+            self._views,
+        )
+
+    def view(self, slot: int) -> "FlightView":
+        return self._views[slot]
+
+    def views(self, slots: Optional[Iterable[int]] = None) -> List["FlightView"]:
+        if slots is None:
+            return list(self._views)
+        return [self._views[i] for i in slots]
+
+    def position(self, slot: int) -> Dict[str, float]:
+        """{"x", "y"} in NM, or {} for a flight without a position."""
+        x, y = float(self.x[slot]), float(self.y[slot])
+        return {} if np.isnan(x) else {"x": x, "y": y}
+
+    def status_flags(self, slot: int) -> Dict[str, bool]:
+        bits = int(self.flags[slot])
+        return {key: bool(bits & bit) for key, bit in STATUS_FLAGS.items()}
+
+    def telemetry_records(self, slot: int) -> List[Dict]:
+        return self.telemetry.records(slot, self.phase_names, STATUS_FLAGS)
+
+    def record(self, slot: int) -> Dict:
+        """One flight as a plain dict: the FlightState fields plus the per-mode
+        counters and ATC flags (``tick``, ``holding_ticks``,
+        ``cleared_to_land``, ``conflict``)."""
+        return {
+            "id": self.ids[slot],
+            "mode": MODES[self.mode[slot]],
+            "symbol": self.symbols[slot],
+            "origin": self.origins[slot],
+            "destination": self.destinations[slot],
+            "price": float(self.price[slot]),
+            "altitude": float(self.altitude[slot]),
+            "velocity": float(self.velocity[slot]),
+            "heading": float(self.heading[slot]),
+            "phase": self.phase_names[self.phase[slot]],
+            "position": self.position(slot),
+            "telemetry": self.telemetry_records(slot),
+            "status_flags": self.status_flags(slot),
+            "tick": int(self.ticks[slot]),
+            "holding_ticks": int(self.holding_ticks[slot]),
+            "cleared_to_land": bool(self.flags[slot] & Flag.CLEARED_TO_LAND),
+            "conflict": bool(self.flags[slot] & Flag.CONFLICT),
+        }
+
+
+class _StatusFlags:
+    """dict-like access to one slot's status flag bits."""
+
+    __slots__ = ("_store", "_slot")
+
+    def __init__(self, store: FlightStore, slot: int):
+        self._store = store
+        self._slot = slot
+
+    def __getitem__(self, key: str) -> bool:
+        return bool(self._store.flags[self._slot] & STATUS_FLAGS[key])
+
+    def __setitem__(self, key: str, value: bool):
+        bit = STATUS_FLAGS[key]
+        if value:
+            self._store.flags[self._slot] |= bit
+        else:
+            self._store.flags[self._slot] &= ~np.uint8(bit)
+
+    def get(self, key: str, default=None):
+        return self[key] if key in STATUS_FLAGS else default
+
+    def __iter__(self):
+        return iter(STATUS_FLAGS)
+
+    def __len__(self) -> int:
+        return len(STATUS_FLAGS)
+
+    def keys(self):
+        return STATUS_FLAGS.keys()
+
+    def items(self):
+        return self._store.status_flags(self._slot).items()
+
+    def __repr__(self) -> str:
+        return repr(self._store.status_flags(self._slot))
+
+
+class _Position:
+    """dict-like, write-through access to one slot's {"x", "y"} position
+    (empty when the flight has none). Only "x" and "y" can be set; setting
+    one coordinate of an empty position leaves the other NaN."""
+
+    __slots__ = ("_store", "_slot")
+
+    def __init__(self, store: FlightStore, slot: int):
+        self._store = store
+        self._slot = slot
+
+    def __getitem__(self, key: str) -> float:
+        return self._store.position(self._slot)[key]
+
+    def __setitem__(self, key: str, value: float):
+        if key not in ("x", "y"):
+            raise KeyError(key)
+        getattr(self._store, key)[self._slot] = value
+
+    def get(self, key: str, default=None):
+        return self._store.position(self._slot).get(key, default)
+
+    def __contains__(self, key) -> bool:
+        return key in self._store.position(self._slot)
+
+    def __iter__(self):
+        return iter(self._store.position(self._slot))
+
+    def __len__(self) -> int:
+        return len(self._store.position(self._slot))
+
+    def keys(self):
+        return self._store.position(self._slot).keys()
+
+    def items(self):
+        return self._store.position(self._slot).items()
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, _Position):
+            other = other._store.position(other._slot)
+        return self._store.position(self._slot) == other
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return repr(self._store.position(self._slot))
+
+
+def _column_property(name: str):
+    def getter(self):
+        return float(getattr(self.store, name)[self.slot])
+
+    def setter(self, value):
+        getattr(self.store, name)[self.slot] = value
+
+    return property(getter, setter)
+
+
+def _list_property(name: str):
+    def getter(self):
+        return getattr(self.store, name)[self.slot]
+
+    def setter(self, value):
+        getattr(self.store, name)[self.slot] = value
+
+    return property(getter, setter)
+
+
+class FlightView:
+    """A FlightState-shaped window onto one FlightStore slot."""
+
+    __slots__ = ("store", "slot")
+
+    def __init__(self, store: FlightStore, slot: int):
+        self.store = store
+        self.slot = slot
+
+    price = _column_property("price")
+    altitude = _column_property("altitude")
+    velocity = _column_property("velocity")
+    heading = _column_property("heading")
+    id = _list_property("ids")
+    symbol = _list_property("symbols")
+    origin = _list_property("origins")
+    destination = _list_property("destinations")
+    sync = _list_property("sync")
+
+    @property
+    def mode(self) -> str:
+        return MODES[self.store.mode[self.slot]]
+
+    @property
+    def phase(self) -> str:
+        return self.store.phase_names[self.store.phase[self.slot]]
+
+    @phase.setter
+    def phase(self, value: str):
+        self.store.phase[self.slot] = self.store.phase_code(value)
+
+    @property
+    def position(self) -> _Position:
+        return _Position(self.store, self.slot)
+
+    @position.setter
+    def position(self, value: Dict[str, float]):
+        value = value or {}
+        self.store.x[self.slot] = value.get("x", np.nan)
+        self.store.y[self.slot] = value.get("y", np.nan)
+
+    @property
+    def telemetry(self) -> List[Dict]:
+        # Materialized copy; the history itself stays in the ring
+        return self.store.telemetry_records(self.slot)
+
+    @property
+    def status_flags(self) -> _StatusFlags:
+        return _StatusFlags(self.store, self.slot)
+
+    @property
+    def tick(self) -> int:
+        return int(self.store.ticks[self.slot])
+
+    @property
+    def holding_ticks(self) -> int:
+        return int(self.store.holding_ticks[self.slot])
+
+    @property
+    def cleared_to_land(self) -> bool:
+        return bool(self.store.flags[self.slot] & Flag.CLEARED_TO_LAND)
+
+    @property
+    def conflict(self) -> bool:
+        return bool(self.store.flags[self.slot] & Flag.CONFLICT)
+
+    def to_dict(self) -> Dict:
+        return self.store.record(self.slot)
+
+    def __repr__(self) -> str:
+        record = self.to_dict()
+        del record["telemetry"]
+        fields = ", ".join(f"{k}={v!r}" for k, v in record.items())
+        return f"FlightView({fields})"
@@ -1,11 +1,122 @@
 # fuel_gauge.py
+"""
+Fuel (liquidity) remaining over a session, as a percentage.
+
+When bars with real volume exist, fuel is the share of session volume not yet
+traded. Otherwise it follows an intraday volume profile: a per-ticker curve
+fitted from intraday bar history, or a default U-shape (heavy open and
+close, quiet midday). Profiles are stored as cumulative volume share on a
+one-minute grid and cached per ticker, so any resolution is a single interp.
+"""
+
+from typing import Dict, Optional
+
+import numpy as np
 import pandas as pd
 
-def compute_fuel_levels(volumes: pd.Series) -> list:
+SESSION_MINUTES = 390  # 09:30 - 16:00
+SESSION_OPEN = pd.Timedelta(hours=9, minutes=30)
+
+_PROFILE_CACHE: Dict[str, np.ndarray] = {}
+
+
+def fuel_from_volume(volumes) -> np.ndarray:
+    volumes = np.nan_to_num(np.asarray(volumes, dtype=float))
     total = volumes.sum()
-    fuel = ((total - volumes.cumsum()) / total * 100).round(1).tolist()
-    return fuel
+    if total == 0:
+        return np.full(len(volumes), 100.0)
+    return (total - np.cumsum(volumes)) / total * 100
+
+
+def compute_fuel_levels(volumes: pd.Series) -> list:
+    return np.round(fuel_from_volume(volumes), 1).tolist()
+
+
+def u_shaped_profile(
+    minutes: int = SESSION_MINUTES,
+    open_weight: float = 2.0,
+    close_weight: float = 2.5,
+    decay: float = 0.08,
+) -> np.ndarray:
+    """Cumulative volume share on a (minutes + 1) grid, 0 at open and 1 at close."""
+    x = (np.arange(minutes) + 0.5) / minutes
+    rate = (
+        1.0 + open_weight * np.exp(-x / decay) + close_weight * np.exp(-(1 - x) / decay)
+    )
+    cum = np.concatenate(([0.0], np.cumsum(rate)))
+    return cum / cum[-1]
+
+
+def _fit_sessions(bars: pd.DataFrame, minutes: int) -> Optional[np.ndarray]:
+    # Mean cumulative share over sessions with volume; None when there are none
+    ts = pd.to_datetime(bars["Date"])
+    offset = (ts - ts.dt.normalize() - SESSION_OPEN).dt.total_seconds() / 60.0
+    frame = pd.DataFrame(
+        {
+            "day": ts.dt.normalize(),
+            "minute": offset,
+            "volume": pd.to_numeric(bars["Volume"], errors="coerce").fillna(0),
+        }
+    )
+    frame = frame[(frame["minute"] > 0) & (frame["minute"] <= minutes)]
+    grid = np.arange(minutes + 1, dtype=float)
+    curves = []
+    for _, day in frame.sort_values("minute").groupby("day"):
+        total = day["volume"].sum()
+        if total <= 0:
+            continue
+        x = np.concatenate(([0.0], day["minute"].values))
+        y = np.concatenate(([0.0], day["volume"].cumsum().values / total))
+        curves.append(np.interp(grid, x, y, right=1.0))
+    return np.mean(curves, axis=0) if curves else None
+
+
+def fit_volume_profile(
+    bars: pd.DataFrame, minutes: int = SESSION_MINUTES
+) -> np.ndarray:
+    """Averages each session's cumulative volume share from intraday bars.
+
+    ``bars`` needs a "Date" column of bar end timestamps and a "Volume" column.
+    Bars outside regular hours are ignored; with no regular-hours volume (e.g.
+    daily bars) the default U-shape is returned.
+    """
+    profile = _fit_sessions(bars, minutes)
+    return u_shaped_profile(minutes) if profile is None else profile
+
+
+def get_volume_profile(
+    ticker: str, bars: Optional[pd.DataFrame] = None, refit: bool = False
+) -> np.ndarray:
+    """Profile for ``ticker``, fitted once and cached.
+
+    ``bars`` are fitted on a cache miss (or with ``refit``); the cached fit is
+    returned otherwise. Without a fit (no bars, or no intraday volume in them)
+    the default U-shape is returned and never cached, so later bars still fit.
+    """
+    key = ticker.upper()
+    profile = _PROFILE_CACHE.get(key)
+    if bars is not None and (profile is None or refit):
+        fitted = _fit_sessions(bars, SESSION_MINUTES)
+        if fitted is not None:
+            profile = _PROFILE_CACHE[key] = fitted
+    return profile if profile is not None else u_shaped_profile()
+
+
+def clear_profile_cache():
+    _PROFILE_CACHE.clear()
+
+
+def intraday_fuel_curve(steps: int, profile: Optional[np.ndarray] = None) -> np.ndarray:
+    """Fuel at ``steps`` evenly spaced points from the open (100) to the close (0)."""
+    if profile is None:
+        profile = u_shaped_profile()
+    if steps < 2:
+        return np.full(steps, 100.0)
+    grid = np.linspace(0.0, 1.0, len(profile))
+    burned = np.interp(np.linspace(0.0, 1.0, steps), grid, profile)
+    return (1.0 - burned) * 100
+
 
 # intraday_fuel_model.py
-def generate_intraday_fuel_curve(steps=5) -> list:
-    return [round(100 * (1 - i / (steps - 1)), 1) for i in range(steps)]
+def generate_intraday_fuel_curve(steps=5, profile=None) -> list:
+    return np.round(intraday_fuel_curve(steps, profile), 1).tolist()
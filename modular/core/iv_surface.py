@@ -0,0 +1,232 @@
+# iv_surface.py
+"""
+Date-aligned implied volatility surface built from option chain snapshots.
+
+Each snapshot (one CBOE quotedata CSV per date folder) is reduced once at
+ingest into a dense ``dates x expiries x strikes`` IV cube with sorted axes.
+ATM IV per date and the ATM term structure are precomputed, so the sensors
+read a per-date value instead of re-aggregating raw option rows per flight.
+"""
+
+import warnings
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+EXPIRY_FORMAT = "%a %b %d %Y"  # e.g. "Fri Jun 20 2025"
+DEFAULT_ATM_IV = 0.20  # anchor_iv fallback when no snapshot is quoted at all
+
+
+def _to_date(value) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, np.datetime64):
+        return value.astype("datetime64[D]").item()
+    return pd.Timestamp(value).date()
+
+
+def _interp_strike(strikes: List[float], row: np.ndarray, strike: float) -> float:
+    """Linear interpolation of one expiry's IV smile at ``strike``.
+
+    The bracketing strikes are located by binary search; missing (NaN) quotes
+    are skipped by walking outward to the nearest quoted strikes.
+    """
+    n = len(strikes)
+    i = bisect_left(strikes, strike)
+    lo = i - 1
+    while lo >= 0 and row[lo] != row[lo]:
+        lo -= 1
+    hi = i
+    while hi < n and row[hi] != row[hi]:
+        hi += 1
+    if lo < 0 and hi >= n:
+        return float("nan")
+    if lo < 0:
+        return float(row[hi])
+    if hi >= n:
+        return float(row[lo])
+    k_lo, k_hi = strikes[lo], strikes[hi]
+    if k_hi == k_lo:
+        return float(row[lo])
+    w = (strike - k_lo) / (k_hi - k_lo)
+    return float(row[lo] + w * (row[hi] - row[lo]))
+
+
+@dataclass
+class IVSurface:
+    dates: np.ndarray  # datetime64[D], sorted ascending
+    expiries: np.ndarray  # datetime64[D], sorted ascending
+    strikes: np.ndarray  # float64, sorted ascending
+    iv: np.ndarray  # float64 (dates, expiries, strikes), NaN where unquoted
+    spots: np.ndarray  # float64 (dates,), underlying reference per snapshot
+
+    atm: np.ndarray = field(init=False)  # (dates,) front-expiry ATM IV
+    atm_term: np.ndarray = field(init=False)  # (dates, expiries) ATM IV
+    _date_slot: Dict[date, int] = field(init=False, repr=False)
+    _strike_list: List[float] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self._strike_list = self.strikes.tolist()
+        self._date_slot = {d: i for i, d in enumerate(self.dates.tolist())}
+        n_dates, n_exp = len(self.dates), len(self.expiries)
+        self.atm_term = np.full((n_dates, n_exp), np.nan)
+        self.atm = np.full(n_dates, np.nan)
+        for d in range(n_dates):
+            for e in range(n_exp):
+                if self.expiries[e] < self.dates[d]:
+                    continue
+                self.atm_term[d, e] = _interp_strike(
+                    self._strike_list, self.iv[d, e], self.spots[d]
+                )
+            quoted = np.flatnonzero(~np.isnan(self.atm_term[d]))
+            if len(quoted):
+                self.atm[d] = self.atm_term[d, quoted[0]]
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def _slot(self, snapshot_date) -> Optional[int]:
+        """Latest snapshot on or before the date; None before the first one
+        (a later snapshot would leak future IV into the past)."""
+        key = _to_date(snapshot_date)
+        slot = self._date_slot.get(key)
+        if slot is None:
+            slot = int(np.searchsorted(self.dates, np.datetime64(key), "right")) - 1
+            if slot < 0:
+                return None
+        return slot
+
+    def atm_iv(self, snapshot_date) -> float:
+        slot = self._slot(snapshot_date)
+        return float("nan") if slot is None else float(self.atm[slot])
+
+    def latest_atm_iv(self) -> float:
+        quoted = self.atm[~np.isnan(self.atm)]
+        return float(quoted[-1]) if len(quoted) else float("nan")
+
+    def anchor_iv(self, snapshot_date) -> float:
+        """ATM IV to anchor synthetic intraday paths on.
+
+        A date without a quoted ATM IV (e.g. before the first snapshot) falls
+        back to latest_atm_iv(), or DEFAULT_ATM_IV when nothing is quoted,
+        with a warning.
+        """
+        iv = self.atm_iv(snapshot_date)
+        if iv == iv:
+            return iv
+        fallback = self.latest_atm_iv()
+        if fallback != fallback:
+            fallback = DEFAULT_ATM_IV
+        warnings.warn(
+            f"No ATM IV quoted on or before {_to_date(snapshot_date)}; "
+            f"anchoring intraday IV on {fallback:.4f}",
+            stacklevel=2,
+        )
+        return fallback
+
+    def term_structure(self, snapshot_date) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns (expiries, ATM IV) for the snapshot, unquoted expiries dropped."""
+        slot = self._slot(snapshot_date)
+        if slot is None:
+            return self.expiries[:0], np.zeros(0)
+        row = self.atm_term[slot]
+        quoted = ~np.isnan(row)
+        return self.expiries[quoted], row[quoted]
+
+    def iv_at(self, snapshot_date, expiry, strike: float) -> float:
+        slot = self._slot(snapshot_date)
+        if slot is None:
+            return float("nan")
+        e = int(np.searchsorted(self.expiries, np.datetime64(_to_date(expiry))))
+        if e >= len(self.expiries):
+            return float("nan")
+        return _interp_strike(self._strike_list, self.iv[slot, e], strike)
+
+    def atm_series(self, dates: Iterable) -> np.ndarray:
+        """ATM IV aligned to ``dates`` (as-of the latest snapshot on or before;
+        NaN before the first snapshot)."""
+        if len(self.dates) == 0:
+            return np.full(len(list(dates)), np.nan)
+        query = np.asarray(pd.to_datetime(pd.Series(dates)), dtype="datetime64[D]")
+        slots = np.searchsorted(self.dates, query, side="right") - 1
+        return np.where(slots >= 0, self.atm[np.maximum(slots, 0)], np.nan)
+
+
+def _snapshot_iv(df: pd.DataFrame) -> pd.DataFrame:
+    expiry = pd.to_datetime(
+        df["Expiration Date"], format=EXPIRY_FORMAT, errors="coerce"
+    )
+    if expiry.isna().all():
+        expiry = pd.to_datetime(df["Expiration Date"], errors="coerce")
+    iv_cols = [c for c in ("IV", "IV.1") if c in df.columns]
+    quotes = df[iv_cols].apply(pd.to_numeric, errors="coerce")
+    # CBOE writes 0 for strikes without a quote
+    quotes = quotes.where(quotes > 0)
+    out = pd.DataFrame(
+        {
+            "expiry": expiry.values.astype("datetime64[D]"),
+            "strike": pd.to_numeric(df["Strike"], errors="coerce"),
+            "iv": quotes.mean(axis=1),
+        }
+    ).dropna()
+    return out.groupby(["expiry", "strike"], as_index=False)["iv"].mean()
+
+
+def _infer_spot(df: pd.DataFrame, surface_rows: pd.DataFrame) -> float:
+    # Call delta closest to 0.5 marks the at-the-money strike
+    if "Delta" in df.columns:
+        delta = pd.to_numeric(df["Delta"], errors="coerce")
+        strike = pd.to_numeric(df["Strike"], errors="coerce")
+        valid = delta.notna() & strike.notna() & (delta > 0)
+        if valid.any():
+            return float(strike[valid].iloc[(delta[valid] - 0.5).abs().argmin()])
+    if surface_rows.empty:
+        return float("nan")
+    return float(surface_rows["strike"].median())
+
+
+def build_iv_surface(
+    snapshots: Iterable[Tuple[datetime, pd.DataFrame]],
+    spots: Optional[Dict] = None,
+) -> IVSurface:
+    """Builds an IVSurface from (snapshot_date, quotedata DataFrame) pairs.
+
+    ``spots`` optionally maps snapshot dates to the underlying price; when a
+    date is missing the ATM strike is inferred from call delta.
+    """
+    spot_lookup = {_to_date(k): float(v) for k, v in (spots or {}).items()}
+    per_date = {}
+    for snap_date, df in snapshots:
+        key = _to_date(snap_date)
+        rows = _snapshot_iv(df)
+        spot = spot_lookup.get(key)
+        if spot is None:
+            spot = _infer_spot(df, rows)
+        per_date[key] = (rows, spot)
+
+    dates = np.array(sorted(per_date), dtype="datetime64[D]")
+    if per_date:
+        all_rows = pd.concat([rows for rows, _ in per_date.values()])
+    else:
+        all_rows = pd.DataFrame({"expiry": [], "strike": [], "iv": []})
+    expiries = np.unique(all_rows["expiry"].values.astype("datetime64[D]"))
+    strikes = np.unique(all_rows["strike"].values.astype(float))
+
+    iv = np.full((len(dates), len(expiries), len(strikes)), np.nan)
+    spot_arr = np.full(len(dates), np.nan)
+    for d, key in enumerate(dates.tolist()):
+        rows, spot = per_date[key]
+        e_idx = np.searchsorted(expiries, rows["expiry"].values.astype("datetime64[D]"))
+        k_idx = np.searchsorted(strikes, rows["strike"].values.astype(float))
+        iv[d, e_idx, k_idx] = rows["iv"].values
+        spot_arr[d] = spot
+
+    return IVSurface(
+        dates=dates, expiries=expiries, strikes=strikes, iv=iv, spots=spot_arr
+    )
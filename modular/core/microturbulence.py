@@ -1,11 +1,57 @@
 # microturbulence.py
 """
-Estimates a mock intraday IV curve using recent IV delta.
-For now, returns 5 random values based on last known IV.
+Generates intraday IV paths around the latest ATM IV.
+
+Paths mean-revert toward the anchor IV (discrete Ornstein-Uhlenbeck) and are
+drawn from a seeded numpy Generator, so the same seed always reproduces the
+same flight. Output is an array of shape (steps,) or (n_paths, steps).
 """
 
-import random
+from typing import Optional, Union
+
+import numpy as np
+
+IV_FLOOR = 0.01
+
+
+def generate_iv_paths(
+    anchor_iv: float,
+    steps: int = 5,
+    n_paths: Optional[int] = None,
+    rng: Union[int, np.random.Generator, None] = None,
+    half_life: float = 5.0,
+    vol_of_vol: float = 0.05,
+) -> np.ndarray:
+    """Mean-reverting IV paths anchored on ``anchor_iv``.
+
+    ``half_life`` is in steps; ``vol_of_vol`` is the stationary standard
+    deviation of IV around the anchor. ``rng`` is a seed or a Generator.
+    Raises ValueError if ``anchor_iv`` is NaN (nothing quoted) or infinite.
+    """
+    if not np.isfinite(anchor_iv):
+        raise ValueError(f"Anchor IV must be finite, got {anchor_iv}")
+    rng = np.random.default_rng(rng)
+    shape = (1 if n_paths is None else n_paths, steps)
+    shocks = rng.standard_normal(shape)
+
+    decay = 0.5 ** (1.0 / half_life) if half_life > 0 else 0.0
+    shock_scale = vol_of_vol * np.sqrt(1.0 - decay * decay)
+
+    paths = np.empty(shape)
+    level = np.zeros(shape[0])
+    for t in range(steps):
+        level = decay * level + shock_scale * shocks[:, t]
+        paths[:, t] = level
+    paths += anchor_iv
+    np.maximum(paths, IV_FLOOR, out=paths)
+    return paths[0] if n_paths is None else paths
+
+
+def estimate_intraday_iv(source, steps: int = 5, rng=None) -> list:
+    """Rounded single IV path for the flight log.
 
-def estimate_intraday_iv(option_df) -> list:
-    latest_iv = option_df["IV"].dropna().astype(float).mean()
-    return [round(latest_iv + random.uniform(-0.1, 0.1), 2) for _ in range(5)]
+    ``source`` is the anchor IV, or an option DataFrame whose mean "IV" is used.
+    """
+    if hasattr(source, "columns"):
+        source = source["IV"].dropna().astype(float).mean()
+    return np.round(generate_iv_paths(source, steps=steps, rng=rng), 2).tolist()
@@ -0,0 +1,207 @@
+# regime_timeline.py
+"""
+Run-length encoded regime history with flicker suppression.
+
+Per-step regimes from compute_synchronization flip back and forth when S_c
+hovers around the 0.30 / 0.65 band thresholds. build_regime_timeline smooths a
+sc/regime series (or a whole fleet of them) and stores one row per episode:
+(series, start, end, regime, peak sc), so a decade of daily bars per ticker
+shrinks to a few hundred episodes and queries are boolean masks over them.
+
+Smoothing works on runs of equal regime, all series at once:
+  hysteresis: a run that moves into another S_c band without clearing the
+      band threshold by ``hysteresis`` is kept in the previous regime.
+  min_dwell: a run shorter than ``min_dwell`` bars is kept in the previous
+      regime.
+Flicker runs inherit the regime of the nearest preceding accepted run.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+
+from .synchronization import (
+    REGIME_LABELS,
+    REGIME_S_C_MAP,
+    RegimeLabel,
+    SynchronizationBatch,
+)
+
+_REGIME_INDEX = {r.value: i for i, r in enumerate(REGIME_LABELS)}
+
+# S_c band per regime code and the band edges (0.00 / 0.30 / 0.65 / 1.00).
+# Post-release regimes are set by the release, not by S_c, so get band -1
+# and are never treated as threshold flicker.
+REGIME_BAND = np.full(len(REGIME_LABELS), -1, dtype=np.int8)
+for _band, (_low, _high, _regimes) in enumerate(REGIME_S_C_MAP):
+    for _regime in _regimes:
+        REGIME_BAND[_REGIME_INDEX[_regime.value]] = _band
+REGIME_BAND[_REGIME_INDEX[RegimeLabel.FAILED_RESTORATION.value]] = -1
+BAND_EDGES = np.array([low for low, _, _ in REGIME_S_C_MAP] + [1.0])
+
+
+def regime_code(regime: Union[str, int]) -> int:
+    return regime if isinstance(regime, (int, np.integer)) else _REGIME_INDEX[regime]
+
+
+@dataclass
+class RegimeTimeline:
+    series: np.ndarray  # int32, row of the input each episode belongs to
+    start: np.ndarray  # int32, first bar of the episode
+    end: np.ndarray  # int32, one past the last bar
+    regime: np.ndarray  # int8, index into REGIME_LABELS
+    peak_sc: np.ndarray  # float32, highest S_c inside the episode
+    n_bars: int = 0  # bars per series
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    @property
+    def length(self) -> np.ndarray:
+        return self.end - self.start
+
+    @property
+    def nbytes(self) -> int:
+        return sum(
+            a.nbytes
+            for a in (self.series, self.start, self.end, self.regime, self.peak_sc)
+        )
+
+    def _subset(self, mask: np.ndarray) -> "RegimeTimeline":
+        return RegimeTimeline(
+            series=self.series[mask],
+            start=self.start[mask],
+            end=self.end[mask],
+            regime=self.regime[mask],
+            peak_sc=self.peak_sc[mask],
+            n_bars=self.n_bars,
+        )
+
+    def query(
+        self,
+        regime: Union[str, int, None] = None,
+        min_bars: int = 0,
+        min_peak_sc: float = 0.0,
+        series: Optional[int] = None,
+    ) -> "RegimeTimeline":
+        """Episodes of ``regime`` lasting at least ``min_bars`` bars, e.g.
+        ``timeline.query("REFLEXIVE_CASCADE", min_bars=5)``."""
+        mask = self.length >= min_bars
+        if regime is not None:
+            mask &= self.regime == regime_code(regime)
+        if min_peak_sc > 0.0:
+            mask &= self.peak_sc >= min_peak_sc
+        if series is not None:
+            mask &= self.series == series
+        return self._subset(mask)
+
+    def regime_at(self, series: int, bar: int) -> str:
+        rows = np.flatnonzero(self.series == series)
+        i = rows[np.searchsorted(self.start[rows], bar, side="right") - 1]
+        return REGIME_LABELS[self.regime[i]].value
+
+    def expand(self, series: int = 0) -> np.ndarray:
+        """Per-bar regime codes for one series (inverse of the encoding)."""
+        rows = self.series == series
+        return np.repeat(self.regime[rows], self.length[rows])
+
+    def bars_by_regime(self) -> Dict[str, int]:
+        totals = np.bincount(
+            self.regime, weights=self.length, minlength=len(REGIME_LABELS)
+        )
+        return {r.value: int(t) for r, t in zip(REGIME_LABELS, totals)}
+
+    def to_records(self) -> List[Dict]:
+        return [
+            {
+                "series": int(s),
+                "start": int(a),
+                "end": int(b),
+                "regime": REGIME_LABELS[r].value,
+                "peak_sc": round(float(p), 4),
+            }
+            for s, a, b, r, p in zip(
+                self.series, self.start, self.end, self.regime, self.peak_sc
+            )
+        ]
+
+
+def _runs(codes: np.ndarray, breaks: np.ndarray) -> np.ndarray:
+    """Start index of every run of equal codes; ``breaks`` forces a new run."""
+    change = np.empty(len(codes), dtype=bool)
+    change[0] = True
+    np.not_equal(codes[1:], codes[:-1], out=change[1:])
+    return np.flatnonzero(change | breaks)
+
+
+def _inherit(codes: np.ndarray, accepted: np.ndarray) -> np.ndarray:
+    # Each rejected run takes the code of the nearest accepted run before it
+    source = np.maximum.accumulate(np.where(accepted, np.arange(len(codes)), 0))
+    return codes[source]
+
+
+def build_regime_timeline(
+    sc,
+    regimes,
+    min_dwell: int = 1,
+    hysteresis: float = 0.0,
+) -> RegimeTimeline:
+    """Encodes ``sc`` / ``regimes`` of shape (bars,) or (series, bars).
+
+    ``regimes`` holds REGIME_LABELS codes or label strings.
+    """
+    sc = np.atleast_2d(np.asarray(sc, dtype=float))
+    regimes = np.asarray(regimes)
+    if regimes.dtype.kind in "USO":
+        regimes = np.vectorize(_REGIME_INDEX.__getitem__, otypes=[np.int8])(regimes)
+    codes = np.atleast_2d(regimes).astype(np.int8)
+    n_series, n_bars = sc.shape
+    if n_series * n_bars == 0:
+        empty = np.zeros(0, dtype=np.int32)
+        return RegimeTimeline(
+            empty, empty, empty, empty.astype(np.int8), empty.astype(np.float32), n_bars
+        )
+
+    sc, codes = sc.ravel(), codes.ravel()
+    breaks = np.zeros(len(codes), dtype=bool)
+    breaks[::n_bars] = True
+    starts = _runs(codes, breaks)
+    run_codes = codes[starts]
+    is_first = breaks[starts]
+
+    if hysteresis > 0.0:
+        band = REGIME_BAND[run_codes]
+        prev_band = np.concatenate(([-1], band[:-1]))
+        banded = (band >= 0) & (prev_band >= 0)
+        peak = np.maximum.reduceat(sc, starts)
+        trough = np.minimum.reduceat(sc, starts)
+        rising = banded & (band > prev_band)
+        falling = banded & (band < prev_band)
+        weak_rise = rising & (peak < BAND_EDGES[band] + hysteresis)
+        weak_fall = falling & (trough > BAND_EDGES[band + 1] - hysteresis)
+        run_codes = _inherit(run_codes, is_first | ~(weak_rise | weak_fall))
+
+    if min_dwell > 1:
+        lengths = np.diff(np.append(starts, len(codes)))
+        run_codes = _inherit(run_codes, is_first | (lengths >= min_dwell))
+
+    # Re-encode after smoothing: neighbouring runs may now share a regime
+    smoothed = np.repeat(run_codes, np.diff(np.append(starts, len(codes))))
+    starts = _runs(smoothed, breaks)
+    ends = np.append(starts[1:], len(codes))
+    series = starts // n_bars
+    return RegimeTimeline(
+        series=series.astype(np.int32),
+        start=(starts - series * n_bars).astype(np.int32),
+        end=(ends - series * n_bars).astype(np.int32),
+        regime=smoothed[starts],
+        peak_sc=np.maximum.reduceat(sc, starts).astype(np.float32),
+        n_bars=n_bars,
+    )
+
+
+def timeline_from_batch(batch: SynchronizationBatch, **kwargs) -> RegimeTimeline:
+    return build_regime_timeline(
+        batch.synchronization_coefficient, batch.regime_code, **kwargs
+    )
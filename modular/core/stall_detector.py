@@ -6,18 +6,21 @@ def detect_stalls(prices: pd.Series, candle_df: pd.DataFrame, iv_series: pd.Seri
     """
     Detects stall risk using EMA drag, candle shape, and IV delta.
     Returns a list of booleans (True if stall risk, else False) for each step.
+    prices and iv_series are read positionally, aligned with candle_df rows
+    (see IVSurface.atm_series for per-date ATM IV). Missing IV (NaN, e.g.
+    before the first option snapshot) masks the IV delta to 0.
     """
     ema = prices.ewm(span=ema_span).mean()
     iv_std = iv_series.std()
     prev_iv = None
     stalls = []
-    for idx, row in candle_df.iterrows():
-        price = prices.iloc[idx]
-        current_iv = iv_series.iloc[idx] if idx < len(iv_series) else iv_series.iloc[-1]
+    for pos, (_, row) in enumerate(candle_df.iterrows()):
+        price = prices.iloc[pos]
+        current_iv = iv_series.iloc[pos] if pos < len(iv_series) else iv_series.iloc[-1]
         # EMA drag
-        ema_drag = abs(price - ema.iloc[idx]) < threshold
+        ema_drag = abs(price - ema.iloc[pos]) < threshold
         # IV delta
-        if prev_iv is None:
+        if prev_iv is None or pd.isna(current_iv) or pd.isna(prev_iv):
             iv_delta = 0
         else:
             iv_delta = abs(current_iv - prev_iv)
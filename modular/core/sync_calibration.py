@@ -0,0 +1,186 @@
+# sync_calibration.py
+"""
+Fits SyncProfile weights and scales against history.
+
+Targets are either labeled episodes (1 inside a collective execution episode,
+0 outside) scored by Brier loss, or forward returns scored by the negative
+correlation between S_c and the absolute forward move.
+
+For a fixed set of scales the pre-clip S_c is linear in the weights, so the
+factor matrix is built once and thousands of candidate weight vectors are
+scored with one matrix product per chunk. Candidates are drawn on the weight
+simplex (weights sum to 1, as the defaults do) and refined around the best
+so far. Each scale combination is an independent search, run across worker
+processes.
+"""
+
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .synchronization import DEFAULT_PROFILE, SyncProfile, sync_factor_matrix
+
+OBJECTIVES = ("brier", "correlation")
+# Candidate weight vectors scored per matrix product
+CHUNK = 2048
+
+
+@dataclass
+class CalibrationResult:
+    profile: SyncProfile
+    loss: float
+    baseline_loss: float
+    evaluations: int  # profile x step combinations scored
+
+    def to_dict(self) -> Dict:
+        return {
+            "profile": self.profile.to_dict(),
+            "loss": round(self.loss, 6),
+            "baseline_loss": round(self.baseline_loss, 6),
+            "evaluations": self.evaluations,
+        }
+
+
+def episode_labels(n_bars: int, episodes: Iterable[Tuple[int, int]]) -> np.ndarray:
+    """1.0 on bars inside any (start, end) episode (end exclusive), else 0.0.
+
+    A RegimeTimeline query works directly:
+    ``zip(timeline.start, timeline.end)``.
+    """
+    delta = np.zeros(n_bars + 1)
+    for start, end in episodes:
+        delta[start] += 1
+        delta[end] -= 1
+    return (np.cumsum(delta[:-1]) > 0).astype(float)
+
+
+def forward_move_target(prices, horizon: int = 5) -> np.ndarray:
+    """Absolute return over the next ``horizon`` bars (NaN where unknown)."""
+    prices = np.asarray(prices, dtype=float)
+    out = np.full(len(prices), np.nan)
+    if len(prices) > horizon:
+        out[:-horizon] = np.abs(prices[horizon:] / prices[:-horizon] - 1.0)
+    return out
+
+
+def score_weights(
+    factors: np.ndarray,
+    weights: np.ndarray,
+    target: np.ndarray,
+    objective: str = "brier",
+) -> np.ndarray:
+    """Loss of each row of ``weights`` (candidates, 7); lower is better."""
+    sc = np.clip(factors @ weights.T, 0.0, 1.0)
+    if objective == "brier":
+        return np.mean((sc - target[:, None]) ** 2, axis=0)
+    if objective == "correlation":
+        sc_c = sc - sc.mean(axis=0)
+        y_c = target - target.mean()
+        denom = np.sqrt((sc_c**2).sum(axis=0) * (y_c**2).sum())
+        corr = np.divide(
+            y_c @ sc_c, denom, out=np.zeros(weights.shape[0]), where=denom > 0
+        )
+        return -corr
+    raise ValueError(f"Unknown objective: {objective}")
+
+
+def _search_weights(
+    job: Tuple[SyncProfile, Dict, np.ndarray, str, int, int, int],
+) -> Tuple[float, np.ndarray, int]:
+    """Best weights for one scale combination: (loss, weights, evaluations)."""
+    profile, inputs, target, objective, n_candidates, rounds, seed = job
+    factors = sync_factor_matrix(**inputs, profile=profile)
+    rng = np.random.default_rng(seed)
+    n_weights = factors.shape[1]
+
+    best_w = profile.weights / max(profile.weights.sum(), 1e-12)
+    best_loss = float(score_weights(factors, best_w[None, :], target, objective)[0])
+    evaluations = len(target)
+    concentration = 1.0
+    for _ in range(rounds):
+        # Dirichlet draws around the incumbent, tightening every round
+        alpha = 0.05 + best_w * concentration * n_weights
+        candidates = rng.dirichlet(alpha, size=n_candidates)
+        for start in range(0, n_candidates, CHUNK):
+            chunk = candidates[start : start + CHUNK]
+            losses = score_weights(factors, chunk, target, objective)
+            i = int(np.argmin(losses))
+            if losses[i] < best_loss:
+                best_loss, best_w = float(losses[i]), chunk[i]
+            evaluations += len(chunk) * len(target)
+        concentration *= 8.0
+    return best_loss, best_w, evaluations
+
+
+def scale_profiles(
+    base: SyncProfile = DEFAULT_PROFILE, scale_grid: Optional[Dict] = None
+) -> List[SyncProfile]:
+    """Every combination of ``scale_grid`` values (field name -> candidates)."""
+    if not scale_grid:
+        return [base]
+    names = list(scale_grid)
+    return [
+        replace(base, **dict(zip(names, values)))
+        for values in itertools.product(*(scale_grid[n] for n in names))
+    ]
+
+
+def calibrate_profile(
+    inputs: Dict[str, Sequence[float]],
+    target,
+    objective: str = "brier",
+    base: SyncProfile = DEFAULT_PROFILE,
+    scale_grid: Optional[Dict[str, Sequence[float]]] = None,
+    n_candidates: int = 4096,
+    rounds: int = 3,
+    workers: Optional[int] = None,
+    seed: int = 0,
+) -> CalibrationResult:
+    """Fits weights (and scales from ``scale_grid``) to ``target``.
+
+    ``inputs`` holds the sync_factor_matrix arguments (price_displacement,
+    cvd_acceleration, ...) as arrays over all steps; stack several tickers'
+    histories end to end to calibrate one profile for all of them. NaN
+    targets are ignored. ``workers`` > 1 spreads scale combinations over
+    processes.
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError(f"Unknown objective: {objective}")
+    target = np.asarray(target, dtype=float)
+    keep = ~np.isnan(target)
+    inputs = {
+        k: np.broadcast_to(np.asarray(v, dtype=float), target.shape)[keep]
+        for k, v in inputs.items()
+    }
+    target = target[keep]
+
+    baseline = float(
+        score_weights(
+            sync_factor_matrix(**inputs, profile=base),
+            base.weights[None, :],
+            target,
+            objective,
+        )[0]
+    )
+    profiles = scale_profiles(base, scale_grid)
+    jobs = [
+        (profile, inputs, target, objective, n_candidates, rounds, seed + i)
+        for i, profile in enumerate(profiles)
+    ]
+    if workers and workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_search_weights, jobs))
+    else:
+        results = [_search_weights(job) for job in jobs]
+
+    best = int(np.argmin([loss for loss, _, _ in results]))
+    loss, weights, _ = results[best]
+    return CalibrationResult(
+        profile=profiles[best].with_weights(weights),
+        loss=loss,
+        baseline_loss=baseline,
+        evaluations=sum(e for _, _, e in results),
+    )
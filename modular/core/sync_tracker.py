@@ -0,0 +1,467 @@
+# sync_tracker.py
+"""
+Streaming synchronization estimation.
+
+SynchronizationTracker keeps rolling windows of volume, bar range and IV, so
+each new bar costs O(1) instead of rescanning the full history the way the
+``estimate_*`` helpers do. It also carries the regime history needed by
+compute_synchronization: the cruise level for ``prior_cruise_deviation`` and
+the post-release countdown for ``force_post_release``.
+
+The step is split into observe() -> compute -> commit() so callers holding
+many trackers can run the compute step through compute_synchronization_batch.
+TrackerBank is the same state for many instruments as arrays, one row each:
+observe() and commit() advance any subset of rows with a fixed number of
+NumPy calls, bit-identical to a SynchronizationTracker per row.
+"""
+
+from collections import deque
+from math import inf, sqrt
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .synchronization import (
+    compute_synchronization,
+    REGIME_LABELS,
+    RegimeLabel,
+    SyncCache,
+    SynchronizationResult,
+)
+
+# Regimes that end in a release; the bars after them run post-release checks
+PRESSURE_REGIMES = frozenset(
+    (
+        RegimeLabel.COLLECTIVE_EXECUTION_MANEUVER.value,
+        RegimeLabel.REFLEXIVE_CASCADE.value,
+    )
+)
+RELEASE_SC = 0.65
+
+
+class _RollingWindow:
+    """Running sum and sum of squares over the last ``size`` values."""
+
+    def __init__(self, size: Optional[int]):
+        self.values = deque(maxlen=size)
+        self.total = 0.0
+        self.total_sq = 0.0
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def push(self, x: float):
+        if len(self.values) == self.values.maxlen:
+            old = self.values[0]
+            self.total -= old
+            self.total_sq -= old * old
+        self.values.append(x)
+        self.total += x
+        self.total_sq += x * x
+
+    def mean(self) -> float:
+        return self.total / len(self.values) if self.values else 0.0
+
+    def std(self) -> float:
+        # Sample standard deviation (ddof=1), as pandas .std()
+        n = len(self.values)
+        if n < 2:
+            return 0.0
+        var = (self.total_sq - self.total * self.total / n) / (n - 1)
+        return sqrt(var) if var > 0 else 0.0
+
+
+class SynchronizationTracker:
+    """Per-instrument rolling synchronization state.
+
+    window: bars of volume/range/IV history kept (None keeps the full history,
+        which reproduces the ``estimate_*`` helpers exactly).
+    release_bars: bars treated as post-release after a collective maneuver or
+        reflexive cascade ends.
+    cache: optional SyncCache (may be shared between trackers) used by update().
+    """
+
+    def __init__(
+        self,
+        window: Optional[int] = 20,
+        release_bars: int = 1,
+        cache: Optional[SyncCache] = None,
+    ):
+        self.window = window
+        self.release_bars = release_bars
+        self.cache = cache
+        self.reset()
+
+    def reset(self):
+        self.bars = 0
+        self.last_tick = None
+        self.last_price = None
+        self.last_iv = None
+        self.cruise_level = None
+        self.last_result: Optional[SynchronizationResult] = None
+        self._volumes = _RollingWindow(self.window)
+        self._ranges = _RollingWindow(self.window)
+        self._ivs = _RollingWindow(self.window)
+        self._release_left = 0
+        self._pending_price = None
+
+    def observe(
+        self,
+        price: float,
+        volume: Optional[float] = None,
+        spread: Optional[float] = None,
+        iv: Optional[float] = None,
+        cvd_acceleration: float = 0.0,
+        cvd_trend_strong: bool = False,
+        price_bounded_while_cvd_trends: bool = False,
+        event_proximity_minutes: float = inf,
+        event_type: str = "unknown",
+    ) -> Dict:
+        """Advances the rolling windows by one bar and returns the
+        compute_synchronization inputs for it (without ``force_post_release``).
+
+        ``spread`` is the bar range (high - low) or quoted spread; its ratio to
+        the recent average feeds ``spread_widening_ratio``. An ``iv`` of None
+        or NaN (unquoted) leaves the IV window untouched.
+        """
+        price_displacement = 0.0 if self.last_price is None else price - self.last_price
+        if self.cruise_level is None:
+            self.cruise_level = price
+
+        volume_spike_ratio = 1.0
+        if volume is not None:
+            avg = self._volumes.mean()
+            if len(self._volumes) and avg != 0:
+                volume_spike_ratio = volume / avg
+            self._volumes.push(volume)
+
+        spread_widening_ratio = 0.0
+        if spread is not None:
+            avg = self._ranges.mean()
+            if len(self._ranges) and avg != 0:
+                spread_widening_ratio = spread / avg
+            self._ranges.push(spread)
+
+        volatility_expansion = 0.0
+        if iv is not None and iv == iv:
+            self._ivs.push(iv)
+            iv_std = self._ivs.std()
+            if self.last_iv is not None and iv_std != 0:
+                volatility_expansion = abs(iv - self.last_iv) / iv_std
+            self.last_iv = iv
+
+        self._pending_price = price
+        self.last_price = price
+        return {
+            "price_displacement": price_displacement,
+            "cvd_acceleration": cvd_acceleration,
+            "volume_spike_ratio": volume_spike_ratio,
+            "spread_widening_ratio": spread_widening_ratio,
+            "volatility_expansion": volatility_expansion,
+            "event_proximity_minutes": event_proximity_minutes,
+            "prior_cruise_deviation": abs(price - self.cruise_level),
+            "cvd_trend_strong": cvd_trend_strong,
+            "price_bounded_while_cvd_trends": price_bounded_while_cvd_trends,
+            "event_type": event_type,
+        }
+
+    def is_release(self, sc: float) -> bool:
+        """True when the observed bar follows a pressure episode and sc has
+        dropped back below the maneuver threshold."""
+        return self._release_left > 0 and sc < RELEASE_SC
+
+    def commit(self, result: SynchronizationResult, tick=None) -> SynchronizationResult:
+        """Records the result of the observed bar in the regime history."""
+        if result.regime_label in PRESSURE_REGIMES:
+            self._release_left = self.release_bars
+        elif self._release_left > 0:
+            self._release_left -= 1
+        if result.regime_label == RegimeLabel.STABLE_CRUISE.value:
+            self.cruise_level = self._pending_price
+        self.bars += 1
+        self.last_tick = tick
+        self.last_result = result
+        return result
+
+    def update(self, price: float, tick=None, **observations) -> SynchronizationResult:
+        """One bar in, one SynchronizationResult out.
+
+        ``tick`` makes repeated calls for the same bar return the stored result
+        instead of advancing the windows twice.
+        """
+        if tick is not None and tick == self.last_tick:
+            return self.last_result
+        compute = self.cache or compute_synchronization
+        inputs = self.observe(price, **observations)
+        result = compute(**inputs)
+        if self.is_release(result.synchronization_coefficient):
+            result = compute(**inputs, force_post_release=True)
+        return self.commit(result, tick)
+
+
+# REGIME_LABELS codes for the vectorized commit
+_PRESSURE_CODES = np.array(
+    [i for i, r in enumerate(REGIME_LABELS) if r.value in PRESSURE_REGIMES]
+)
+_STABLE_CODE = REGIME_LABELS.index(RegimeLabel.STABLE_CRUISE)
+
+
+class _RollingRows:
+    """_RollingWindow per row: a ring of ``size`` values per row (growing when
+    size is None) with running sums, pushed for many rows at once."""
+
+    def __init__(self, size: Optional[int], capacity: int = 0):
+        self.size = size
+        self.values = np.zeros((capacity, size or 16))
+        self.count = np.zeros(capacity, dtype=np.int64)
+        self.head = np.zeros(capacity, dtype=np.int64)  # column of the oldest
+        self.total = np.zeros(capacity)
+        self.total_sq = np.zeros(capacity)
+
+    def resize(self, capacity: int):
+        old = len(self.count)
+        for name in ("values", "count", "head", "total", "total_sq"):
+            array = getattr(self, name)
+            grown = np.zeros((capacity,) + array.shape[1:], dtype=array.dtype)
+            grown[:old] = array
+            setattr(self, name, grown)
+
+    def clear(self, row: int):
+        self.count[row] = self.head[row] = 0
+        self.total[row] = self.total_sq[row] = 0.0
+
+    def move(self, src: int, dst: int):
+        for name in ("values", "count", "head", "total", "total_sq"):
+            array = getattr(self, name)
+            array[dst] = array[src]
+
+    def window(self, row: int) -> np.ndarray:
+        """The row's values, oldest first."""
+        cols = self.values.shape[1]
+        return self.values[row, (self.head[row] + np.arange(self.count[row])) % cols]
+
+    def mean(self, rows: np.ndarray) -> np.ndarray:
+        count = self.count[rows]
+        return np.where(count > 0, self.total[rows] / np.maximum(count, 1), 0.0)
+
+    def std(self, rows: np.ndarray) -> np.ndarray:
+        # Sample standard deviation (ddof=1), as _RollingWindow.std
+        n = self.count[rows]
+        total = self.total[rows]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            var = (self.total_sq[rows] - total * total / n) / (n - 1)
+        return np.where((n >= 2) & (var > 0), np.sqrt(np.maximum(var, 0.0)), 0.0)
+
+    def push(self, rows: np.ndarray, x: np.ndarray):
+        count, head = self.count[rows], self.head[rows]
+        total, total_sq = self.total[rows], self.total_sq[rows]
+        if self.size is None:
+            if len(count) and count.max() >= self.values.shape[1]:
+                self.values = np.concatenate(
+                    (self.values, np.zeros_like(self.values)), axis=1
+                )
+            full = np.zeros(len(rows), dtype=bool)
+            pos = count
+        else:
+            full = count == self.size
+            old = self.values[rows, head]
+            total = np.where(full, total - old, total)
+            total_sq = np.where(full, total_sq - old * old, total_sq)
+            pos = (head + count) % self.size
+            self.head[rows] = np.where(full, (head + 1) % self.size, head)
+        self.values[rows, pos] = x
+        self.total[rows] = total + x
+        self.total_sq[rows] = total_sq + x * x
+        self.count[rows] = np.where(full, count, count + 1)
+
+
+class TrackerBank:
+    """SynchronizationTrackers for many instruments, one row each.
+
+    Rows are addressed by integer (FlightOpsCore uses FlightStore slots and
+    follows its moves); they grow with resize() and start in the reset state.
+    ``last_tick`` and the price/IV scalars hold NaN where the tracker holds
+    None.
+    """
+
+    SCALARS = (
+        "bars",
+        "release_left",
+        "last_tick",
+        "last_price",
+        "last_iv",
+        "cruise_level",
+        "pending_price",
+    )
+    WINDOWS = ("volumes", "ranges", "ivs")
+
+    def __init__(
+        self,
+        window: Optional[int] = 20,
+        release_bars: int = 1,
+        cache: Optional[SyncCache] = None,
+    ):
+        self.window = window
+        self.release_bars = release_bars
+        self.cache = cache
+        self.bars = np.zeros(0, dtype=np.int64)
+        self.release_left = np.zeros(0, dtype=np.int64)
+        for name in self.SCALARS[2:]:
+            setattr(self, name, np.zeros(0))
+        self.volumes, self.ranges, self.ivs = (
+            _RollingRows(window) for _ in self.WINDOWS
+        )
+        self.last_result: List[Optional[SynchronizationResult]] = []
+
+    @property
+    def capacity(self) -> int:
+        return len(self.bars)
+
+    def resize(self, capacity: int):
+        """Grows to at least ``capacity`` rows (doubling, like FlightStore)."""
+        old = self.capacity
+        if capacity <= old:
+            return
+        capacity = max(capacity, 2 * old)
+        for name in self.SCALARS:
+            array = getattr(self, name)
+            grown = np.zeros(capacity, dtype=array.dtype)
+            grown[:old] = array
+            setattr(self, name, grown)
+        for name in self.WINDOWS:
+            getattr(self, name).resize(capacity)
+        self.last_result.extend([None] * (capacity - old))
+        for row in range(old, capacity):
+            self._reset_scalars(row)
+
+    def _reset_scalars(self, row: int):
+        self.bars[row] = self.release_left[row] = 0
+        for name in self.SCALARS[2:]:
+            getattr(self, name)[row] = np.nan
+        self.last_result[row] = None
+
+    def clear(self, row: int):
+        """Resets one row to a fresh tracker."""
+        if row < self.capacity:
+            self._reset_scalars(row)
+            for name in self.WINDOWS:
+                getattr(self, name).clear(row)
+
+    def move(self, src: int, dst: int):
+        """Copies row ``src`` into row ``dst`` (FlightStore.remove)."""
+        if src >= self.capacity:
+            self.clear(dst)
+            return
+        for name in self.SCALARS:
+            array = getattr(self, name)
+            array[dst] = array[src]
+        for name in self.WINDOWS:
+            getattr(self, name).move(src, dst)
+        self.last_result[dst] = self.last_result[src]
+
+    def observe(
+        self,
+        rows: np.ndarray,
+        price,
+        volume=None,
+        spread=None,
+        iv=None,
+    ) -> Dict[str, np.ndarray]:
+        """SynchronizationTracker.observe for every row in ``rows`` (unique);
+        returns the compute_synchronization_batch inputs it derives."""
+        price = np.asarray(price, dtype=np.float64)
+        last_price = self.last_price[rows]
+        price_displacement = np.where(np.isnan(last_price), 0.0, price - last_price)
+        cruise = self.cruise_level[rows]
+        cruise = np.where(np.isnan(cruise), price, cruise)
+        self.cruise_level[rows] = cruise
+        inputs = {
+            "price_displacement": price_displacement,
+            "prior_cruise_deviation": np.abs(price - cruise),
+        }
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for key, default, window, values in (
+                ("volume_spike_ratio", 1.0, self.volumes, volume),
+                ("spread_widening_ratio", 0.0, self.ranges, spread),
+            ):
+                if values is None:
+                    continue
+                values = np.asarray(values, dtype=np.float64)
+                avg = window.mean(rows)
+                known = (window.count[rows] > 0) & (avg != 0)
+                inputs[key] = np.where(known, values / avg, default)
+                window.push(rows, values)
+            if iv is not None:
+                iv = np.asarray(iv, dtype=np.float64)
+                expansion = np.zeros(len(rows))
+                quoted = ~np.isnan(iv)  # NaN: unquoted, skipped like None
+                iv_rows = rows
+                if not quoted.all():
+                    iv_rows, iv = rows[quoted], iv[quoted]
+                self.ivs.push(iv_rows, iv)
+                iv_std = self.ivs.std(iv_rows)
+                last_iv = self.last_iv[iv_rows]
+                known = ~np.isnan(last_iv) & (iv_std != 0)
+                expansion[quoted] = np.where(known, np.abs(iv - last_iv) / iv_std, 0.0)
+                inputs["volatility_expansion"] = expansion
+                self.last_iv[iv_rows] = iv
+        self.pending_price[rows] = price
+        self.last_price[rows] = price
+        return inputs
+
+    def is_release(self, rows: np.ndarray, sc) -> np.ndarray:
+        return (self.release_left[rows] > 0) & (np.asarray(sc) < RELEASE_SC)
+
+    def commit(
+        self,
+        rows: np.ndarray,
+        regime_code: np.ndarray,
+        results: Sequence[SynchronizationResult],
+        tick=None,
+    ):
+        """SynchronizationTracker.commit for every row; ``regime_code`` indexes
+        REGIME_LABELS (SynchronizationBatch.regime_code)."""
+        left = self.release_left[rows]
+        self.release_left[rows] = np.where(
+            np.isin(regime_code, _PRESSURE_CODES),
+            self.release_bars,
+            np.where(left > 0, left - 1, left),
+        )
+        stable = regime_code == _STABLE_CODE
+        self.cruise_level[rows] = np.where(
+            stable, self.pending_price[rows], self.cruise_level[rows]
+        )
+        self.bars[rows] += 1
+        self.last_tick[rows] = np.nan if tick is None else tick
+        last_result = self.last_result
+        for row, result in zip(rows.tolist(), results):
+            last_result[row] = result
+
+    def update(
+        self,
+        row: int,
+        price: float,
+        tick=None,
+        volume: Optional[float] = None,
+        spread: Optional[float] = None,
+        iv: Optional[float] = None,
+    ) -> SynchronizationResult:
+        """SynchronizationTracker.update for one row, through ``cache``."""
+        if tick is not None and self.last_tick[row] == tick:
+            return self.last_result[row]
+        rows = np.array([row])
+        observed = self.observe(
+            rows,
+            [price],
+            None if volume is None else [volume],
+            None if spread is None else [spread],
+            None if iv is None else [iv],
+        )
+        inputs = {key: float(values[0]) for key, values in observed.items()}
+        compute = self.cache or compute_synchronization
+        result = compute(**inputs)
+        if self.is_release(rows, [result.synchronization_coefficient])[0]:
+            result = compute(**inputs, force_post_release=True)
+        code = REGIME_LABELS.index(RegimeLabel(result.regime_label))
+        self.commit(rows, np.array([code]), [result], tick)
+        return result
@@ -1,8 +1,11 @@
-from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Tuple
+from dataclasses import asdict, dataclass, fields, replace
+from collections import OrderedDict
+from typing import ClassVar, Iterable, List, NamedTuple, Dict, Optional, Tuple
 from enum import Enum
 import math
 
+import numpy as np
+
 
 class ExecutionType(Enum):
     TYPE_I = "Type I"
@@ -60,6 +63,53 @@ REGIME_S_C_MAP = [
 ]
 
 
+class SyncDiagnostic:
+    # Bit flags; a result carries the OR of the codes that fired
+    PRICE_LAGGED_CVD = 1 << 0
+    PRESSURE_ABSORBED = 1 << 1
+    EVENT_SYNCHRONIZED = 1 << 2
+    ORDINARY_TREND = 1 << 3
+    PRESSURE_RELEASE = 1 << 4
+    POST_EVENT_BOUNCE = 1 << 5
+    VALVE_SATURATION_HIGH = 1 << 6
+    CVD_TRENDS_PRICE_BOUNDED = 1 << 7
+
+
+# Text is rendered from the bitmask only when a log or report asks for it
+DIAGNOSTIC_TEXT = {
+    SyncDiagnostic.PRICE_LAGGED_CVD: "Price lagged CVD — pressure may have accumulated before price moved.",
+    SyncDiagnostic.PRESSURE_ABSORBED: "Pressure was absorbed before rupture — CVD trended while price was contained.",
+    SyncDiagnostic.EVENT_SYNCHRONIZED: "Event appears to have synchronized participants — authorization signal detected.",
+    SyncDiagnostic.ORDINARY_TREND: "Movement looks like ordinary trend — no synchronization detected.",
+    SyncDiagnostic.PRESSURE_RELEASE: "Movement resembles pressure release — collective execution maneuver or reflexive cascade.",
+    SyncDiagnostic.POST_EVENT_BOUNCE: "Post-event bounce — flight-level stabilization or failed restoration detected.",
+    SyncDiagnostic.VALVE_SATURATION_HIGH: "Valve saturation high — absorption capacity nearing limit.",
+    SyncDiagnostic.CVD_TRENDS_PRICE_BOUNDED: "CVD trends strongly while price remains bounded — possible absorption phase.",
+}
+
+
+def render_diagnostics(flags: int, registry: Dict = DIAGNOSTIC_TEXT) -> List[str]:
+    return [text for code, text in registry.items() if flags & code]
+
+
+def diagnostic_flags(texts: Iterable[str], registry: Dict = DIAGNOSTIC_TEXT) -> int:
+    """Inverse of render_diagnostics; unknown texts raise ValueError."""
+    codes = {text: code for code, text in registry.items()}
+    flags = 0
+    for text in texts:
+        if text not in codes:
+            raise ValueError(f"Unknown diagnostic: {text!r}")
+        flags |= codes[text]
+    return flags
+
+
+# Integer codes used by the batch kernel (index into these tuples)
+EXECUTION_TYPES = tuple(ExecutionType)
+REGIME_LABELS = tuple(RegimeLabel)
+_EXEC_CODE = {et: i for i, et in enumerate(EXECUTION_TYPES)}
+_REGIME_CODE = {r: i for i, r in enumerate(REGIME_LABELS)}
+
+
 @dataclass
 class ExecutionAuthorizationEvent:
     event_authorized: bool = False
@@ -68,8 +118,7 @@ class ExecutionAuthorizationEvent:
     authorization_confidence: float = 0.0
 
 
-@dataclass
-class SynchronizationResult:
+class _SynchronizationFields(NamedTuple):
     synchronization_coefficient: float = 0.0
     execution_type: str = "Type I"
     execution_type_label: str = "Distributed Execution"
@@ -84,11 +133,59 @@ class SynchronizationResult:
     collective_execution_risk: float = 0.0
     reflexive_cascade_risk: float = 0.0
 
-    # Diagnostic notes
-    diagnostics: List[str] = field(default_factory=list)
-
-    def to_dict(self) -> Dict:
-        return {
+    # Diagnostic notes as a SyncDiagnostic bitmask
+    diagnostic_flags: int = 0
+
+
+class SynchronizationResult(_SynchronizationFields):
+    """Immutable and tuple-backed: no per-instance __dict__, shareable between
+    flights and ticks, and to_record() hands out the tuple itself.
+
+    For callers of the former dataclass and its to_dict() output, the
+    constructor still takes ``diagnostics`` (rendered texts) in place of
+    diagnostic_flags, and string keys read the to_dict() view
+    (``result["regime_label"]``, ``result.get("diagnostics")``).
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, *args, diagnostics: Optional[Iterable[str]] = None, **values):
+        if diagnostics is not None:
+            values["diagnostic_flags"] = diagnostic_flags(diagnostics)
+        return super().__new__(cls, *args, **values)
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self.to_dict()[key]
+        return tuple.__getitem__(self, key)
+
+    def get(self, key: str, default=None):
+        return self.to_dict().get(key, default)
+
+    @property
+    def diagnostics(self) -> List[str]:
+        return render_diagnostics(self.diagnostic_flags)
+
+    @classmethod
+    def from_diagnostics(
+        cls, diagnostics: Iterable[str] = (), **values
+    ) -> "SynchronizationResult":
+        """``diagnostics`` as rendered texts (e.g. another result's
+        ``diagnostics``) instead of diagnostic_flags."""
+        return cls(diagnostics=diagnostics, **values)
+
+    def to_record(self) -> Tuple:
+        return self
+
+    def to_dict(self, compact: bool = False, fast: bool = False) -> Dict:
+        """``compact`` emits the diagnostic bitmask instead of rendered text;
+        ``fast`` skips rounding and copies the fields straight from the tuple."""
+        if fast:
+            out = self._asdict()
+            if not compact:
+                out["diagnostics"] = render_diagnostics(out.pop("diagnostic_flags"))
+            return out
+        out = {
             "synchronization_coefficient": round(self.synchronization_coefficient, 4),
             "execution_type": self.execution_type,
             "execution_type_label": self.execution_type_label,
@@ -104,8 +201,69 @@ class SynchronizationResult:
             "observed_dom_confidence": round(self.observed_dom_confidence, 4),
             "collective_execution_risk": round(self.collective_execution_risk, 4),
             "reflexive_cascade_risk": round(self.reflexive_cascade_risk, 4),
-            "diagnostics": self.diagnostics,
         }
+        if compact:
+            out["diagnostic_flags"] = int(self.diagnostic_flags)
+        else:
+            out["diagnostics"] = self.diagnostics
+        return out
+
+
+@dataclass(frozen=True)
+class SyncProfile:
+    """Factor weights and normalization scales used by compute_synchronization.
+
+    The defaults are the original hand-set values; sync_calibration fits new
+    ones. Frozen and hashable so a profile can key caches.
+    """
+
+    price_weight: float = 0.25
+    cvd_weight: float = 0.20
+    volume_weight: float = 0.15
+    spread_weight: float = 0.10
+    volatility_weight: float = 0.10
+    event_weight: float = 0.10
+    cruise_deviation_weight: float = 0.10
+
+    price_scale: float = 3.0
+    cvd_scale: float = 2.0
+    volume_baseline: float = 1.0
+    spread_baseline: float = 0.01
+    spread_scale: float = 0.05
+    volatility_scale: float = 2.0
+    event_window_minutes: float = 60.0
+    cruise_deviation_scale: float = 2.0
+
+    # Order of the factor columns returned by sync_factor_matrix
+    WEIGHT_FIELDS: ClassVar[Tuple[str, ...]] = (
+        "price_weight",
+        "cvd_weight",
+        "volume_weight",
+        "spread_weight",
+        "volatility_weight",
+        "event_weight",
+        "cruise_deviation_weight",
+    )
+
+    @property
+    def weights(self) -> np.ndarray:
+        return np.array([getattr(self, name) for name in self.WEIGHT_FIELDS])
+
+    def with_weights(self, weights) -> "SyncProfile":
+        return replace(
+            self, **{k: float(w) for k, w in zip(self.WEIGHT_FIELDS, weights)}
+        )
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "SyncProfile":
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: float(v) for k, v in data.items() if k in known})
+
+
+DEFAULT_PROFILE = SyncProfile()
 
 
 def _normalize(
@@ -168,48 +326,42 @@ def compute_synchronization(
     price_bounded_while_cvd_trends: bool = False,
     event_type: str = "unknown",
     force_post_release: bool = False,
+    profile: SyncProfile = DEFAULT_PROFILE,
 ) -> SynchronizationResult:
-    baseline_volume = 1.0
+    baseline_volume = profile.volume_baseline
     volume_factor = _normalize(volume_spike_ratio, baseline_volume, baseline_volume)
 
-    baseline_spread = 0.01
+    baseline_spread = profile.spread_baseline
     if spread_widening_ratio <= baseline_spread:
         spread_factor = 0.0
     else:
         spread_factor = _normalize(
-            spread_widening_ratio, baseline_spread, baseline_spread * 5
+            spread_widening_ratio, baseline_spread, profile.spread_scale
         )
 
-    price_factor = min(abs(price_displacement) / 3.0, 1.0)
+    price_factor = min(abs(price_displacement) / profile.price_scale, 1.0)
 
-    cvd_factor = min(abs(cvd_acceleration) / 2.0, 1.0)
+    cvd_factor = min(abs(cvd_acceleration) / profile.cvd_scale, 1.0)
 
-    vol_factor = min(volatility_expansion / 2.0, 1.0)
+    vol_factor = min(volatility_expansion / profile.volatility_scale, 1.0)
 
+    event_window = profile.event_window_minutes
     event_factor = 0.0
-    if event_proximity_minutes < 60:
-        event_factor = max(0.0, 1.0 - event_proximity_minutes / 60.0)
-
-    cruise_deviation_factor = min(prior_cruise_deviation / 2.0, 1.0)
+    if event_proximity_minutes < event_window:
+        event_factor = max(0.0, 1.0 - event_proximity_minutes / event_window)
 
-    weights = {
-        "price": 0.25,
-        "cvd": 0.20,
-        "volume": 0.15,
-        "spread": 0.10,
-        "volatility": 0.10,
-        "event": 0.10,
-        "cruise_deviation": 0.10,
-    }
+    cruise_deviation_factor = min(
+        prior_cruise_deviation / profile.cruise_deviation_scale, 1.0
+    )
 
     sc = (
-        weights["price"] * price_factor
-        + weights["cvd"] * cvd_factor
-        + weights["volume"] * volume_factor
-        + weights["spread"] * spread_factor
-        + weights["volatility"] * vol_factor
-        + weights["event"] * event_factor
-        + weights["cruise_deviation"] * cruise_deviation_factor
+        profile.price_weight * price_factor
+        + profile.cvd_weight * cvd_factor
+        + profile.volume_weight * volume_factor
+        + profile.spread_weight * spread_factor
+        + profile.volatility_weight * vol_factor
+        + profile.event_weight * event_factor
+        + profile.cruise_deviation_weight * cruise_deviation_factor
     )
 
     sc = max(0.0, min(1.0, sc))
@@ -227,7 +379,9 @@ def compute_synchronization(
     queue_pressure = price_factor * 0.3 + volume_factor * 0.3 + valve_saturation * 0.4
     queue_pressure = max(0.0, min(1.0, queue_pressure))
 
-    event_authorized = event_proximity_minutes < 60 and event_type != "unknown"
+    event_authorized = (
+        event_proximity_minutes < event_window and event_type != "unknown"
+    )
     auth_confidence = event_factor if event_authorized else 0.0
 
     reflexive = sc >= 0.65 and queue_pressure > 0.6 and vol_factor > 0.5
@@ -259,7 +413,7 @@ def compute_synchronization(
 
     observed_dom_confidence = max(0.0, 1.0 - queue_pressure * 0.5)
 
-    diagnostics = _generate_diagnostics(
+    diagnostic_flags = _diagnostic_flags(
         price_displacement,
         cvd_acceleration,
         sc,
@@ -285,11 +439,11 @@ def compute_synchronization(
         observed_dom_confidence=observed_dom_confidence,
         collective_execution_risk=collective_risk,
         reflexive_cascade_risk=cascade_risk,
-        diagnostics=diagnostics,
+        diagnostic_flags=diagnostic_flags,
     )
 
 
-def _generate_diagnostics(
+def _diagnostic_flags(
     price_displacement: float,
     cvd_acceleration: float,
     sc: float,
@@ -299,39 +453,455 @@ def _generate_diagnostics(
     valve_saturation: float,
     price_bounded_while_cvd_trends: bool,
     force_post_release: bool,
-) -> List[str]:
-    notes = []
+) -> int:
+    flags = 0
     if abs(cvd_acceleration) > 1.0 and abs(price_displacement) < 0.5:
-        notes.append(
-            "Price lagged CVD — pressure may have accumulated before price moved."
-        )
+        flags |= SyncDiagnostic.PRICE_LAGGED_CVD
     if hidden_flow and not force_post_release:
-        notes.append(
-            "Pressure was absorbed before rupture — CVD trended while price was contained."
-        )
+        flags |= SyncDiagnostic.PRESSURE_ABSORBED
     if event_authorized:
-        notes.append(
-            "Event appears to have synchronized participants — authorization signal detected."
-        )
+        flags |= SyncDiagnostic.EVENT_SYNCHRONIZED
     if sc < 0.3 and regime == RegimeLabel.STABLE_CRUISE.value:
-        notes.append(
-            "Movement looks like ordinary trend — no synchronization detected."
-        )
+        flags |= SyncDiagnostic.ORDINARY_TREND
     elif sc >= 0.65:
-        notes.append(
-            "Movement resembles pressure release — collective execution maneuver or reflexive cascade."
-        )
+        flags |= SyncDiagnostic.PRESSURE_RELEASE
     if force_post_release:
-        notes.append(
-            "Post-event bounce — flight-level stabilization or failed restoration detected."
-        )
+        flags |= SyncDiagnostic.POST_EVENT_BOUNCE
     if valve_saturation > 0.7:
-        notes.append("Valve saturation high — absorption capacity nearing limit.")
+        flags |= SyncDiagnostic.VALVE_SATURATION_HIGH
     if price_bounded_while_cvd_trends:
-        notes.append(
-            "CVD trends strongly while price remains bounded — possible absorption phase."
+        flags |= SyncDiagnostic.CVD_TRENDS_PRICE_BOUNDED
+    return flags
+
+
+@dataclass
+class SynchronizationBatch:
+    """Columnar output of compute_synchronization_batch, one row per step.
+
+    ``execution_type_code`` indexes EXECUTION_TYPES and ``regime_code`` indexes
+    REGIME_LABELS. Rows materialize as SynchronizationResult via result(i).
+    """
+
+    synchronization_coefficient: np.ndarray
+    execution_type_code: np.ndarray
+    regime_code: np.ndarray
+    event_authorized: np.ndarray
+    event_authorization_confidence: np.ndarray
+    absorption_capacity: np.ndarray
+    valve_saturation_score: np.ndarray
+    queue_pressure: np.ndarray
+    hidden_flow_suspected: np.ndarray
+    observed_dom_confidence: np.ndarray
+    collective_execution_risk: np.ndarray
+    reflexive_cascade_risk: np.ndarray
+    diagnostic_flags: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.synchronization_coefficient)
+
+    def __iter__(self):
+        return (self.result(i) for i in range(len(self)))
+
+    @classmethod
+    def from_results(
+        cls, results: List[SynchronizationResult]
+    ) -> "SynchronizationBatch":
+        """Columnar container for many scalar results (e.g. one per instrument)."""
+        columns = dict(
+            zip(
+                SynchronizationResult._fields,
+                zip(*results) if results else [()] * len(SynchronizationResult._fields),
+            )
         )
-    return notes
+        exec_code = {et.value: i for i, et in enumerate(EXECUTION_TYPES)}
+        regime_code = {r.value: i for i, r in enumerate(REGIME_LABELS)}
+
+        def floats(name):
+            return np.array(columns[name], dtype=float)
+
+        def bools(name):
+            return np.array(columns[name], dtype=bool)
+
+        return cls(
+            synchronization_coefficient=floats("synchronization_coefficient"),
+            execution_type_code=np.array(
+                [exec_code[v] for v in columns["execution_type"]], dtype=np.int8
+            ),
+            regime_code=np.array(
+                [regime_code[v] for v in columns["regime_label"]], dtype=np.int8
+            ),
+            event_authorized=bools("event_authorized"),
+            event_authorization_confidence=floats("event_authorization_confidence"),
+            absorption_capacity=floats("absorption_capacity"),
+            valve_saturation_score=floats("valve_saturation_score"),
+            queue_pressure=floats("queue_pressure"),
+            hidden_flow_suspected=bools("hidden_flow_suspected"),
+            observed_dom_confidence=floats("observed_dom_confidence"),
+            collective_execution_risk=floats("collective_execution_risk"),
+            reflexive_cascade_risk=floats("reflexive_cascade_risk"),
+            diagnostic_flags=np.array(columns["diagnostic_flags"], dtype=np.int64),
+        )
+
+    def result(self, i: int) -> SynchronizationResult:
+        exec_type = EXECUTION_TYPES[self.execution_type_code[i]]
+        return SynchronizationResult(
+            synchronization_coefficient=float(self.synchronization_coefficient[i]),
+            execution_type=exec_type.value,
+            execution_type_label=EXECUTION_TYPE_LABELS[exec_type],
+            regime_label=REGIME_LABELS[self.regime_code[i]].value,
+            event_authorized=bool(self.event_authorized[i]),
+            event_authorization_confidence=float(
+                self.event_authorization_confidence[i]
+            ),
+            absorption_capacity=float(self.absorption_capacity[i]),
+            valve_saturation_score=float(self.valve_saturation_score[i]),
+            queue_pressure=float(self.queue_pressure[i]),
+            hidden_flow_suspected=bool(self.hidden_flow_suspected[i]),
+            observed_dom_confidence=float(self.observed_dom_confidence[i]),
+            collective_execution_risk=float(self.collective_execution_risk[i]),
+            reflexive_cascade_risk=float(self.reflexive_cascade_risk[i]),
+            diagnostic_flags=int(self.diagnostic_flags[i]),
+        )
+
+    def to_dicts(self, compact: bool = False, fast: bool = False) -> List[Dict]:
+        return [r.to_dict(compact, fast) for r in self]
+
+
+def _normalize_array(
+    value: np.ndarray, baseline: float, scale: float, max_clamp: float = 2.0
+) -> np.ndarray:
+    if scale == 0 or baseline == 0:
+        return np.zeros(value.shape)
+    return np.minimum(np.abs(value - baseline) / scale / max_clamp, 1.0)
+
+
+def _factor_arrays(pd_, cvd, vsr, swr, vexp, epm, pcd, profile: SyncProfile):
+    # Same expressions and operation order as compute_synchronization, in
+    # SyncProfile.WEIGHT_FIELDS order
+    window = profile.event_window_minutes
+    return (
+        np.minimum(np.abs(pd_) / profile.price_scale, 1.0),
+        np.minimum(np.abs(cvd) / profile.cvd_scale, 1.0),
+        _normalize_array(vsr, profile.volume_baseline, profile.volume_baseline),
+        np.where(
+            swr <= profile.spread_baseline,
+            0.0,
+            _normalize_array(swr, profile.spread_baseline, profile.spread_scale),
+        ),
+        np.minimum(vexp / profile.volatility_scale, 1.0),
+        np.where(epm < window, np.maximum(0.0, 1.0 - epm / window), 0.0),
+        np.minimum(pcd / profile.cruise_deviation_scale, 1.0),
+    )
+
+
+def _float_inputs(*arrays) -> List[np.ndarray]:
+    return np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(a, dtype=float)) for a in arrays)
+    )
+
+
+def sync_factor_matrix(
+    price_displacement=0.0,
+    cvd_acceleration=0.0,
+    volume_spike_ratio=1.0,
+    spread_widening_ratio=0.0,
+    volatility_expansion=0.0,
+    event_proximity_minutes=float("inf"),
+    prior_cruise_deviation=0.0,
+    profile: SyncProfile = DEFAULT_PROFILE,
+) -> np.ndarray:
+    """(steps, 7) normalized factors; the pre-clip S_c is this @ profile.weights."""
+    inputs = _float_inputs(
+        price_displacement,
+        cvd_acceleration,
+        volume_spike_ratio,
+        spread_widening_ratio,
+        volatility_expansion,
+        event_proximity_minutes,
+        prior_cruise_deviation,
+    )
+    return np.column_stack(_factor_arrays(*inputs, profile))
+
+
+def compute_synchronization_batch(
+    price_displacement=0.0,
+    cvd_acceleration=0.0,
+    volume_spike_ratio=1.0,
+    spread_widening_ratio=0.0,
+    volatility_expansion=0.0,
+    event_proximity_minutes=float("inf"),
+    prior_cruise_deviation=0.0,
+    cvd_trend_strong=False,
+    price_bounded_while_cvd_trends=False,
+    event_type="unknown",
+    force_post_release=False,
+    profile: SyncProfile = DEFAULT_PROFILE,
+) -> SynchronizationBatch:
+    """Array-in, array-out compute_synchronization.
+
+    Every argument is a scalar or an array broadcastable to the batch length.
+    ``event_type`` may be strings, or integer codes where 0 means "unknown"
+    (as returned by EventCalendar.proximity).
+    """
+    pd_, cvd, vsr, swr, vexp, epm, pcd = _float_inputs(
+        price_displacement,
+        cvd_acceleration,
+        volume_spike_ratio,
+        spread_widening_ratio,
+        volatility_expansion,
+        event_proximity_minutes,
+        prior_cruise_deviation,
+    )
+    n = pd_.shape
+    trend_strong = np.broadcast_to(np.asarray(cvd_trend_strong, dtype=bool), n)
+    bounded = np.broadcast_to(np.asarray(price_bounded_while_cvd_trends, dtype=bool), n)
+    post_release = np.broadcast_to(np.asarray(force_post_release, dtype=bool), n)
+    event_type = np.asarray(event_type)
+    if event_type.dtype.kind in "iu":
+        event_known = np.broadcast_to(event_type != 0, n)
+    else:
+        event_known = np.broadcast_to(event_type != "unknown", n)
+
+    (
+        price_factor,
+        cvd_factor,
+        volume_factor,
+        spread_factor,
+        vol_factor,
+        event_factor,
+        cruise_deviation_factor,
+    ) = _factor_arrays(pd_, cvd, vsr, swr, vexp, epm, pcd, profile)
+    near_event = epm < profile.event_window_minutes
+
+    sc = (
+        profile.price_weight * price_factor
+        + profile.cvd_weight * cvd_factor
+        + profile.volume_weight * volume_factor
+        + profile.spread_weight * spread_factor
+        + profile.volatility_weight * vol_factor
+        + profile.event_weight * event_factor
+        + profile.cruise_deviation_weight * cruise_deviation_factor
+    )
+    sc = np.maximum(0.0, np.minimum(1.0, sc))
+
+    valve_saturation = volume_factor * 0.4 + price_factor * 0.3 + cvd_factor * 0.3
+    valve_saturation = np.maximum(0.0, np.minimum(1.0, valve_saturation))
+
+    absorbing = trend_strong & (sc < 0.3)
+    raw_capacity = np.maximum(0.0, 1.0 - valve_saturation)
+    absorption_capacity = np.where(absorbing, raw_capacity * 0.8, raw_capacity)
+    hidden_flow = absorbing | bounded
+
+    queue_pressure = price_factor * 0.3 + volume_factor * 0.3 + valve_saturation * 0.4
+    queue_pressure = np.maximum(0.0, np.minimum(1.0, queue_pressure))
+
+    event_authorized = near_event & event_known
+    auth_confidence = np.where(event_authorized, event_factor, 0.0)
+
+    reflexive = (sc >= 0.65) & (queue_pressure > 0.6) & (vol_factor > 0.5)
+    collective_risk = sc * 0.7 + queue_pressure * 0.3
+    collective_risk = np.maximum(0.0, np.minimum(1.0, collective_risk))
+    cascade_risk = np.where(
+        reflexive,
+        np.minimum(1.0, collective_risk * 1.2 * vol_factor),
+        collective_risk * 0.2,
+    )
+
+    exec_code = np.select(
+        [reflexive, sc >= 0.30],
+        [_EXEC_CODE[ExecutionType.TYPE_III], _EXEC_CODE[ExecutionType.TYPE_II]],
+        _EXEC_CODE[ExecutionType.TYPE_I],
+    ).astype(np.int8)
+
+    mid_band = sc >= 0.30
+    regime_code = np.select(
+        [
+            post_release & (valve_saturation > 0.7),
+            post_release,
+            reflexive,
+            sc >= 0.65,
+            mid_band & (np.abs(pd_) < 0.3),
+            mid_band & (pd_ > 0),
+            mid_band,
+            hidden_flow,
+            (pcd > 0.3) & (sc > 0.10),
+        ],
+        [
+            _REGIME_CODE[RegimeLabel.FAILED_RESTORATION],
+            _REGIME_CODE[RegimeLabel.FLIGHT_LEVEL_STABILIZATION],
+            _REGIME_CODE[RegimeLabel.REFLEXIVE_CASCADE],
+            _REGIME_CODE[RegimeLabel.COLLECTIVE_EXECUTION_MANEUVER],
+            _REGIME_CODE[RegimeLabel.ALTITUDE_TRANSITION],
+            _REGIME_CODE[RegimeLabel.STEP_CLIMB],
+            _REGIME_CODE[RegimeLabel.STEP_DESCENT],
+            _REGIME_CODE[RegimeLabel.PRESSURE_ACCUMULATION],
+            _REGIME_CODE[RegimeLabel.PERSISTENCE_DECAY],
+        ],
+        _REGIME_CODE[RegimeLabel.STABLE_CRUISE],
+    ).astype(np.int8)
+
+    stable = regime_code == _REGIME_CODE[RegimeLabel.STABLE_CRUISE]
+    flags = np.zeros(n, dtype=np.int64)
+    for mask, code in (
+        ((np.abs(cvd) > 1.0) & (np.abs(pd_) < 0.5), SyncDiagnostic.PRICE_LAGGED_CVD),
+        (hidden_flow & ~post_release, SyncDiagnostic.PRESSURE_ABSORBED),
+        (event_authorized, SyncDiagnostic.EVENT_SYNCHRONIZED),
+        ((sc < 0.3) & stable, SyncDiagnostic.ORDINARY_TREND),
+        (~((sc < 0.3) & stable) & (sc >= 0.65), SyncDiagnostic.PRESSURE_RELEASE),
+        (post_release, SyncDiagnostic.POST_EVENT_BOUNCE),
+        (valve_saturation > 0.7, SyncDiagnostic.VALVE_SATURATION_HIGH),
+        (bounded, SyncDiagnostic.CVD_TRENDS_PRICE_BOUNDED),
+    ):
+        flags |= np.where(mask, code, 0)
+
+    return SynchronizationBatch(
+        synchronization_coefficient=sc,
+        execution_type_code=exec_code,
+        regime_code=regime_code,
+        event_authorized=event_authorized,
+        event_authorization_confidence=auth_confidence,
+        absorption_capacity=absorption_capacity,
+        valve_saturation_score=valve_saturation,
+        queue_pressure=queue_pressure,
+        hidden_flow_suspected=hidden_flow,
+        observed_dom_confidence=np.maximum(0.0, 1.0 - queue_pressure * 0.5),
+        collective_execution_risk=collective_risk,
+        reflexive_cascade_risk=cascade_risk,
+        diagnostic_flags=flags,
+    )
+
+
+# Event distances beyond this are all "no event" for any realistic window
+_NO_EVENT_MINUTES = 1e9
+
+
+class SyncCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class SyncCache:
+    """Bounded LRU memo in front of compute_synchronization.
+
+    Float inputs are rounded to ``precision`` decimals and the result is
+    computed from the rounded values, so every call landing in the same bucket
+    gets the same shared (immutable) SynchronizationResult. Use it on scalar
+    paths that repeat inputs, e.g. the many neutral ticks in FlightOpsCore;
+    large arrays should go through compute_synchronization_batch instead.
+    """
+
+    ARGS = (
+        "price_displacement",
+        "cvd_acceleration",
+        "volume_spike_ratio",
+        "spread_widening_ratio",
+        "volatility_expansion",
+        "event_proximity_minutes",
+        "prior_cruise_deviation",
+        "cvd_trend_strong",
+        "price_bounded_while_cvd_trends",
+        "event_type",
+        "force_post_release",
+    )
+    DEFAULTS = (
+        0.0,
+        0.0,
+        1.0,
+        0.0,
+        0.0,
+        float("inf"),
+        0.0,
+        False,
+        False,
+        "unknown",
+        False,
+    )
+    _ARG_INDEX = {name: i for i, name in enumerate(ARGS)}
+
+    def __init__(self, maxsize: int = 4096, precision: int = 4):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.precision = precision
+        self._scale = 10.0**precision
+        self._entries: "OrderedDict[Tuple, SynchronizationResult]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _bucket(self, value: float):
+        # Slow path for values round() rejects: keep +/-inf, fold NaN into 0
+        value = float(value)
+        if value != value:
+            return 0
+        if value in (math.inf, -math.inf):
+            return value
+        return round(value * self._scale)
+
+    def key(self, *args, profile: SyncProfile = DEFAULT_PROFILE, **kwargs) -> Tuple:
+        """Float inputs become integer multiples of 10**-precision."""
+        values = [*args, *self.DEFAULTS[len(args) :]]
+        index = self._ARG_INDEX
+        for name, value in kwargs.items():
+            values[index[name]] = value
+        if values[5] > _NO_EVENT_MINUTES:
+            # "No event" (inf) is the common case; keep it on the fast path
+            values[5] = _NO_EVENT_MINUTES
+        scale = self._scale
+        try:
+            key = [round(v * scale) for v in values[:7]]
+        except (OverflowError, ValueError):
+            key = [self._bucket(v) for v in values[:7]]
+        key += (
+            bool(values[7]),
+            bool(values[8]),
+            values[9],
+            bool(values[10]),
+            # Dataclass hashing is slow; the default profile keys as None
+            None if profile is DEFAULT_PROFILE else profile,
+        )
+        return tuple(key)
+
+    def compute(self, *args, **kwargs) -> SynchronizationResult:
+        """Same signature as compute_synchronization."""
+        key = self.key(*args, **kwargs)
+        entries = self._entries
+        result = entries.get(key)
+        if result is not None:
+            entries.move_to_end(key)
+            self.hits += 1
+            return result
+        self.misses += 1
+        scale = self._scale
+        result = compute_synchronization(
+            *(q / scale for q in key[:7]),
+            *key[7:-1],
+            profile=key[-1] or DEFAULT_PROFILE
+        )
+        entries[key] = result
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+            self.evictions += 1
+        return result
+
+    __call__ = compute
+
+    def info(self) -> SyncCacheInfo:
+        return SyncCacheInfo(
+            self.hits, self.misses, self.evictions, self.maxsize, len(self._entries)
+        )
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
 
 
 def estimate_price_displacement(prices: List[float]) -> float:
@@ -360,6 +930,7 @@ def estimate_spread_widening(candle: dict, avg_range: float) -> float:
 
 
 def estimate_volatility_expansion(current_iv_delta: float, iv_std: float) -> float:
-    if iv_std == 0:
+    # NaN inputs mean IV is missing (unquoted), not expanding
+    if iv_std == 0 or math.isnan(iv_std) or math.isnan(current_iv_delta):
         return 0.0
     return abs(current_iv_delta) / iv_std
@@ -0,0 +1,145 @@
+# telemetry_ring.py
+"""
+Preallocated telemetry history for FlightStore slots.
+
+Every flight appends one snapshot per tick, so the history is kept as a single
+structured array of shape (depth, capacity): one row per tick, one column per
+slot, used as a ring. A tick is one vectorized row write instead of a dict per
+flight.
+
+Memory is depth * capacity * TELEMETRY_DTYPE.itemsize (59) bytes, e.g. about
+5.9 GB for depth 100k and 1000 slots, so FlightStore grows ``capacity`` with
+the flights actually added rather than with its column reservation. window()
+is a view while the requested snapshots do not wrap around the ring and a
+copy of the two pieces when they do. Dicts are only built by records(), at
+export.
+"""
+
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+TELEMETRY_DTYPE = np.dtype(
+    [
+        ("altitude", np.float64),
+        ("velocity", np.float64),
+        ("price", np.float64),
+        ("volume_ratio", np.float64),
+        ("spread", np.float64),
+        ("volatility", np.float64),
+        ("phase", np.int16),
+        ("flags", np.uint8),
+    ]
+)
+
+
+class TelemetryRing:
+    """Last ``depth`` snapshots of every slot.
+
+    count[slot] is how many snapshots the slot holds (slots added mid-run
+    start at 0, so older rows in their column are never read).
+    """
+
+    def __init__(self, depth: int = 10, capacity: int = 1024):
+        if depth < 1:
+            raise ValueError(f"Telemetry depth must be at least 1, got {depth}")
+        self.depth = depth
+        self.appends = 0
+        self.data = np.zeros((depth, capacity), dtype=TELEMETRY_DTYPE)
+        self.row_tick = np.zeros(depth, dtype=np.int64)
+        self.count = np.zeros(capacity, dtype=np.int64)
+
+    @property
+    def capacity(self) -> int:
+        return self.data.shape[1]
+
+    @property
+    def nbytes(self) -> int:
+        return self.data.nbytes + self.row_tick.nbytes + self.count.nbytes
+
+    @property
+    def last_tick(self) -> Optional[int]:
+        return int(self.row_tick[self._newest]) if self.appends else None
+
+    @property
+    def _newest(self) -> int:
+        return (self.appends - 1) % self.depth
+
+    def resize(self, capacity: int):
+        """Grows to at least ``capacity`` slots (doubling, like FlightStore)."""
+        if capacity <= self.capacity:
+            return
+        capacity = max(capacity, 2 * self.capacity)
+        data = np.zeros((self.depth, capacity), dtype=TELEMETRY_DTYPE)
+        data[:, : self.capacity] = self.data
+        count = np.zeros(capacity, dtype=np.int64)
+        count[: self.capacity] = self.count
+        self.data, self.count = data, count
+
+    def append(self, tick: int, n: int, columns: Dict[str, np.ndarray]):
+        """Writes one snapshot for slots [0, n); ``columns`` maps
+        TELEMETRY_DTYPE field names to arrays (or scalars) of length n."""
+        p = self.appends % self.depth
+        record = self.data[p]
+        for name, values in columns.items():
+            record[name][:n] = values
+        self.row_tick[p] = tick
+        self.appends += 1
+        held = self.count[:n]
+        np.minimum(held + 1, self.depth, out=held)
+
+    def latest(self) -> np.ndarray:
+        """Newest snapshot of every slot (a view; check count first)."""
+        return self.data[self._newest]
+
+    def _rows(self, rows: np.ndarray, slot: int, k: Optional[int]) -> np.ndarray:
+        # The last k rows of ``rows`` (ring order), oldest first
+        held = int(self.count[slot])
+        k = held if k is None else min(k, held)
+        end = self._newest + 1 if self.appends else 0
+        if k <= end:
+            return rows[end - k : end]
+        return np.concatenate((rows[self.depth - (k - end) :], rows[:end]))
+
+    def window(self, slot: int, k: Optional[int] = None) -> np.ndarray:
+        """The slot's last ``k`` snapshots, oldest first (a view unless they
+        wrap around the ring)."""
+        return self._rows(self.data[:, slot], slot, k)
+
+    def ticks(self, slot: int, k: Optional[int] = None) -> np.ndarray:
+        return self._rows(self.row_tick, slot, k)
+
+    def clear(self, slot: int):
+        self.count[slot] = 0
+
+    def move(self, src: int, dst: int):
+        """Copies slot ``src``'s history into slot ``dst``."""
+        self.data[:, dst] = self.data[:, src]
+        self.count[dst] = self.count[src]
+
+    def records(
+        self,
+        slot: int,
+        phase_names: Sequence[str],
+        status_flags: Dict[str, int],
+    ) -> List[Dict]:
+        """The slot's history as snapshot dicts (the pre-ring telemetry list)."""
+        window = self.window(slot)
+        columns = (window[name].tolist() for name in TELEMETRY_DTYPE.names)
+        altitude, velocity, price, volume, spread, volatility, phase, flags = columns
+        return [
+            {
+                "tick": tick,
+                "altitude": altitude[i],
+                "velocity": velocity[i],
+                "phase": phase_names[phase[i]],
+                "status_flags": {
+                    key: bool(flags[i] & bit) for key, bit in status_flags.items()
+                },
+                "price": price[i],
+                "volume_ratio": volume[i],
+                "spread": spread[i],
+                "volatility": volatility[i],
+            }
+            for i, tick in enumerate(self.ticks(slot).tolist())
+        ]
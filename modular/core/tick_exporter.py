@@ -0,0 +1,268 @@
+# tick_exporter.py
+"""
+Streaming per-tick export of FlightStore state.
+
+TickExporter is the incremental counterpart of FlightOpsCore.export_results:
+after every update() it takes the selected fields of every flight as column
+copies, keeps the rows of flights whose values changed since the previous
+tick (every row on the first tick and after roster changes), and hands them
+to a background thread that formats and appends them to disk. The simulation
+thread never formats text, and nothing accumulates in memory beyond
+``max_pending`` queued batches, so a run can keep its full history on disk.
+
+Formats:
+  "ndjson": one JSON object per row: {"tick", "id", <fields>}.
+  "columnar": one NumPy structured array per tick, appended with np.save;
+      read back in order with repeated np.load on the same file.
+
+TickReader follows either file incrementally; poll() returns the rows
+appended since the previous call and leaves a batch that is still being
+written for the next one.
+"""
+
+import json
+import os
+import queue
+import threading
+import time
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .flight_store import MODES, Flag, FlightStore
+
+EXPORT_FORMATS = ("ndjson", "columnar")
+
+_COLUMN_FIELDS = ("price", "altitude", "velocity", "heading", "x", "y", "holding_ticks")
+_FLAG_FIELDS = {
+    "stall": Flag.STALL,
+    "turbulence": Flag.TURBULENCE,
+    "cleared_to_land": Flag.CLEARED_TO_LAND,
+    "conflict": Flag.CONFLICT,
+}
+_SYNC_FIELDS = ("synchronization_coefficient", "regime_label")
+FIELDS = ("mode", "phase") + _COLUMN_FIELDS + tuple(_FLAG_FIELDS) + _SYNC_FIELDS
+DEFAULT_FIELDS = ("mode", "phase", "price", "altitude", "velocity", "stall")
+
+
+def _field_values(store: FlightStore, name: str) -> np.ndarray:
+    # Raw per-slot values (codes for mode and phase), copied
+    n = store.n
+    if name in ("mode", "phase"):
+        return getattr(store, name)[:n].copy()
+    if name in _FLAG_FIELDS:
+        return (store.flags[:n] & _FLAG_FIELDS[name]) != 0
+    if name == "synchronization_coefficient":
+        return np.array([s.synchronization_coefficient for s in store.sync], float)
+    if name == "regime_label":
+        return np.array([s.regime_label for s in store.sync], dtype=str)
+    return store.column(name).copy()
+
+
+def _changed(values: np.ndarray, last: np.ndarray) -> np.ndarray:
+    if values.dtype.kind == "f":
+        return (values != last) & ~(np.isnan(values) & np.isnan(last))
+    return values != last
+
+
+def _floats(values: List[float]) -> List[Optional[float]]:
+    # NaN (no position) as null, keeping the NDJSON valid JSON
+    return [None if v != v else v for v in values]
+
+
+class TickExporter:
+    """Appends per-tick flight rows to ``path`` from a background thread.
+
+    fields: names from FIELDS (DEFAULT_FIELDS by default).
+    changes_only: skip flights whose fields are unchanged since the last tick.
+    flush_interval: seconds between file flushes while batches keep coming.
+    max_pending: queued batches before write() blocks on the writer.
+
+    If the writer fails, the file is closed, ``error`` holds the exception
+    and the next write() or close() raises it.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        fmt: str = "ndjson",
+        fields: Optional[Sequence[str]] = None,
+        changes_only: bool = True,
+        flush_interval: float = 1.0,
+        max_pending: int = 64,
+    ):
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format: {fmt}")
+        fields = tuple(fields or DEFAULT_FIELDS)
+        unknown = [name for name in fields if name not in FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown export fields: {unknown}")
+        self.path = path
+        self.fmt = fmt
+        self.fields = fields
+        self.changes_only = changes_only
+        self.flush_interval = flush_interval
+        self.written = 0  # rows on disk
+        self.error: Optional[BaseException] = None
+        self._last: Optional[Dict[str, np.ndarray]] = None
+        self._version = -1
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_pending)
+        self._file = open(
+            path,
+            "ab" if fmt == "columnar" else "a",
+            encoding=None if fmt == "columnar" else "utf-8",
+        )
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def write(self, store: FlightStore, tick: int):
+        """Queues ``tick``'s rows; called by FlightOpsCore after each update()."""
+        if self.error is not None:
+            raise RuntimeError(f"Tick export to {self.path} failed") from self.error
+        values = {name: _field_values(store, name) for name in self.fields}
+        if (
+            self.changes_only
+            and self._last is not None
+            and store.version == self._version
+        ):
+            changed = np.zeros(store.n, dtype=bool)
+            for name, column in values.items():
+                changed |= _changed(column, self._last[name])
+            rows = np.flatnonzero(changed)
+            ids = store.ids
+            batch_ids = [ids[i] for i in rows.tolist()]
+            columns = {name: column[rows] for name, column in values.items()}
+        else:
+            batch_ids, columns = list(store.ids), values
+        self._last, self._version = values, store.version
+        if batch_ids:
+            phase_names = list(store.phase_names) if "phase" in values else None
+            self._queue.put((tick, batch_ids, columns, phase_names))
+
+    # --- Writer thread ---
+    def _lists(self, columns: Dict[str, np.ndarray], phase_names) -> Dict[str, List]:
+        out = {}
+        for name, column in columns.items():
+            if name == "mode":
+                out[name] = [MODES[c] for c in column.tolist()]
+            elif name == "phase":
+                out[name] = [phase_names[c] for c in column.tolist()]
+            elif column.dtype.kind == "f":
+                out[name] = _floats(column.tolist())
+            else:
+                out[name] = column.tolist()
+        return out
+
+    def _ndjson(self, tick: int, ids: List[str], columns, phase_names) -> str:
+        lists = self._lists(columns, phase_names)
+        names = list(lists)
+        lines = []
+        for i, flight_id in enumerate(ids):
+            row = {"tick": tick, "id": flight_id}
+            for name in names:
+                row[name] = lists[name][i]
+            lines.append(json.dumps(row, ensure_ascii=False))
+        return "\n".join(lines) + "\n"
+
+    def _columnar(self, tick: int, ids: List[str], columns, phase_names) -> np.ndarray:
+        named = {"id": np.array(ids, dtype=str)}
+        for name, column in columns.items():
+            if name == "mode":
+                column = np.array(MODES)[column]
+            elif name == "phase":
+                column = np.array(phase_names)[column]
+            named[name] = column
+        batch = np.empty(
+            len(ids),
+            dtype=[("tick", np.int64)]
+            + [(name, column.dtype) for name, column in named.items()],
+        )
+        batch["tick"] = tick
+        for name, column in named.items():
+            batch[name] = column
+        return batch
+
+    def _run(self):
+        last_flush = time.monotonic()
+        try:
+            while True:
+                try:
+                    item = self._queue.get(timeout=self.flush_interval)
+                except queue.Empty:
+                    item = ()
+                if item is None:
+                    break
+                if item:
+                    tick, ids, columns, phase_names = item
+                    if self.fmt == "ndjson":
+                        self._file.write(self._ndjson(tick, ids, columns, phase_names))
+                    else:
+                        np.save(
+                            self._file, self._columnar(tick, ids, columns, phase_names)
+                        )
+                    self.written += len(ids)
+                if time.monotonic() - last_flush >= self.flush_interval:
+                    self._file.flush()
+                    last_flush = time.monotonic()
+        except Exception as e:
+            self.error = e
+        finally:
+            self._file.close()
+        if self.error is not None:
+            # Keep draining so write() never blocks on a dead writer
+            while self._queue.get() is not None:
+                pass
+
+    def close(self):
+        """Writes everything queued and closes the file; raises the writer's
+        error if it failed, including on the final batches."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        if self.error is not None:
+            raise RuntimeError(f"Tick export to {self.path} failed") from self.error
+
+
+class TickReader:
+    """Follows a TickExporter file; fmt is inferred from the extension
+    (.npy: columnar, anything else: NDJSON)."""
+
+    def __init__(self, path: str, fmt: Optional[str] = None):
+        self.path = path
+        self.fmt = fmt or ("columnar" if path.endswith(".npy") else "ndjson")
+        if self.fmt not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format: {self.fmt}")
+        self.offset = 0  # bytes consumed
+
+    def poll(self) -> List[Dict]:
+        """Rows appended since the last poll (complete batches only)."""
+        if not os.path.exists(self.path):
+            return []
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            if self.fmt == "ndjson":
+                data = f.read()
+                end = data.rfind(b"\n") + 1
+                self.offset += end
+                return [json.loads(line) for line in data[:end].splitlines() if line]
+            rows: List[Dict] = []
+            while True:
+                start = f.tell()
+                try:
+                    batch = np.load(f, allow_pickle=False)
+                except (EOFError, ValueError, OSError):
+                    # End of file, or a batch the writer has not finished
+                    f.seek(start)
+                    break
+                rows.extend(_batch_rows(batch))
+                self.offset = f.tell()
+            return rows
+
+
+def _batch_rows(batch: np.ndarray) -> List[Dict]:
+    names = batch.dtype.names
+    columns = []
+    for name in names:
+        values = batch[name].tolist()
+        columns.append(_floats(values) if batch.dtype[name].kind == "f" else values)
+    return [dict(zip(names, row)) for row in zip(*columns)]
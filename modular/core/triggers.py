@@ -0,0 +1,387 @@
+# triggers.py
+"""
+Declarative cross-domain triggers over FlightStore columns.
+
+A TriggerRule reads: for every link of kind ``link`` whose source satisfies
+``when``, apply ``then`` to the target; targets whose links all fail ``when``
+get ``otherwise``. Conditions and actions are small objects that evaluate on
+whole slot arrays, so a rule costs a few NumPy operations over its links no
+matter how many there are:
+
+    TriggerRule(
+        "market_stall",
+        link="market_aircraft",
+        when=FlagSet(Flag.STALL),
+        then=SetFlag(Flag.STALL),
+        message="Market flight {source} is stalled. Aircraft {target} set to stall.",
+    )
+
+Conditions combine with ``&``, ``|`` and ``~``. Rules run in registration
+order, each seeing the effects of the ones before it. Links are explicit
+(source slot, target slot) pairs grouped by kind in a LinkTable. Every target
+whose state a ``then`` action changes is recorded once as a TriggerEvent in the
+engine log.
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from typing import (
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import numpy as np
+
+from .event_bus import Level
+from .flight_store import Flag, FlightStore
+
+
+# --- Conditions: (store, source slots) -> bool mask ---
+class Condition:
+    def __call__(self, store: FlightStore, slots: np.ndarray) -> np.ndarray:
+        raise NotImplementedError
+
+    def __and__(self, other: "Condition") -> "Condition":
+        return _Combined(np.logical_and, self, other)
+
+    def __or__(self, other: "Condition") -> "Condition":
+        return _Combined(np.logical_or, self, other)
+
+    def __invert__(self) -> "Condition":
+        return _Not(self)
+
+
+class _Combined(Condition):
+    def __init__(self, op, left: Condition, right: Condition):
+        self.op, self.left, self.right = op, left, right
+
+    def __call__(self, store, slots):
+        return self.op(self.left(store, slots), self.right(store, slots))
+
+
+class _Not(Condition):
+    def __init__(self, inner: Condition):
+        self.inner = inner
+
+    def __call__(self, store, slots):
+        return ~self.inner(store, slots)
+
+
+class FlagSet(Condition):
+    def __init__(self, bit: int):
+        self.bit = bit
+
+    def __call__(self, store, slots):
+        return (store.flags[slots] & self.bit) != 0
+
+
+class PhaseIs(Condition):
+    def __init__(self, phase: str):
+        self.phase = phase
+
+    def __call__(self, store, slots):
+        return store.phase[slots] == store.phase_code(self.phase)
+
+
+class Above(Condition):
+    def __init__(self, column: str, value: float):
+        self.column, self.value = column, value
+
+    def __call__(self, store, slots):
+        return getattr(store, self.column)[slots] > self.value
+
+
+class Below(Condition):
+    def __init__(self, column: str, value: float):
+        self.column, self.value = column, value
+
+    def __call__(self, store, slots):
+        return getattr(store, self.column)[slots] < self.value
+
+
+# --- Actions on target slots ---
+class Action:
+    def pending(self, store: FlightStore, targets: np.ndarray) -> np.ndarray:
+        """Mask of targets whose state the action would change."""
+        raise NotImplementedError
+
+    def apply(self, store: FlightStore, targets: np.ndarray, fires: np.ndarray):
+        """``targets`` are unique; ``fires`` counts the links firing into each."""
+        raise NotImplementedError
+
+
+class SetFlag(Action):
+    def __init__(self, bit: int):
+        self.bit = bit
+
+    def pending(self, store, targets):
+        return (store.flags[targets] & self.bit) == 0
+
+    def apply(self, store, targets, fires):
+        store.flags[targets] |= self.bit
+
+
+class SetPhase(Action):
+    """Sets the phase. With ``counter``, targets entering the phase start the
+    counter at 1 and targets already in it with a running counter add 1, once
+    per firing link."""
+
+    def __init__(self, phase: str, counter: Optional[str] = None):
+        self.phase, self.counter = phase, counter
+
+    def pending(self, store, targets):
+        return store.phase[targets] != store.phase_code(self.phase)
+
+    def apply(self, store, targets, fires):
+        entering = self.pending(store, targets)
+        store.phase[targets] = store.phase_code(self.phase)
+        if self.counter is not None:
+            counter = getattr(store, self.counter)
+            running = counter[targets]
+            counter[targets] = np.where(
+                entering, fires, np.where(running > 0, running + fires, running)
+            )
+
+
+class ResetCounter(Action):
+    def __init__(self, counter: str):
+        self.counter = counter
+
+    def pending(self, store, targets):
+        return getattr(store, self.counter)[targets] != 0
+
+    def apply(self, store, targets, fires):
+        getattr(store, self.counter)[targets] = 0
+
+
+@dataclass
+class TriggerRule:
+    name: str
+    link: str  # LinkTable kind the rule runs over
+    when: Condition  # on source slots
+    then: Action  # on targets of firing links
+    otherwise: Optional[Action] = None  # on targets with no firing link
+    message: str = "{source} -> {target}"
+
+
+class TriggerEvent(NamedTuple):
+    tick: int
+    rule: str
+    source: str
+    target: str
+    template: str
+
+    level = Level.INFO
+
+    @property
+    def message(self) -> str:
+        return self.template.format(source=self.source, target=self.target)
+
+
+DEFAULT_RULES = (
+    TriggerRule(
+        "market_stall",
+        link="market_aircraft",
+        when=FlagSet(Flag.STALL),
+        then=SetFlag(Flag.STALL),
+        message="Market flight {source} is stalled. Aircraft {target} set to stall.",
+    ),
+    TriggerRule(
+        "go_around_holding",
+        link="traffic_aircraft",
+        when=PhaseIs("GoAround"),
+        then=SetPhase("Holding", counter="holding_ticks"),
+        otherwise=ResetCounter("holding_ticks"),
+        message="Traffic flight {source} in GoAround. Aircraft {target} set to Holding phase.",
+    ),
+    TriggerRule(
+        "holding_cleared_to_land",
+        link="aircraft_traffic",
+        when=Above("holding_ticks", 2),
+        then=SetFlag(Flag.CLEARED_TO_LAND),
+        message="Aircraft {source} held >2 ticks. Traffic {target} set to ClearedToLand.",
+    ),
+)
+
+# (source mode, target mode) of the link kinds used by DEFAULT_RULES
+DEFAULT_LINK_KINDS = {
+    "market_aircraft": ("market", "aircraft"),
+    "traffic_aircraft": ("traffic", "aircraft"),
+    "aircraft_traffic": ("aircraft", "traffic"),
+}
+
+
+_NO_LINKS = (
+    np.zeros(0, dtype=np.int64),
+    np.zeros(0, dtype=np.int64),
+    np.zeros(0, dtype=bool),
+)
+
+
+# (rule, sources, targets, firing) -> (source ids, targets, firing); see evaluate()
+Exchange = Callable[
+    ["TriggerRule", np.ndarray, np.ndarray, np.ndarray],
+    Tuple[Sequence[str], np.ndarray, np.ndarray],
+]
+
+
+def position_links(
+    sources: np.ndarray, targets: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Pairs the i-th source with the i-th target (the last target once they
+    run out), the implicit pairing FlightOpsCore used before explicit links."""
+    if len(sources) == 0 or len(targets) == 0:
+        return _NO_LINKS[:2]
+    pick = np.minimum(np.arange(len(sources)), len(targets) - 1)
+    return np.asarray(sources, dtype=np.int64), np.asarray(targets)[pick]
+
+
+class LinkTable:
+    """(source slot, target slot) pairs per kind. ``auto`` marks generated
+    links so they can be rebuilt without touching explicit ones."""
+
+    def __init__(self):
+        self._kinds: Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(src) for src, _, _ in self._kinds.values())
+
+    @property
+    def kinds(self) -> List[str]:
+        return list(self._kinds)
+
+    def add(self, kind: str, sources, targets, auto: bool = False):
+        sources = np.atleast_1d(np.asarray(sources, dtype=np.int64))
+        targets = np.atleast_1d(np.asarray(targets, dtype=np.int64))
+        if sources.shape != targets.shape:
+            raise ValueError("sources and targets must have the same length")
+        src, dst, gen = self._kinds.get(kind, _NO_LINKS)
+        self._kinds[kind] = (
+            np.concatenate((src, sources)),
+            np.concatenate((dst, targets)),
+            np.concatenate((gen, np.full(len(sources), auto))),
+        )
+
+    def pairs(self, kind: str) -> Tuple[np.ndarray, np.ndarray]:
+        src, dst, _ = self._kinds.get(kind, _NO_LINKS)
+        return src, dst
+
+    def export_state(self) -> Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """(sources, targets, auto) copies per kind, for load_state()."""
+        return {
+            kind: tuple(part.copy() for part in parts)
+            for kind, parts in self._kinds.items()
+        }
+
+    def load_state(self, kinds: Dict[str, Tuple]):
+        """Replaces every link with export_state() output."""
+        self._kinds = {
+            kind: (
+                np.array(src, dtype=np.int64),
+                np.array(dst, dtype=np.int64),
+                np.array(auto, dtype=bool),
+            )
+            for kind, (src, dst, auto) in kinds.items()
+        }
+
+    def _keep(self, kind: str, keep: np.ndarray):
+        src, dst, gen = self._kinds[kind]
+        self._kinds[kind] = (src[keep], dst[keep], gen[keep])
+
+    def remove(self, kind: str, source: int, target: int):
+        if kind in self._kinds:
+            src, dst = self.pairs(kind)
+            self._keep(kind, ~((src == source) & (dst == target)))
+
+    def clear(self, kind: Optional[str] = None, auto: Optional[bool] = None):
+        """Drops the links of ``kind`` (all kinds by default); ``auto`` limits
+        it to generated (True) or explicit (False) links."""
+        for k in [kind] if kind is not None else list(self._kinds):
+            if k not in self._kinds:
+                continue
+            if auto is None:
+                del self._kinds[k]
+            else:
+                self._keep(k, self._kinds[k][2] != auto)
+
+    def on_remove(self, slot: int, moved_from: int):
+        """Follows FlightStore.remove: links of the removed slot go, links of
+        the flight moved from ``moved_from`` now point at ``slot``."""
+        for kind in list(self._kinds):
+            src, dst = self.pairs(kind)
+            self._keep(kind, (src != slot) & (dst != slot))
+            src, dst = self.pairs(kind)
+            src[src == moved_from] = slot
+            dst[dst == moved_from] = slot
+
+
+class TriggerEngine:
+    """Ordered rule registry, link table and bounded event log."""
+
+    def __init__(
+        self, rules: Iterable[TriggerRule] = DEFAULT_RULES, log_size: int = 10_000
+    ):
+        self.rules: Dict[str, TriggerRule] = {}
+        for rule in rules:
+            self.register(rule)
+        self.links = LinkTable()
+        self.log: Deque[TriggerEvent] = deque(maxlen=log_size)
+        self.fired = 0
+
+    def register(self, rule: TriggerRule):
+        """Adds ``rule`` (replacing one of the same name, in place)."""
+        self.rules[rule.name] = rule
+
+    def unregister(self, name: str):
+        del self.rules[name]
+
+    def evaluate(
+        self, store: FlightStore, tick: int, exchange: Optional[Exchange] = None
+    ) -> List[TriggerEvent]:
+        """Runs every rule once; returns the events fired this tick.
+
+        ``exchange`` (sharded runs) is called once per rule with the local
+        (sources, targets, firing) links and returns the links to apply here
+        as (source ids, target slots, firing), remote sources included; source
+        ids may be None when the links are unchanged.
+        """
+        events: List[TriggerEvent] = []
+        for rule in self.rules.values():
+            src, dst = self.links.pairs(rule.link)
+            firing = rule.when(store, src) if len(src) else _NO_LINKS[2]
+            if exchange is not None:
+                names, dst, firing = exchange(rule, src, dst, firing)
+            else:
+                names = None
+            if len(dst) == 0:
+                continue
+            fired_dst = dst[firing]
+            if len(fired_dst):
+                # Each target once, credited to its first firing link
+                targets, first, fires = np.unique(
+                    fired_dst, return_index=True, return_counts=True
+                )
+                changed = rule.then.pending(store, targets)
+                order = np.argsort(first[changed], kind="stable")
+                links = np.flatnonzero(firing)[first[changed]][order].tolist()
+                ids = store.ids
+                for link, t in zip(links, targets[changed][order].tolist()):
+                    source = ids[src[link]] if names is None else names[link]
+                    events.append(
+                        TriggerEvent(tick, rule.name, source, ids[t], rule.message)
+                    )
+                rule.then.apply(store, targets, fires)
+            if rule.otherwise is not None:
+                idle = np.setdiff1d(dst[~firing], fired_dst)
+                if len(idle):
+                    rule.otherwise.apply(store, idle, np.zeros(len(idle), np.int64))
+        self.log.extend(events)
+        self.fired += len(events)
+        return events
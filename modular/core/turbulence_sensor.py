@@ -6,15 +6,17 @@ def detect_iv_turbulence(iv_series: pd.Series, candle_df: pd.DataFrame, wick_thr
     """
     Classifies turbulence for each step based on IV delta and candle shape.
     Returns a list of 'Calm', 'Moderate', or 'Heavy' for each row in candle_df.
+    iv_series is read positionally, aligned with candle_df rows; missing IV
+    (NaN) masks the IV delta to 0.
     """
     turbulence_levels = []
     iv_std = iv_series.std()
     iv_mean = iv_series.mean()
     prev_iv = None
-    for idx, row in candle_df.iterrows():
-        current_iv = iv_series.iloc[idx]
+    for pos, (_, row) in enumerate(candle_df.iterrows()):
+        current_iv = iv_series.iloc[pos] if pos < len(iv_series) else iv_series.iloc[-1]
         # Calculate IV delta
-        if prev_iv is None:
+        if prev_iv is None or pd.isna(current_iv) or pd.isna(prev_iv):
             iv_delta = 0
         else:
             iv_delta = abs(current_iv - prev_iv)
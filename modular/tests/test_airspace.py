@@ -0,0 +1,95 @@
+import sys
+import os
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from core.airspace import CONFLICT_LINK, AirspaceGrid
+from core.flight_ops_core import FlightOpsCore, FlightState
+from core.flight_store import Flag, FlightStore
+from core.triggers import FlagSet, SetPhase, TriggerRule
+
+AIRPORTS = {"KSEA": {"x": 0.0, "y": 0.0}, "KPDX": {"x": -30.0, "y": -120.0}}
+
+
+def test_grid_matches_brute_force():
+    rng = np.random.default_rng(4)
+    n = 1500
+    xy, altitude = rng.uniform(-80, 80, (n, 2)), rng.uniform(0, 4000, n)
+    store = FlightStore(n + 1)
+    for i in range(n):
+        position = {"x": xy[i, 0], "y": xy[i, 1]}
+        store.add(
+            FlightState(f"A{i}", "aircraft", altitude=altitude[i], position=position)
+        )
+    store.add(FlightState("MKT_SPY", "market"))  # no position: never indexed
+    distance = np.hypot(*(xy[:, None, :] - xy[None, :, :]).transpose(2, 0, 1))
+    for cell in (2.0, 5.0, 17.0):
+        grid = AirspaceGrid(cell)
+        grid.rebuild(store)
+        assert len(grid) == n
+        a, b = grid.conflicts(5.0, 1000.0)
+        close = (distance <= 5.0) & (np.abs(altitude[:, None] - altitude) < 1000)
+        assert np.array_equal(np.c_[a, b], np.argwhere(np.triu(close, 1)))
+        expected = np.flatnonzero(np.hypot(xy[:, 0] - 10, xy[:, 1] + 20) <= 25)
+        assert np.array_equal(grid.within(10, -20, 25), expected)
+        near = np.flatnonzero(distance[7] <= 12)
+        assert np.array_equal(grid.neighbors(store, 7, 12), near[near != 7])
+        assert len(grid.neighbors(store, n, 12)) == 0
+        src, dst = grid.links(store, [n, 9, 7], np.arange(0, n, 2), 12)
+        assert list(dict.fromkeys(src.tolist())) == [9, 7]
+        assert dst[src == 7].tolist() == [s for s in near if s % 2 == 0 and s != 7]
+    print(f"[PASS] Grid queries match brute force ({len(a)} conflicts)")
+
+
+def test_kinematics_conflicts_and_spatial_links():
+    ops = FlightOpsCore(
+        {
+            "seed": 1,
+            "airports": AIRPORTS,
+            "tick_seconds": 36,
+            "proximity_links": {"traffic_aircraft": ("traffic", "aircraft", 15.0)},
+        }
+    )
+    ops.load_aircraft(
+        [
+            {"id": "AC1", "origin": "KSEA", "dest": "KPDX"},
+            {"id": "AC2", "origin": "KSEA", "dest": "KPDX"},
+            {"id": "AC3", "origin": "KPDX", "dest": "KSEA"},
+            {"id": "AC4", "origin": "KBFI", "dest": "KSEA"},  # unknown airport
+        ]
+    )
+    ops.add_flight(
+        FlightState(
+            "TRF_PDX", "traffic", origin="KPDX", position={"x": -30.0, "y": -125.0}
+        )
+    )
+    ops.triggers.register(
+        TriggerRule(
+            "separation_holding",
+            link=CONFLICT_LINK,
+            when=FlagSet(Flag.CONFLICT),
+            then=SetPhase("Holding"),
+        )
+    )
+    ops.update()
+    ac1, ac3 = ops.get_flight("AC1"), ops.get_flight("AC3")
+    # 250 kt for 0.01 h along the KSEA -> KPDX bearing
+    step = 2.5 / np.hypot(30.0, 120.0)
+    assert np.isclose(ac1.position["x"], -30.0 * step)
+    assert np.isclose(ac1.position["y"], -120.0 * step)
+    assert np.isclose(ac3.heading, (ac1.heading + 180.0) % 360.0)
+    assert ops.get_flight("AC4").position == {}
+    assert ops.conflicts() == [("AC1", "AC2")]
+    assert ac1.conflict and not ac3.conflict
+    assert ac1.phase == "Holding" and ac3.phase == "Climb"
+    assert [f.id for f in ops.traffic_near("KPDX", 10.0)] == ["AC3", "TRF_PDX"]
+    assert [f.id for f in ops.neighbors("TRF_PDX", 10.0)] == ["AC3"]
+    src, dst = ops.triggers.links.pairs("traffic_aircraft")
+    assert [(ops.store.ids[s], ops.store.ids[d]) for s, d in zip(src, dst)] == [
+        ("TRF_PDX", "AC3")
+    ]
+    ops.remove_flight("AC1")
+    assert ops.conflicts() == [] and ops.get_flight("AC2").to_dict()["conflict"]
+    print("[PASS] Kinematics, conflicts and proximity links")
@@ -0,0 +1,67 @@
+import sys
+import os
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from core.cvd_meter import CVDMeter, bar_deltas, tick_rule_signs, _ema
+
+
+def test_tick_rule_carries_zero_ticks():
+    signs, last = tick_rule_signs([10.0, 10.0, 10.1, 10.1, 10.0, 10.0])
+    assert list(signs) == [0, 0, 1, 1, -1, -1]
+    assert last == -1
+    signs, _ = tick_rule_signs([10.0, 10.0], prev_price=9.9, prev_sign=-1)
+    assert list(signs) == [1, 1]
+    print("[PASS] Tick rule")
+
+
+def test_bar_delta_close_location():
+    deltas = bar_deltas([10, 10, 10], [12, 12, 10], [9, 9, 10], [12, 9, 10], [100] * 3)
+    assert list(deltas) == [100.0, -100.0, 0.0]
+    print("[PASS] Bar-level delta approximation")
+
+
+def test_blocked_ema_matches_recursion():
+    x = np.random.default_rng(0).standard_normal(2000)
+    expected, level = [], 0.5
+    for v in x:
+        level = 0.9 * level + 0.1 * v
+        expected.append(level)
+    assert np.allclose(_ema(x, 0.1, 0.5), expected)
+    print("[PASS] Blocked EMA")
+
+
+def test_streaming_matches_single_batch():
+    rng = np.random.default_rng(3)
+    prices = 100 + np.cumsum(rng.choice([-0.01, 0.0, 0.01], 50_000))
+    sizes = rng.integers(1, 500, 50_000)
+    steps = np.arange(50_000) // 100
+
+    whole = CVDMeter().update_ticks(prices, sizes, steps)
+    meter = CVDMeter()
+    first = meter.update_ticks(prices[:20_000], sizes[:20_000], steps[:20_000])
+    second = meter.update_ticks(prices[20_000:], sizes[20_000:], steps[20_000:])
+
+    assert len(whole) == 500
+    assert np.allclose(whole.cvd, np.concatenate([first.cvd, second.cvd]))
+    assert np.allclose(
+        whole.acceleration,
+        np.concatenate([first.acceleration, second.acceleration]),
+    )
+    print("[PASS] Streaming CVD matches batch")
+
+
+def test_one_sided_flow_flags_trend_and_bounded_price():
+    meter = CVDMeter(warmup=3)
+    quiet = meter.update_deltas(
+        np.tile([100.0, -100.0], 10), 100 + np.tile([0.1, -0.1], 10)
+    )
+    assert not quiet.trend_strong[-1]
+    # Persistent buying absorbed while price oscillates in a tight band
+    absorbed = meter.update_deltas(np.full(20, 150.0), 100 + np.tile([0.1, -0.1], 10))
+    assert absorbed.trend_strong[-1]
+    assert absorbed.price_bounded[-1]
+    assert absorbed.acceleration[0] > 1.0
+    print("[PASS] Trend strength and bounded price")
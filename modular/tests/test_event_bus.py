@@ -0,0 +1,115 @@
+import sys
+import os
+import json
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from core.event_bus import (
+    EventBus,
+    FileSink,
+    Level,
+    MemorySink,
+    PhaseChange,
+    StallCleared,
+    StallOnset,
+)
+from core.flight_ops_core import FlightOpsCore
+from core.flight_store import Flag
+from core.triggers import Below, SetFlag, TriggerEvent, TriggerRule
+
+
+def test_bus_batches_and_filters():
+    bus = EventBus(batch_size=3)
+    batches = []
+    stalls = MemorySink()
+    bus.subscribe(batches.append, level=Level.INFO)
+    bus.subscribe(stalls, level=Level.DEBUG, kinds=[StallOnset, StallCleared])
+    assert not bus.wants(PhaseChange) and bus.wants(StallCleared)
+    bus.publish(PhaseChange(0, "A", "Taxi", "Climb"))  # nobody takes it
+    bus.publish(StallOnset(0, "A"))
+    bus.publish(TriggerEvent(0, "r", "A", "B", "{source} -> {target}"))
+    assert batches == [] and bus.published == 2
+    bus.publish_many([StallCleared(1, "A"), PhaseChange(1, "B", "Taxi", "Climb")])
+    assert [len(b) for b in batches] == [3]  # flushed at batch_size
+    assert [type(e) for e in stalls.events] == [StallOnset, StallCleared]
+    bus.flush()
+    assert len(batches) == 1
+    print("[PASS] Event bus batches by size and filters by level and type")
+
+
+def test_core_publishes_typed_events_to_file():
+    ops = FlightOpsCore({})
+    ops.load_market_flights(["SPY"])
+    ops.load_aircraft([{"id": "AC001", "origin": "KSEA", "dest": "KPDX"}])
+    ops.triggers.register(
+        TriggerRule(
+            "cheap_market_stalls_aircraft",
+            link="market_aircraft",
+            when=Below("price", 1000.0),
+            then=SetFlag(Flag.STALL),
+        )
+    )
+    memory = MemorySink()
+    ops.bus.subscribe(memory, level=Level.INFO)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "events.ndjson")
+        ops.bus.subscribe(FileSink(path, fmt="ndjson"), level=Level.DEBUG)
+        for _ in range(2):
+            ops.update()
+        ops.bus.close()
+        with open(path, encoding="utf-8") as f:
+            records = [json.loads(line) for line in f]
+    kinds = [type(e).__name__ for e in memory.events]
+    # Tick 0: the rule stalls AC001. Tick 1: the shared stall logic clears it
+    # and the rule stalls it again, so the stall flag never changes across it
+    assert kinds == ["TriggerEvent", "StallOnset", "TriggerEvent"]
+    phase = next(r for r in records if r["type"] == "PhaseChange")
+    assert phase["level"] == "DEBUG" and phase["message"].startswith(phase["flight"])
+    assert {r["type"] for r in records} == {"PhaseChange", "TriggerEvent", "StallOnset"}
+    print(f"[PASS] Core events: {kinds}")
+
+
+def test_file_sink_surfaces_writer_errors():
+    with tempfile.TemporaryDirectory() as tmp:
+        sink = FileSink(os.path.join(tmp, "events.log"), max_pending=2)
+        bus = EventBus()
+        bus.subscribe(sink, level=Level.DEBUG)
+        # An unknown template field fails in the writer thread
+        bus.publish(TriggerEvent(0, "r", "A", "B", "{missing}"))
+        bus.flush()
+        while sink.error is None:
+            time.sleep(0.001)
+        assert isinstance(sink.error, KeyError)
+        assert sink._file.closed and sink._queue.maxsize == 2
+        bus.publish(StallOnset(1, "A"))
+        try:
+            bus.flush()
+        except RuntimeError as e:
+            assert e.__cause__ is sink.error
+        else:
+            raise AssertionError("flush after a writer failure should raise")
+        # A failure on the final batch surfaces from close(), and the bus
+        # still closes its other handlers
+        last = FileSink(os.path.join(tmp, "last.log"))
+        memory = MemorySink()
+        memory.close = lambda: memory.events.append("closed")
+        bus = EventBus()
+        bus.subscribe(last, level=Level.DEBUG)
+        bus.subscribe(memory, level=Level.DEBUG)
+        bus.publish(TriggerEvent(2, "r", "A", "B", "{missing}"))
+        try:
+            bus.close()
+        except RuntimeError as e:
+            assert isinstance(e.__cause__, KeyError)
+        else:
+            raise AssertionError("close after a writer failure should raise")
+        assert last._file.closed and memory.events[-1] == "closed"
+        try:
+            sink.close()
+        except RuntimeError:
+            pass
+        else:
+            raise AssertionError("close should re-raise the writer error")
+    print("[PASS] FileSink bounds its queue and re-raises writer errors")
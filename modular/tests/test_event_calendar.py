@@ -0,0 +1,57 @@
+import sys
+import os
+import math
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from core.event_calendar import EventCalendar, load_event_calendar
+
+
+def _calendar():
+    return EventCalendar(
+        pd.DataFrame(
+            {
+                "timestamp": [
+                    "2025-06-11 08:30",
+                    "2025-06-18 14:00",
+                    "2025-06-12 16:05",
+                ],
+                "event_type": ["CPI", "FOMC", "earnings"],
+                "ticker": ["", "*", "ORCL"],
+            }
+        )
+    )
+
+
+def test_nearest_event_scalar():
+    cal = _calendar()
+    assert len(cal) == 3
+    minutes, kind = cal.nearest("SPY", "2025-06-18 13:15")
+    assert minutes == 45.0 and kind == "fomc"
+    minutes, kind = cal.nearest("orcl", "2025-06-12 16:00")
+    assert minutes == 5.0 and kind == "earnings"
+    # Ticker-specific events do not leak to other tickers
+    minutes, kind = cal.nearest("SPY", "2025-06-12 16:00")
+    assert kind == "cpi"
+    print("[PASS] Nearest event lookup")
+
+
+def test_proximity_vectorized_matches_scalar():
+    cal = _calendar()
+    stamps = pd.date_range("2025-06-10", "2025-06-20", freq="37min")
+    minutes, codes = cal.proximity("ORCL", stamps)
+    for i in range(0, len(stamps), 50):
+        m, kind = cal.nearest("ORCL", stamps[i])
+        assert math.isclose(minutes[i], m)
+        assert cal.event_types[codes[i]] == kind
+    print(f"[PASS] Vectorized proximity over {len(stamps)} stamps")
+
+
+def test_empty_calendar_is_inactive():
+    cal = load_event_calendar("/nonexistent/events")
+    minutes, kinds = cal.proximity_labels("SPY", ["2025-06-18 14:00"])
+    assert minutes[0] == float("inf") and kinds == ["unknown"]
+    assert cal.nearest("SPY", "2025-06-18") == (float("inf"), "unknown")
+    print("[PASS] Empty calendar")
@@ -0,0 +1,129 @@
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from core.flight_ops_core import FlightOpsCore, FlightState
+from core.flight_store import Flag, FlightStore
+from core.synchronization import ExecutionType
+
+
+def _rescan(flights):
+    market = [f for f in flights if f.mode == "market"]
+    n = len(market)
+    return (
+        sum(f.sync.execution_type == ExecutionType.TYPE_II.value for f in market) / n,
+        sum(f.sync.execution_type == ExecutionType.TYPE_III.value for f in market) / n,
+        sum(f.sync.queue_pressure for f in market) / n,
+        sum(bool(f.sync.event_authorized) for f in market),
+    )
+
+
+def test_flock_rollup_matches_rescan():
+    ops = FlightOpsCore({"flock_history": 5, "seed": 11})
+    ops.load_market_flights([f"S{i}" for i in range(40)])
+    ops.load_aircraft([{"id": "AC001", "origin": "KSEA", "dest": "KPDX"}])
+    for _ in range(12):
+        ops.update()
+        state = ops.flock_state
+        ii, iii, pressure, alerts = _rescan(ops.flight_objects)
+        assert state.flights == 40
+        assert abs(state.type_ii_fraction - ii) < 1e-12
+        assert abs(state.type_iii_fraction - iii) < 1e-12
+        assert abs(state.mean_roost_pressure - pressure) < 1e-9
+        assert state.scout_alerts == alerts
+    assert len(ops.flock_history) == 5
+    assert ops.flock_history[-1].tick == ops.timestep - 1
+    print(f"[PASS] Flock rollup matches a full rescan: {state.to_dict()}")
+
+
+def test_store_views_write_through():
+    store = FlightStore(capacity=1)
+    slots = store.add_many(
+        [
+            FlightState(id="A", mode="aircraft", altitude=1000.0),
+            FlightState(id="T", mode="traffic", phase="Pushback"),
+        ]
+    )
+    assert slots == [0, 1] and store.capacity >= 2
+    ac = store.view(0)
+    ac.phase = "Holding"
+    ac.status_flags["stall"] = True
+    ac.altitude += 500
+    assert store.phase_names[store.phase[0]] == "Holding"
+    assert store.flags[0] & Flag.STALL and store.altitude[0] == 1500.0
+    assert store.view(1).phase == "Pushback"
+    ac.status_flags["stall"] = False
+    assert dict(ac.status_flags.items()) == {"stall": False, "turbulence": False}
+    assert ac.position == {} and not ac.position
+    ac.position = {"x": 1.0, "y": 2.0}
+    ac.position["x"] += 4.0  # writes through to the store
+    assert store.x[0] == 5.0 and ac.position == {"x": 5.0, "y": 2.0}
+    try:
+        ac.position["z"] = 0.0
+        assert False, "unknown position key accepted"
+    except KeyError:
+        pass
+    try:
+        store.add(FlightState(id="X", mode="glider"))
+        assert False, "unknown mode accepted"
+    except ValueError:
+        pass
+    print("[PASS] FlightView reads and writes the store columns")
+
+
+def test_mode_kernels():
+    ops = FlightOpsCore({"seed": 3})
+    ops.load_aircraft([{"id": "AC001", "origin": "KSEA", "dest": "KPDX"}])
+    ops.load_airtraffic("PNW")
+    phases = []
+    for _ in range(5):
+        ops.update()
+        ac, trf = ops.flight_objects
+        phases.append(trf.phase)
+    assert phases == ["Taxi", "Taxi", "Taxi", "GoAround", "Taxi"]
+    assert ac.altitude == 3500.0 and ac.velocity == 250.0 and ac.phase == "Climb"
+    assert trf.tick == 5 and not trf.status_flags["stall"]
+    print(f"[PASS] Mode kernels: traffic phases {phases}")
+
+
+def test_add_remove_mid_run():
+    ops = FlightOpsCore({"seed": 5})
+    ops.load_market_flights(["A", "B", "C"])
+    ops.load_aircraft(
+        [{"id": f"AC{i}", "origin": "KSEA", "dest": "KPDX"} for i in range(3)]
+    )
+    for _ in range(3):
+        ops.update()
+    ac2 = ops.get_flight("AC2")
+    history = ac2.telemetry
+    removed = ops.get_flight("MKT_A")
+    ops.remove_flight("MKT_A")
+    assert removed.slot is None and len(ops.flight_objects) == 5
+    # AC2 was the last slot and moved into the freed one, history included
+    assert ac2.slot == 0 and ops.get_flight("AC2") is ac2
+    assert ac2.telemetry == history
+    store = ops.store
+    assert sorted(store.ids[s] for s in store.slots("market")) == ["MKT_B", "MKT_C"]
+    assert sorted(store.ids[s] for s in store.slots("aircraft")) == [
+        "AC0",
+        "AC1",
+        "AC2",
+    ]
+    assert all(store.slot_of(f.id) == f.slot for f in ops.flight_objects)
+    # MKT_A's tracker row now holds AC2's (empty) row; the old last row is reset
+    bank = ops.sync_bank
+    assert bank.bars[0] == 0 and bank.last_result[0] is None
+    assert bank.bars[5] == 0 and len(ops.flock) == 2
+    assert bank.bars[store.slot_of("MKT_B")] == 2
+    new = ops.add_flight(FlightState(id="D", mode="market", price=120.0))
+    ops.update()
+    assert new.slot == 5 and len(new.telemetry) == 1 and new.tick == 1
+    assert new.sync["regime_label"] == new.sync.get("regime_label") != ""
+    assert ops.flock_state.flights == 3
+    try:
+        ops.add_flight(FlightState(id="D", mode="market"))
+        assert False, "duplicate id accepted"
+    except ValueError:
+        pass
+    print("[PASS] Flights added and removed mid-run keep indexes consistent")
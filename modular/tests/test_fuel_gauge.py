@@ -0,0 +1,59 @@
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from core.fuel_gauge import (
+    compute_fuel_levels,
+    fit_volume_profile,
+    get_volume_profile,
+    clear_profile_cache,
+    intraday_fuel_curve,
+    u_shaped_profile,
+)
+
+
+def test_fuel_from_actual_volume():
+    assert compute_fuel_levels(pd.Series([1, 2, 3, 4])) == [90.0, 70.0, 40.0, 0.0]
+    assert compute_fuel_levels(pd.Series([0, 0])) == [100.0, 100.0]
+    print("[PASS] Fuel from cumulative volume")
+
+
+def test_u_shaped_profile_burns_fastest_at_open_and_close():
+    fuel = intraday_fuel_curve(391)
+    assert fuel[0] == 100.0 and abs(fuel[-1]) < 1e-9
+    burn = -np.diff(fuel)
+    assert burn[0] > burn[195] and burn[-1] > burn[195]
+    assert len(intraday_fuel_curve(5, u_shaped_profile())) == 5
+    print("[PASS] U-shaped intraday fuel profile")
+
+
+def test_profile_fitted_per_ticker():
+    clear_profile_cache()
+    minutes = pd.date_range("2025-06-02 09:31", periods=390, freq="min")
+    bars = pd.DataFrame({"Date": minutes, "Volume": np.ones(390)})
+    # No bars yet: the default, not cached in place of a later fit
+    assert np.allclose(get_volume_profile("abc"), u_shaped_profile())
+    fitted = get_volume_profile("abc", bars)
+    assert np.allclose(fitted, np.linspace(0, 1, 391))
+    assert np.allclose(fit_volume_profile(bars), fitted)
+    # Later calls reuse the fit, with or without bars; refit=True refits
+    assert get_volume_profile("ABC") is fitted
+    assert np.allclose(intraday_fuel_curve(3, fitted), [100.0, 50.0, 0.0])
+    front = bars.assign(Volume=np.where(np.arange(390) < 195, 3.0, 1.0))
+    assert get_volume_profile("ABC", front) is fitted
+    refitted = get_volume_profile("ABC", front, refit=True)
+    assert refitted is not fitted and np.isclose(refitted[195], 0.75)
+    assert get_volume_profile("abc") is refitted
+    # Daily bars have no intraday volume: the U-shape, never cached as a fit
+    daily = pd.DataFrame(
+        {"Date": pd.date_range("2025-06-02", periods=5), "Volume": np.ones(5)}
+    )
+    assert np.allclose(get_volume_profile("XYZ", daily), u_shaped_profile())
+    assert np.allclose(get_volume_profile("XYZ", bars), fitted)
+    assert get_volume_profile("XYZ") is get_volume_profile("xyz", daily)
+    clear_profile_cache()
+    print("[PASS] Volume profile fitted and cached per ticker")
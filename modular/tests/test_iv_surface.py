@@ -0,0 +1,142 @@
+import sys
+import os
+import math
+import warnings
+from datetime import datetime
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from core.iv_surface import DEFAULT_ATM_IV, build_iv_surface
+from core.microturbulence import estimate_intraday_iv
+from core.stall_detector import detect_stalls
+from core.sync_tracker import SynchronizationTracker
+from core.synchronization import estimate_volatility_expansion
+from core.turbulence_sensor import detect_iv_turbulence
+
+
+def _quotedata(rows):
+    # Minimal CBOE quotedata layout: calls IV in "IV", puts IV in "IV.1"
+    return pd.DataFrame(
+        rows,
+        columns=["Expiration Date", "Strike", "Delta", "IV", "IV.1"],
+    )
+
+
+def _snapshots():
+    day1 = _quotedata(
+        [
+            ["Fri Jun 20 2025", 95.0, 0.70, 0.22, 0.24],
+            ["Fri Jun 20 2025", 100.0, 0.50, 0.20, 0.20],
+            ["Fri Jun 20 2025", 105.0, 0.30, 0.18, 0.0],
+            ["Fri Jul 18 2025", 100.0, 0.52, 0.25, 0.25],
+        ]
+    )
+    day2 = _quotedata(
+        [
+            ["Fri Jun 20 2025", 100.0, 0.55, 0.30, 0.30],
+            ["Fri Jun 20 2025", 110.0, 0.35, 0.26, 0.26],
+            ["Fri Jul 18 2025", 100.0, 0.55, 0.32, 0.32],
+            ["Fri Jul 18 2025", 110.0, 0.40, 0.28, 0.28],
+        ]
+    )
+    return [(datetime(2025, 6, 3), day2), (datetime(2025, 6, 2), day1)]
+
+
+def test_surface_axes_sorted_and_dense():
+    surface = build_iv_surface(_snapshots())
+    assert len(surface) == 2
+    assert list(surface.dates.astype(str)) == ["2025-06-02", "2025-06-03"]
+    assert list(surface.strikes) == [95.0, 100.0, 105.0, 110.0]
+    assert surface.iv.shape == (2, 2, 4)
+    # Zero puts IV is treated as unquoted, calls IV survives
+    assert math.isclose(surface.iv[0, 0, 2], 0.18)
+    assert math.isnan(surface.iv[0, 1, 0])
+    print("[PASS] IV surface axes and dense cube")
+
+
+def test_atm_iv_per_date():
+    surface = build_iv_surface(_snapshots(), spots={"2025-06-03": 105.0})
+    # Spot inferred from call delta closest to 0.5
+    assert math.isclose(surface.atm_iv("2025-06-02"), 0.20)
+    # Spot supplied: interpolated halfway between 100 and 110 strikes
+    assert math.isclose(surface.atm_iv(datetime(2025, 6, 3)), 0.28)
+    # Dates after the last snapshot read as-of the latest one
+    assert math.isclose(surface.atm_iv("2025-06-10"), 0.28)
+    series = surface.atm_series(pd.to_datetime(["2025-06-02", "2025-06-04"]))
+    assert list(series.round(4)) == [0.20, 0.28]
+    print("[PASS] ATM IV per date")
+
+
+def test_term_structure_and_strike_interpolation():
+    surface = build_iv_surface(_snapshots(), spots={"2025-06-03": 105.0})
+    expiries, ivs = surface.term_structure("2025-06-03")
+    assert len(expiries) == 2
+    assert math.isclose(ivs[1], 0.30)
+    # Between quoted strikes: linear; beyond the smile: nearest quote
+    assert math.isclose(surface.iv_at("2025-06-02", "2025-06-20", 97.5), 0.215)
+    assert math.isclose(surface.iv_at("2025-06-02", "2025-06-20", 120.0), 0.18)
+    assert math.isnan(surface.iv_at("2025-06-02", "2025-12-19", 100.0))
+    print("[PASS] Term structure and strike interpolation")
+
+
+def test_no_lookahead_before_first_snapshot():
+    surface = build_iv_surface(_snapshots(), spots={"2025-06-03": 105.0})
+    assert math.isnan(surface.atm_iv("2025-06-01"))
+    assert math.isnan(surface.iv_at("2025-06-01", "2025-06-20", 100.0))
+    expiries, ivs = surface.term_structure("2025-06-01")
+    assert len(expiries) == 0 and len(ivs) == 0
+    series = surface.atm_series(pd.to_datetime(["2025-05-30", "2025-06-02"]))
+    assert math.isnan(series[0]) and math.isclose(series[1], 0.20)
+    print("[PASS] No IV before the first snapshot")
+
+
+def test_intraday_anchor_before_first_snapshot():
+    surface = build_iv_surface(_snapshots(), spots={"2025-06-03": 105.0})
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        assert math.isclose(surface.anchor_iv("2025-06-02"), 0.20)
+        assert caught == []
+        # Before the first snapshot: latest quoted ATM IV, with a warning
+        anchor = surface.anchor_iv("2025-05-30")
+        assert math.isclose(anchor, 0.28) and len(caught) == 1
+        assert all(math.isfinite(iv) for iv in estimate_intraday_iv(anchor, rng=3))
+        # Nothing quoted at all: the documented default
+        assert build_iv_surface([]).anchor_iv("2025-05-30") == DEFAULT_ATM_IV
+        assert len(caught) == 2
+    print("[PASS] Intraday anchor IV falls back before the first snapshot")
+
+
+def test_daily_window_before_first_snapshot():
+    surface = build_iv_surface(_snapshots(), spots={"2025-06-03": 105.0})
+    dates = pd.to_datetime(
+        ["2025-05-29", "2025-05-30", "2025-06-02", "2025-06-03", "2025-06-04"]
+    )
+    close = pd.Series([100.0, 110.0, 120.0, 130.0, 140.0])
+    # Bodies only: no candle-shape stalls or turbulence
+    candles = pd.DataFrame(
+        {"Open": close - 5, "High": close, "Low": close - 5, "Close/Last": close}
+    )
+    iv = pd.Series(surface.atm_series(dates))
+    assert int(iv.isna().sum()) == 2
+    # Unquoted dates mask the IV delta; only the quoted 0.20 -> 0.28 jump fires
+    assert detect_iv_turbulence(iv, candles) == [
+        "Calm",
+        "Calm",
+        "Calm",
+        "Heavy",
+        "Calm",
+    ]
+    assert detect_stalls(close, candles, iv) == [True, False, False, True, False]
+    assert estimate_volatility_expansion(iv.diff().iloc[-1], iv.std()) == 0.0
+    head = iv.iloc[:3]  # one quoted date
+    assert estimate_volatility_expansion(head.diff().iloc[-1], head.std()) == 0.0
+    # NaN IV is skipped like None, so it never poisons the rolling IV window
+    masked, skipped = SynchronizationTracker(), SynchronizationTracker()
+    for price, value in zip(close, iv):
+        observed = masked.observe(price, iv=value)
+        assert observed == skipped.observe(price, iv=None if value != value else value)
+        assert math.isfinite(observed["volatility_expansion"])
+    assert masked.last_iv == 0.28
+    print("[PASS] Daily window before the first snapshot masks IV signals")
@@ -0,0 +1,45 @@
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from core.microturbulence import generate_iv_paths, estimate_intraday_iv
+
+
+def test_iv_paths_reproducible_with_seed():
+    a = generate_iv_paths(0.2, steps=390, n_paths=8, rng=42)
+    b = generate_iv_paths(0.2, steps=390, n_paths=8, rng=np.random.default_rng(42))
+    assert a.shape == (8, 390)
+    assert np.array_equal(a, b)
+    assert estimate_intraday_iv(0.2, rng=7) == estimate_intraday_iv(0.2, rng=7)
+    print("[PASS] Seeded IV paths reproducible")
+
+
+def test_iv_paths_mean_revert_around_anchor():
+    paths = generate_iv_paths(0.25, steps=200, n_paths=2000, rng=1, vol_of_vol=0.03)
+    assert abs(paths[:, -1].mean() - 0.25) < 0.005
+    assert abs(paths[:, -1].std() - 0.03) < 0.005
+    assert paths.min() >= 0.01
+    single = generate_iv_paths(0.25, steps=5, rng=1)
+    assert single.shape == (5,)
+    print(f"[PASS] IV paths mean-revert: end std={paths[:, -1].std():.4f}")
+
+
+def test_unquoted_anchor_rejected():
+    for anchor in (float("nan"), np.inf):
+        try:
+            generate_iv_paths(anchor, steps=5, rng=1)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"anchor {anchor} should be rejected")
+    try:
+        estimate_intraday_iv(pd.DataFrame({"IV": [np.nan]}), rng=1)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("an all-NaN IV column should be rejected")
+    print("[PASS] Non-finite anchor IV rejected")
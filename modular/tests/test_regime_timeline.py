@@ -0,0 +1,78 @@
+import sys
+import os
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from core.synchronization import REGIME_LABELS, compute_synchronization_batch
+from core.regime_timeline import build_regime_timeline, timeline_from_batch
+
+CRUISE = "STABLE_CRUISE"
+CLIMB = "STEP_CLIMB"
+CASCADE = "REFLEXIVE_CASCADE"
+
+
+def test_run_length_encoding_round_trip():
+    regimes = [CRUISE] * 3 + [CLIMB] * 2 + [CASCADE] * 4 + [CRUISE]
+    sc = [0.1, 0.1, 0.2, 0.4, 0.5, 0.7, 0.9, 0.8, 0.7, 0.1]
+    timeline = build_regime_timeline(sc, regimes)
+    assert len(timeline) == 4
+    assert timeline.to_records()[2] == {
+        "series": 0,
+        "start": 5,
+        "end": 9,
+        "regime": CASCADE,
+        "peak_sc": 0.9,
+    }
+    decoded = [REGIME_LABELS[c].value for c in timeline.expand()]
+    assert decoded == regimes
+    assert timeline.regime_at(0, 6) == CASCADE
+    assert len(timeline.query(CASCADE, min_bars=4)) == 1
+    assert len(timeline.query(CASCADE, min_bars=5)) == 0
+    print("[PASS] Run-length encoding round trip")
+
+
+def test_hysteresis_and_min_dwell_suppress_flicker():
+    # S_c hovers around 0.30: the climb bars barely clear the threshold
+    sc = [0.25, 0.31, 0.28, 0.32, 0.27, 0.29, 0.45, 0.5, 0.5]
+    regimes = [CRUISE, CLIMB, CRUISE, CLIMB, CRUISE, CRUISE, CLIMB, CLIMB, CLIMB]
+    raw = build_regime_timeline(sc, regimes)
+    assert len(raw) == 6
+    smooth = build_regime_timeline(sc, regimes, hysteresis=0.05)
+    assert [r["regime"] for r in smooth.to_records()] == [CRUISE, CLIMB]
+    assert smooth.start[1] == 6
+    dwell = build_regime_timeline(sc, regimes, min_dwell=2)
+    assert [(r["start"], r["regime"]) for r in dwell.to_records()] == [
+        (0, CRUISE),
+        (6, CLIMB),
+    ]
+    print("[PASS] Hysteresis and minimum dwell")
+
+
+def test_fleet_timeline_vectorized():
+    rng = np.random.default_rng(3)
+    n_series, n_bars = 50, 2520
+    sc = np.clip(np.cumsum(rng.normal(0, 0.03, (n_series, n_bars)), axis=1) % 1.0, 0, 1)
+    batch = compute_synchronization_batch(
+        price_displacement=sc.ravel() * 6, volume_spike_ratio=3.0
+    )
+    codes = batch.regime_code.reshape(n_series, n_bars)
+    scs = batch.synchronization_coefficient.reshape(n_series, n_bars)
+    start = time.perf_counter()
+    timeline = build_regime_timeline(scs, codes, min_dwell=3, hysteresis=0.02)
+    elapsed = time.perf_counter() - start
+    assert set(timeline.series.tolist()) == set(range(n_series))
+    assert (timeline.end > timeline.start).all()
+    assert timeline.length.sum() == n_series * n_bars
+    # Episodes never span two series
+    for s in (0, n_series - 1):
+        assert len(timeline.expand(s)) == n_bars
+    assert sum(timeline.bars_by_regime().values()) == n_series * n_bars
+    single = timeline_from_batch(batch)
+    assert single.length.sum() == n_series * n_bars
+    print(
+        f"[PASS] Fleet timeline: {len(timeline)} episodes, "
+        f"{timeline.nbytes / 1024:.0f} KiB, {elapsed * 1000:.1f} ms"
+    )
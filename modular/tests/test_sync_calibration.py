@@ -0,0 +1,96 @@
+import sys
+import os
+import random
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from core.synchronization import (
+    compute_synchronization,
+    compute_synchronization_batch,
+    sync_factor_matrix,
+    SyncProfile,
+    DEFAULT_PROFILE,
+)
+from core.sync_calibration import (
+    calibrate_profile,
+    episode_labels,
+    forward_move_target,
+)
+
+
+def _inputs(n, seed=5):
+    rng = np.random.default_rng(seed)
+    return {
+        "price_displacement": rng.normal(0, 2, n),
+        "cvd_acceleration": rng.normal(0, 1.5, n),
+        "volume_spike_ratio": rng.lognormal(0, 0.6, n),
+        "spread_widening_ratio": rng.uniform(0, 0.2, n),
+        "volatility_expansion": rng.exponential(1.0, n),
+        "event_proximity_minutes": rng.uniform(0, 200, n),
+        "prior_cruise_deviation": rng.exponential(0.5, n),
+    }
+
+
+def test_profile_parameterizes_both_kernels():
+    assert compute_synchronization(1.0) == compute_synchronization(
+        1.0, profile=SyncProfile()
+    )
+    price_only = DEFAULT_PROFILE.with_weights([1, 0, 0, 0, 0, 0, 0])
+    assert price_only.price_weight == 1.0 and price_only.cvd_weight == 0.0
+    r = compute_synchronization(price_displacement=1.5, profile=price_only)
+    assert r.synchronization_coefficient == 0.5
+    inputs = _inputs(500)
+    rng = random.Random(1)
+    profile = SyncProfile(price_scale=1.5, event_window_minutes=30.0, cvd_weight=0.3)
+    batch = compute_synchronization_batch(**inputs, profile=profile)
+    for i in rng.sample(range(500), 50):
+        row = {k: float(v[i]) for k, v in inputs.items()}
+        assert batch.result(i) == compute_synchronization(**row, profile=profile)
+    factors = sync_factor_matrix(**inputs, profile=profile)
+    assert np.allclose(
+        np.clip(factors @ profile.weights, 0, 1), batch.synchronization_coefficient
+    )
+    assert SyncProfile.from_dict(profile.to_dict()) == profile
+    print("[PASS] SyncProfile drives scalar and batch kernels")
+
+
+def test_calibration_recovers_planted_weights():
+    inputs = _inputs(4000)
+    planted = SyncProfile().with_weights([0.05, 0.6, 0.05, 0.05, 0.05, 0.1, 0.1])
+    target = compute_synchronization_batch(
+        **inputs, profile=planted
+    ).synchronization_coefficient
+    result = calibrate_profile(inputs, target, n_candidates=3000, rounds=4)
+    assert result.loss < result.baseline_loss * 0.1
+    assert abs(result.profile.cvd_weight - 0.6) < 0.1
+    assert result.evaluations >= 12000 * 4000
+    print(
+        f"[PASS] Calibration loss {result.baseline_loss:.4f} -> {result.loss:.6f} "
+        f"({result.evaluations / 1e6:.0f}M profile x step evaluations)"
+    )
+
+
+def test_calibration_targets_and_scale_grid():
+    labels = episode_labels(10, [(2, 4), (3, 6), (8, 10)])
+    assert labels.tolist() == [0, 0, 1, 1, 1, 1, 0, 0, 1, 1]
+    move = forward_move_target([100, 110, 99, 99], horizon=1)
+    assert np.allclose(move[:3], [0.1, 0.1, 0.0]) and np.isnan(move[3])
+
+    inputs = _inputs(2000, seed=9)
+    target = (np.abs(inputs["price_displacement"]) > 3).astype(float)
+    target[:10] = np.nan
+    result = calibrate_profile(
+        inputs,
+        target,
+        objective="correlation",
+        scale_grid={"price_scale": [1.0, 3.0], "cvd_scale": [2.0, 4.0]},
+        n_candidates=512,
+        rounds=2,
+        workers=2,
+    )
+    assert result.loss < result.baseline_loss
+    assert result.profile.price_scale in (1.0, 3.0)
+    assert abs(sum(result.profile.weights) - 1.0) < 1e-9
+    print(f"[PASS] Scale grid calibration: corr {-result.loss:.3f}")
@@ -0,0 +1,137 @@
+import sys
+import os
+import random
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from core.synchronization import (
+    compute_synchronization,
+    estimate_price_displacement,
+    estimate_volume_spike_ratio,
+    estimate_volatility_expansion,
+    REGIME_LABELS,
+    RegimeLabel,
+)
+from core.sync_tracker import SynchronizationTracker, TrackerBank
+
+
+def test_tracker_matches_history_estimators():
+    rng = random.Random(7)
+    prices, volumes, ivs = [], [], []
+    tracker = SynchronizationTracker(window=None)
+    for _ in range(60):
+        prices.append(100 + rng.uniform(-3, 3))
+        volumes.append(rng.uniform(1e5, 5e5))
+        ivs.append(rng.uniform(0.15, 0.35))
+        inputs = tracker.observe(prices[-1], volume=volumes[-1], iv=ivs[-1])
+        iv = pd.Series(ivs)
+        expected_exp = estimate_volatility_expansion(
+            iv.diff().iloc[-1] if len(iv) > 1 else 0, iv.std() if len(iv) > 1 else 0
+        )
+        assert inputs["price_displacement"] == estimate_price_displacement(prices)
+        assert (
+            abs(inputs["volume_spike_ratio"] - estimate_volume_spike_ratio(volumes))
+            < 1e-9
+        )
+        assert abs(inputs["volatility_expansion"] - expected_exp) < 1e-9
+    print("[PASS] Tracker matches the full-history estimators")
+
+
+def test_tracker_window_is_bounded():
+    tracker = SynchronizationTracker(window=3)
+    for v in (1000.0, 1000.0, 1000.0, 10.0, 10.0, 10.0, 10.0):
+        inputs = tracker.observe(100.0, volume=v)
+    # The ratio is taken against the previous three bars, all 10 by now
+    assert inputs["volume_spike_ratio"] == 1.0
+    assert len(tracker._volumes) == 3
+    print("[PASS] Rolling window drops old bars")
+
+
+def test_tracker_post_release_and_cruise_deviation():
+    tracker = SynchronizationTracker()
+    first = tracker.update(100.0)
+    assert first.regime_label == RegimeLabel.STABLE_CRUISE.value
+    cascade = tracker.update(
+        104.0, volume=1.0, iv=0.2, cvd_acceleration=3.0, spread=0.0
+    )
+    cascade = tracker.update(
+        108.0, volume=8.0, iv=0.9, cvd_acceleration=3.0, spread=1.0
+    )
+    assert cascade.synchronization_coefficient >= 0.65
+    released = tracker.update(108.0, volume=1.0, iv=0.9)
+    assert released.regime_label in (
+        RegimeLabel.FLIGHT_LEVEL_STABILIZATION.value,
+        RegimeLabel.FAILED_RESTORATION.value,
+    )
+    # Cruise level is still the last STABLE_CRUISE bar (100), not the new price
+    inputs = tracker.observe(108.0)
+    assert inputs["prior_cruise_deviation"] == 8.0
+    print(f"[PASS] Post-release after {cascade.regime_label}: {released.regime_label}")
+
+
+def test_tracker_tick_is_idempotent():
+    tracker = SynchronizationTracker()
+    tracker.update(100.0, tick=0)
+    a = tracker.update(103.0, tick=1, volume=5.0)
+    b = tracker.update(110.0, tick=1, volume=9.0)
+    assert a is b and tracker.bars == 2
+    assert a == compute_synchronization(
+        price_displacement=3.0, prior_cruise_deviation=3.0
+    )
+    print("[PASS] Same tick returns the stored result")
+
+
+def test_bank_matches_one_tracker_per_row():
+    rng = np.random.default_rng(3)
+    for window in (3, None):
+        bank = TrackerBank(window=window)
+        bank.resize(6)
+        trackers = [SynchronizationTracker(window=window) for _ in range(6)]
+        for tick in range(40):
+            # A changing subset of rows each bar, with bursts that trigger
+            # pressure regimes and post-release bars
+            rows = np.flatnonzero(rng.random(6) < 0.8)
+            price = 100 + rng.normal(0, 4, len(rows))
+            volume = rng.choice([1.0, 1.0, 9.0], len(rows))
+            spread = rng.random(len(rows))
+            iv = rng.choice([0.2, 0.9, np.nan], len(rows))  # NaN: unquoted
+            inputs = bank.observe(rows, price, volume, spread, iv)
+            expected = [
+                trackers[r].observe(p, volume=v, spread=s, iv=i)
+                for r, p, v, s, i in zip(rows, price, volume, spread, iv)
+            ]
+            for key, values in inputs.items():
+                assert values.tolist() == [e[key] for e in expected]
+            results = [compute_synchronization(**e) for e in expected]
+            release = bank.is_release(
+                rows, [r.synchronization_coefficient for r in results]
+            )
+            for k, r in enumerate(rows):
+                assert release[k] == trackers[r].is_release(
+                    results[k].synchronization_coefficient
+                )
+                if release[k]:
+                    results[k] = compute_synchronization(
+                        **expected[k], force_post_release=True
+                    )
+                trackers[r].commit(results[k], tick)
+            codes = np.array(
+                [REGIME_LABELS.index(RegimeLabel(r.regime_label)) for r in results]
+            )
+            bank.commit(rows, codes, results, tick)
+            if tick == 20:  # row 5 moves into row 1, row 5 starts fresh
+                bank.move(5, 1)
+                bank.clear(5)
+                trackers[1], trackers[5] = trackers[5], SynchronizationTracker(
+                    window=window
+                )
+        for r, tracker in enumerate(trackers):
+            assert bank.bars[r] == tracker.bars
+            assert bank.release_left[r] == tracker._release_left
+            assert bank.cruise_level[r] == tracker.cruise_level
+            assert bank.volumes.window(r).tolist() == list(tracker._volumes.values)
+            assert bank.last_result[r] is tracker.last_result
+    print("[PASS] Tracker bank rows match scalar trackers bit for bit")
@@ -1,5 +1,6 @@
 import sys
 import os
+import random
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
@@ -11,8 +12,20 @@ from core.synchronization import (
     estimate_price_displacement,
     estimate_volume_spike_ratio,
     estimate_volatility_expansion,
+    compute_synchronization_batch,
+    SyncDiagnostic,
+    render_diagnostics,
+    SynchronizationBatch,
+    SyncCache,
+    SyncProfile,
+)
+from core.crow_simulator import (
+    compute_flock_state,
+    CrowFlockState,
+    FlockExecutionType,
+    FlockDiagnostic,
+    compute_flock_state_batch,
 )
-from core.crow_simulator import compute_flock_state, CrowFlockState, FlockExecutionType
 
 
 def test_type_i_distributed_execution():
@@ -394,6 +407,150 @@ def test_synchronization_result_defaults():
     print(f"[PASS] Defaults validated")
 
 
+def _random_sync_inputs(rng: random.Random) -> dict:
+    # Mix continuous draws with values sitting exactly on the regime thresholds
+    def pick(lo, hi, edges):
+        return rng.choice(edges) if rng.random() < 0.2 else rng.uniform(lo, hi)
+
+    return {
+        "price_displacement": pick(-5.0, 5.0, [0.0, 0.3, -0.3, 3.0]),
+        "cvd_acceleration": pick(-4.0, 4.0, [0.0, 1.0, 2.0]),
+        "volume_spike_ratio": pick(0.0, 10.0, [1.0, 3.0]),
+        "spread_widening_ratio": pick(0.0, 2.0, [0.0, 0.01]),
+        "volatility_expansion": pick(0.0, 4.0, [0.0, 1.0, 2.0]),
+        "event_proximity_minutes": pick(0.0, 120.0, [60.0, float("inf")]),
+        "prior_cruise_deviation": pick(0.0, 4.0, [0.3, 2.0]),
+        "cvd_trend_strong": rng.random() < 0.5,
+        "price_bounded_while_cvd_trends": rng.random() < 0.2,
+        "event_type": rng.choice(["unknown", "macro", "earnings"]),
+        "force_post_release": rng.random() < 0.1,
+    }
+
+
+def test_batch_matches_scalar_property():
+    rng = random.Random(20260617)
+    rows = [_random_sync_inputs(rng) for _ in range(5000)]
+    columns = {k: [r[k] for r in rows] for k in rows[0]}
+    batch = compute_synchronization_batch(**columns)
+    assert len(batch) == len(rows)
+    for i, row in enumerate(rows):
+        expected = compute_synchronization(**row)
+        got = batch.result(i)
+        assert got == expected, f"Row {i} diverged for inputs {row}"
+    print(f"[PASS] Batch kernel matches scalar on {len(rows)} random rows")
+
+
+def test_batch_broadcasts_scalars_and_event_codes():
+    batch = compute_synchronization_batch(
+        price_displacement=[0.1, 2.5, 4.0],
+        volume_spike_ratio=4.0,
+        event_proximity_minutes=[5.0, 5.0, 500.0],
+        event_type=[0, 2, 1],
+    )
+    assert len(batch) == 3
+    assert list(batch.event_authorized) == [False, True, False]
+    single = compute_synchronization_batch(price_displacement=1.0)
+    assert single.to_dicts() == [compute_synchronization(1.0).to_dict()]
+    print("[PASS] Batch broadcasting and event codes")
+
+
+def test_diagnostic_flags_render_lazily():
+    result = compute_synchronization(
+        price_displacement=0.1,
+        cvd_acceleration=1.5,
+        volume_spike_ratio=1.0,
+    )
+    assert result.diagnostic_flags & SyncDiagnostic.PRICE_LAGGED_CVD
+    assert result.diagnostics == render_diagnostics(result.diagnostic_flags)
+    compact = result.to_dict(compact=True)
+    assert "diagnostics" not in compact
+    assert compact["diagnostic_flags"] == result.diagnostic_flags
+    assert render_diagnostics(compact["diagnostic_flags"]) == result.to_dict()[
+        "diagnostics"
+    ]
+    flock = compute_flock_state(result)
+    assert flock.diagnostic_flags & FlockDiagnostic.SCATTERED
+    assert flock.to_dict(compact=True)["diagnostic_flags"] == flock.diagnostic_flags
+    assert any("scattered foraging" in n for n in flock.diagnostics)
+    print(f"[PASS] Diagnostic flags: {result.diagnostic_flags:#010b}")
+
+
+def test_compact_records_and_fast_serialization():
+    result = compute_synchronization(price_displacement=2.5, volume_spike_ratio=4.0)
+    assert result.to_record() is result
+    assert not hasattr(result, "__dict__")
+    assert SynchronizationResult(*result) == result
+    assert len({result, SynchronizationResult(*result)}) == 1
+    # Results built the old way, from rendered diagnostics
+    values = result._asdict()
+    del values["diagnostic_flags"]
+    rebuilt = SynchronizationResult.from_diagnostics(result.diagnostics, **values)
+    assert rebuilt == result and rebuilt.diagnostics == result.diagnostics
+    assert SynchronizationResult(diagnostics=result.diagnostics, **values) == result
+    # Dict-style reads of the former to_dict() view still work
+    assert result["regime_label"] == result.regime_label
+    assert result["diagnostics"] == result.diagnostics
+    assert result.get("valve_saturation_score") == round(
+        result.valve_saturation_score, 4
+    )
+    assert result.get("missing", "-") == "-" and result[0] == tuple(result)[0]
+    try:
+        SynchronizationResult.from_diagnostics(["not a diagnostic"])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("unknown diagnostic text accepted")
+    fast = result.to_dict(fast=True)
+    assert fast.keys() == result.to_dict().keys()
+    assert fast["synchronization_coefficient"] == result.synchronization_coefficient
+    assert result.to_dict(compact=True, fast=True)["diagnostic_flags"] == (
+        result.diagnostic_flags
+    )
+    flock = compute_flock_state(result)
+    assert flock.to_record() is flock
+    assert flock.to_dict(fast=True).keys() == flock.to_dict().keys()
+
+    rows = [compute_synchronization(price_displacement=p) for p in (0.1, 1.0, 4.0)]
+    batch = SynchronizationBatch.from_results(rows)
+    assert list(batch) == rows
+    assert len(SynchronizationBatch.from_results([])) == 0
+    print("[PASS] Compact records and fast serialization")
+
+
+def test_sync_cache_quantizes_and_bounds():
+    cache = SyncCache(maxsize=3, precision=2)
+    a = cache(price_displacement=1.001, volume_spike_ratio=2.0)
+    b = cache(1.004, volume_spike_ratio=2.0)
+    assert a is b
+    assert a == compute_synchronization(price_displacement=1.0, volume_spike_ratio=2.0)
+    assert cache.info().hits == 1 and cache.info().misses == 1
+    assert cache() is cache(-0.0, volatility_expansion=float("nan"))
+    other = cache(1.0, volume_spike_ratio=2.0, profile=SyncProfile(price_scale=1.0))
+    assert other is not a
+    for p in (3.0, 4.0, 5.0):
+        cache(p)
+    info = cache.info()
+    assert info.currsize == 3 and info.evictions == 3
+    assert 0.0 < info.hit_rate < 1.0
+    cache.clear()
+    assert cache.info() == (0, 0, 0, 3, 0)
+    print(f"[PASS] SyncCache hit rate {info.hit_rate:.2f}, size {info.currsize}")
+
+
+def test_flock_batch_matches_scalar():
+    rng = random.Random(4242)
+    rows = [_random_sync_inputs(rng) for _ in range(3000)]
+    columns = {k: [r[k] for r in rows] for k in rows[0]}
+    sync = compute_synchronization_batch(**columns)
+    flock = compute_flock_state_batch(sync)
+    assert len(flock) == len(rows)
+    for i, row in enumerate(rows):
+        expected = compute_flock_state(compute_synchronization(**row))
+        assert flock.result(i) == expected, f"Row {i} diverged for inputs {row}"
+    assert flock.to_dicts(compact=True)[0] == flock.result(0).to_dict(compact=True)
+    print(f"[PASS] Flock batch matches scalar on {len(rows)} rows")
+
+
 if __name__ == "__main__":
     tests = [
         ("Type I — Distributed Execution", test_type_i_distributed_execution),
@@ -414,6 +571,12 @@ if __name__ == "__main__":
         ("Diagnostics Notes", test_diagnostics_notes),
         ("DOM Confidence", test_observed_dom_confidence),
         ("Default Values", test_synchronization_result_defaults),
+        ("Batch Matches Scalar", test_batch_matches_scalar_property),
+        ("Batch Broadcasting", test_batch_broadcasts_scalars_and_event_codes),
+        ("Diagnostic Flags", test_diagnostic_flags_render_lazily),
+        ("Compact Records", test_compact_records_and_fast_serialization),
+        ("Sync Cache", test_sync_cache_quantizes_and_bounds),
+        ("Flock Batch", test_flock_batch_matches_scalar),
     ]
     passed = 0
     failed = 0
@@ -0,0 +1,58 @@
+import sys
+import os
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from core.telemetry_ring import TelemetryRing
+from core.flight_ops_core import FlightOpsCore
+
+
+def test_ring_wraps_with_zero_copy_windows():
+    ring = TelemetryRing(depth=4, capacity=3)
+    for tick in range(10):
+        n = 2 if tick < 7 else 3  # slot 2 joins at tick 7
+        ring.append(tick, n, {"price": np.arange(n) + 100.0 * tick, "flags": 1})
+    # Ticks 8 and 9 sit in rows 0 and 1: a view; tick 6 onwards wraps
+    assert np.shares_memory(ring.window(0, 2), ring.data)
+    assert ring.window(0)["price"].tolist() == [600.0, 700.0, 800.0, 900.0]
+    assert ring.ticks(0).tolist() == [6, 7, 8, 9]
+    assert ring.ticks(1, 2).tolist() == [8, 9]
+    assert ring.window(1, 2)["price"].tolist() == [801.0, 901.0]
+    assert ring.window(2)["price"].tolist() == [702.0, 802.0, 902.0]
+    assert ring.latest()["price"][:3].tolist() == [900.0, 901.0, 902.0]
+    ring.resize(8)
+    assert ring.window(2)["price"].tolist() == [702.0, 802.0, 902.0]
+    assert ring.count[3:].tolist() == [0] * 5 and len(ring.window(5)) == 0
+    print("[PASS] Ring keeps the last depth snapshots per slot")
+
+
+def test_core_telemetry_depth():
+    ops = FlightOpsCore({"telemetry_depth": 25})
+    ops.load_market_flights(["SPY"])
+    ops.load_aircraft([{"id": "AC001", "origin": "KSEA", "dest": "KPDX"}])
+    for _ in range(30):
+        ops.update()
+    mkt, ac = ops.flight_objects
+    history = ac.telemetry
+    assert len(history) == 25 and [s["tick"] for s in history] == list(range(5, 30))
+    assert history[-1]["altitude"] == ac.altitude and history[-1]["phase"] == "Cruise"
+    assert history[-1]["status_flags"] == {"stall": False, "turbulence": False}
+    assert 0.5 <= mkt.telemetry[-1]["volume_ratio"] <= 3.0
+    assert ac.telemetry[-1]["volume_ratio"] == 1.0
+    print(f"[PASS] Telemetry depth 25 keeps ticks {history[0]['tick']}..29")
+
+
+def test_deep_ring_sized_by_flights():
+    depth = 100_000
+    ops = FlightOpsCore({"telemetry_depth": depth})
+    ops.load_market_flights(["SPY", "QQQ"])
+    for _ in range(3):
+        ops.update()
+    ring = ops.store.telemetry
+    # depth rows for the flights present, not for the 1024-slot reservation
+    assert ops.store.capacity == 1024 and ring.capacity == 2
+    assert ring.data.nbytes == depth * 2 * ring.data.itemsize
+    assert [s["tick"] for s in ops.flight_objects[1].telemetry] == [0, 1, 2]
+    print(f"[PASS] Depth {depth} ring holds {ring.nbytes / 1e6:.0f} MB")
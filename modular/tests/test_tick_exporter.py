@@ -0,0 +1,132 @@
+import sys
+import os
+import tempfile
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from core.flight_ops_core import FlightOpsCore
+from core.tick_exporter import TickExporter, TickReader
+
+AIRPORTS = {"KSEA": {"x": 0.0, "y": 0.0}, "KPDX": {"x": -30.0, "y": -120.0}}
+FIELDS = ("mode", "phase", "price", "altitude", "velocity", "stall", "x", "conflict")
+
+
+def _scenario():
+    ops = FlightOpsCore({"seed": 5, "airports": AIRPORTS, "telemetry_depth": 4})
+    ops.load_market_flights([f"S{i}" for i in range(8)])
+    ops.load_aircraft(
+        [
+            {"id": f"AC{i}", "origin": o, "dest": d}
+            for i, (o, d) in enumerate([("KSEA", "KPDX"), ("KPDX", "KSEA")] * 3)
+        ]
+    )
+    ops.load_airtraffic("PNW")
+    return ops
+
+
+def _expected(record):
+    x = record["position"]["x"] if record["position"] else None
+    return {
+        "mode": record["mode"],
+        "phase": record["phase"],
+        "price": record["price"],
+        "altitude": record["altitude"],
+        "velocity": record["velocity"],
+        "stall": record["status_flags"]["stall"],
+        "x": x,
+        "conflict": record["conflict"],
+    }
+
+
+def _run(fmt, path, ticks=12):
+    """Runs the scenario with an exporter, returning each tick's records."""
+    ops = _scenario()
+    exporter = TickExporter(path, fmt=fmt, fields=FIELDS, flush_interval=0.01)
+    ops.exporters.append(exporter)
+    history = []
+    for tick in range(ticks):
+        if tick == 6:
+            ops.remove_flight("MKT_S2")
+        ops.update()
+        history.append({r["id"]: _expected(r) for r in ops.records()})
+    exporter.close()
+    return history, exporter
+
+
+def test_ndjson_changes_rebuild_every_tick():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "ticks.ndjson")
+        history, exporter = _run("ndjson", path)
+        reader = TickReader(path)
+        rows = reader.poll()
+        assert reader.poll() == []  # nothing new
+    assert exporter.written == len(rows)
+    ticks = sorted({row["tick"] for row in rows})
+    assert ticks == list(range(len(history)))  # prices move every tick
+    state = {}
+    for tick, expected in enumerate(history):
+        batch = [row for row in rows if row["tick"] == tick]
+        if tick in (0, 6):  # first tick and roster change: every flight
+            assert sorted(r["id"] for r in batch) == sorted(expected)
+            state = {}
+        for row in batch:
+            state[row["id"]] = {name: row[name] for name in FIELDS}
+        assert state == expected
+    # Every tick of a flight is on disk, past the 4-deep telemetry ring
+    assert len({row["tick"] for row in rows if row["id"] == "MKT_S0"}) == 12
+    print("[PASS] NDJSON change rows rebuild every tick's flight state")
+
+
+def test_columnar_incremental_reads():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "ticks.npy")
+        history, _ = _run("columnar", path, ticks=5)
+        with open(path, "rb") as f:
+            data = f.read()
+        reader = TickReader(path)
+        rows = reader.poll()
+        # A batch cut mid-write waits for the next poll
+        partial = os.path.join(tmp, "partial.npy")
+        with open(partial, "wb") as f:
+            f.write(data[: len(data) - 10])
+        following = TickReader(partial)
+        head = following.poll()
+        with open(partial, "ab") as f:
+            f.write(data[len(data) - 10 :])
+        tail = following.poll()
+    assert head + tail == rows
+    assert {row["tick"] for row in tail} == {4}
+    assert set(rows[0]) == {"tick", "id"} | set(FIELDS)
+    state = {}
+    for tick, expected in enumerate(history):
+        for row in rows:
+            if row["tick"] == tick:
+                state[row["id"]] = {name: row[name] for name in FIELDS}
+        assert state == expected
+    assert np.all([isinstance(row["stall"], bool) for row in rows])
+    print("[PASS] Columnar batches read back incrementally")
+
+
+def test_writer_failure_raised_on_close():
+    with tempfile.TemporaryDirectory() as tmp:
+        ops = _scenario()
+        exporter = TickExporter(os.path.join(tmp, "ticks.ndjson"), fields=FIELDS)
+        ops.exporters.append(exporter)
+        exporter._file.close()  # the final batch cannot be written
+        ops.update()
+        try:
+            exporter.close()
+        except RuntimeError as e:
+            assert isinstance(e.__cause__, ValueError)
+        else:
+            raise AssertionError("close after a writer failure should raise")
+        assert exporter.written == 0 and exporter._file.closed
+        try:
+            ops.update()  # write() raises it as well
+        except RuntimeError as e:
+            assert e.__cause__ is exporter.error
+        else:
+            raise AssertionError("write after a writer failure should raise")
+    print("[PASS] Tick export failures surface from close() and write()")
@@ -0,0 +1,112 @@
+import sys
+import os
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from core.flight_ops_core import FlightOpsCore, FlightState
+from core.flight_store import Flag, FlightStore
+from core.triggers import (
+    Above,
+    FlagSet,
+    LinkTable,
+    PhaseIs,
+    SetFlag,
+    SetPhase,
+    TriggerEngine,
+    TriggerRule,
+    position_links,
+)
+
+
+def test_explicit_links_and_event_log():
+    ops = FlightOpsCore({"position_links": False})
+    ops.load_aircraft(
+        [{"id": f"AC{i}", "origin": "KSEA", "dest": "KPDX"} for i in range(2)]
+    )
+    ops.load_airtraffic("PNW")
+    ops.load_airtraffic("SEA")
+    ops.link("aircraft_traffic", "AC1", "TRF_SEA_1")
+    ops.store.holding_ticks[ops.store.slot_of("AC1")] = 3
+    ops.update()
+    assert ops.get_flight("TRF_SEA_1").cleared_to_land
+    assert not ops.get_flight("TRF_PNW_1").cleared_to_land
+    (event,) = ops.triggers.log
+    assert event.tick == 0 and event.rule == "holding_cleared_to_land"
+    assert event.message == (
+        "Aircraft AC1 held >2 ticks. Traffic TRF_SEA_1 set to ClearedToLand."
+    )
+    ops.update()
+    assert len(ops.triggers.log) == 1  # already cleared, nothing new fires
+    print(f"[PASS] Explicit link fired once: {event.message}")
+
+
+def test_rule_dsl_and_link_maintenance():
+    store = FlightStore()
+    for i in range(4):
+        store.add(FlightState(id=f"M{i}", mode="market", price=95.0 + 5 * i))
+    for i in range(2):
+        store.add(FlightState(id=f"A{i}", mode="aircraft"))
+    engine = TriggerEngine(rules=[])
+    engine.register(
+        TriggerRule(
+            "cheap_and_calm",
+            link="m_a",
+            when=~Above("price", 100.0) & ~FlagSet(Flag.TURBULENCE),
+            then=SetPhase("Holding", counter="holding_ticks"),
+        )
+    )
+    engine.links.add(
+        "m_a", *position_links(store.slots("market"), store.slots("aircraft"))
+    )
+    events = engine.evaluate(store, tick=7)
+    # M0 (95) -> A0 and M1 (100) -> A1 fire; M2, M3 also link to A1 but are too dear
+    assert [(e.source, e.target) for e in events] == [("M0", "A0"), ("M1", "A1")]
+    assert store.view(5).phase == "Holding" and store.view(5).holding_ticks == 1
+    assert PhaseIs("Holding")(store, np.array([4, 5])).all()
+
+    links = LinkTable()
+    links.add("k", [0, 1, 5], [5, 4, 2])
+    links.add("k", [3], [2], auto=True)
+    links.on_remove(slot=1, moved_from=5)  # slot 1 removed, slot 5 moved into it
+    assert list(zip(*links.pairs("k"))) == [(0, 1), (1, 2), (3, 2)]
+    links.clear("k", auto=True)
+    assert len(links) == 2
+    copy = LinkTable()
+    copy.load_state(links.export_state())
+    assert list(zip(*copy.pairs("k"))) == [(0, 1), (1, 2)]
+    copy.on_remove(slot=0, moved_from=1)  # edits the copy's arrays in place
+    assert list(zip(*copy.pairs("k"))) == [(0, 2)]
+    assert list(zip(*links.pairs("k"))) == [(0, 1), (1, 2)]
+    print("[PASS] Rule DSL and link table maintenance")
+
+
+def test_set_flag_fires_only_on_change():
+    store = FlightStore()
+    for i in range(3):
+        store.add(FlightState(id=f"M{i}", mode="market"))
+    for i in range(2):
+        store.add(FlightState(id=f"A{i}", mode="aircraft"))
+    engine = TriggerEngine(rules=[])
+    engine.register(
+        TriggerRule(
+            "stall_spreads",
+            link="m_a",
+            when=FlagSet(Flag.STALL),
+            then=SetFlag(Flag.TURBULENCE),
+            message="{source} stalled, {target} in turbulence",
+        )
+    )
+    engine.links.add("m_a", [0, 1, 2], [3, 3, 4])
+    store.flags[[0, 1]] |= Flag.STALL
+    events = engine.evaluate(store, tick=0)
+    # A0 is set once, credited to its first firing link; M2 is not stalled
+    assert [(e.source, e.target) for e in events] == [("M0", "A0")]
+    assert store.view(3).status_flags["turbulence"]
+    assert not store.view(4).status_flags["turbulence"]
+    assert store.flags[3] & Flag.STALL == 0  # other bits untouched
+    assert engine.evaluate(store, tick=1) == []  # already set, nothing pending
+    store.flags[3] = 0
+    assert len(engine.evaluate(store, tick=2)) == 1
+    print("[PASS] SetFlag sets the bit once per change")